@@ -17,13 +17,26 @@ import asyncio
 from datetime import datetime, date, timedelta
 from decimal import Decimal
 from pathlib import Path
-from typing import List, Dict, Any, Optional, AsyncIterator, Callable
+from typing import List, Dict, Any, Optional, AsyncIterator, Callable, IO, Union
 from enum import Enum
 import aiofiles
 
 from src.core.recorder import EventType, EVENTS_BASE_DIR
 
 
+# Raw-line needle used to skip non-signal events before JSON decoding
+_SIGNAL_NEEDLE = f'"{EventType.SIGNAL.value}"'.encode()
+
+# Event type value -> statistics counter key, used by get_statistics
+_STAT_COUNTERS = {
+    EventType.ORDERBOOK_SNAPSHOT.value: "orderbook_snapshots",
+    EventType.SIGNAL.value: "signals",
+    EventType.ORDER_REQUEST.value: "order_requests",
+    EventType.ORDER_RESULT.value: "order_results",
+}
+_ORDERBOOK_SNAPSHOT = EventType.ORDERBOOK_SNAPSHOT.value
+
+
 class ReplayMode(str, Enum):
     """Replay speed modes."""
     REAL_TIME = "real_time"  # Replay at original speed
@@ -68,22 +81,33 @@ class EventReplayer:
         """
         return self.base_dir / f"{event_date.isoformat()}.jsonl"
 
-    async def load_events(self, event_file: Path) -> List[Dict[str, Any]]:
+    async def load_events(
+        self,
+        event_file: Union[Path, bytes, IO[bytes], IO[str]],
+    ) -> List[Dict[str, Any]]:
         """
-        Load all events from a file.
+        Load all events from a file or an in-memory JSONL source.
 
         Args:
-            event_file: Path to event file
+            event_file: Path to event file, raw JSONL bytes, or a readable
+                file-like object (e.g. io.BytesIO)
 
         Returns:
             List of events
         """
-        if not event_file.exists():
-            return []
-
         events = []
-        async with aiofiles.open(event_file, "r") as f:
-            async for line in f:
+
+        if isinstance(event_file, Path):
+            if not event_file.exists():
+                return []
+
+            async with aiofiles.open(event_file, "r") as f:
+                async for line in f:
+                    if line.strip():
+                        events.append(json.loads(line))
+        else:
+            data = event_file if isinstance(event_file, bytes) else event_file.read()
+            for line in data.splitlines():
                 if line.strip():
                     events.append(json.loads(line))
 
@@ -103,7 +127,9 @@ class EventReplayer:
         Args:
             event_date: Date to replay
             event_filter: Optional filter function for events
-            progress_callback: Optional callback for progress updates
+            progress_callback: Optional callback for progress updates,
+                invoked at most ~100 times per replay (every 1% of events
+                and on the final event)
 
         Yields:
             Events in chronological order
@@ -115,9 +141,17 @@ class EventReplayer:
             return
 
         total_events = len(events)
+        progress_step = max(1, total_events // 100)
         last_timestamp: Optional[datetime] = None
 
         for i, event in enumerate(events):
+            # Call progress callback if provided (coalesced to every 1%).
+            # Counted before filtering so the final update always fires.
+            if progress_callback:
+                processed = i + 1
+                if processed % progress_step == 0 or processed == total_events:
+                    await progress_callback(processed, total_events)
+
             # Apply filter if provided
             if event_filter and not event_filter(event):
                 continue
@@ -139,12 +173,40 @@ class EventReplayer:
 
             last_timestamp = event_ts
 
-            # Call progress callback if provided
-            if progress_callback:
-                await progress_callback(i + 1, total_events)
-
             yield event
 
+    async def replay_date_batched(
+        self,
+        event_date: date,
+        *,
+        batch_size: int = 1024,
+        event_filter: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Replay events from a specific date in batches.
+
+        Events are yielded without any pacing, regardless of the replay
+        mode, so this is intended for fast-forward consumers that do not
+        need per-event granularity.
+
+        Args:
+            event_date: Date to replay
+            batch_size: Maximum number of events per batch
+            event_filter: Optional filter function for events
+
+        Yields:
+            Lists of events in chronological order
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        events = await self.load_events(self.get_event_file(event_date))
+        if event_filter:
+            events = [e for e in events if event_filter(e)]
+
+        for i in range(0, len(events), batch_size):
+            yield events[i:i + batch_size]
+
     async def replay_date_range(
         self,
         start_date: date,
@@ -230,12 +292,14 @@ class EventReplayer:
         if not event_file.exists():
             return 0
 
+        type_value = event_type.value if event_type is not None else None
+
         count = 0
         async with aiofiles.open(event_file, "r") as f:
             async for line in f:
                 if line.strip():
                     event = json.loads(line)
-                    if event_type is None or event["event_type"] == event_type.value:
+                    if type_value is None or event["event_type"] == type_value:
                         count += 1
 
         return count
@@ -278,15 +342,11 @@ class EventReplayer:
                             stats["total_events"] += 1
 
                             event_type = event["event_type"]
-                            if event_type == EventType.ORDERBOOK_SNAPSHOT.value:
-                                stats["orderbook_snapshots"] += 1
-                                stats["tokens"].add(event["data"]["token_id"])
-                            elif event_type == EventType.SIGNAL.value:
-                                stats["signals"] += 1
-                            elif event_type == EventType.ORDER_REQUEST.value:
-                                stats["order_requests"] += 1
-                            elif event_type == EventType.ORDER_RESULT.value:
-                                stats["order_results"] += 1
+                            counter = _STAT_COUNTERS.get(event_type)
+                            if counter is not None:
+                                stats[counter] += 1
+                                if event_type == _ORDERBOOK_SNAPSHOT:
+                                    stats["tokens"].add(event["data"]["token_id"])
 
             current_date += timedelta(days=1)
 
@@ -309,12 +369,22 @@ class EventReplayer:
         Returns:
             List of opportunities
         """
+        event_file = self.get_event_file(event_date)
+        if not event_file.exists():
+            return []
+
         opportunities = []
+        async with aiofiles.open(event_file, "rb") as f:
+            async for line in f:
+                # Only signal lines can be opportunities; skip decoding the rest
+                if _SIGNAL_NEEDLE not in line:
+                    continue
 
-        async for event in self.replay_date(event_date):
-            if event["event_type"] == EventType.SIGNAL.value:
-                expected_profit = float(event["data"]["expected_profit"])
-                if expected_profit >= min_profit:
-                    opportunities.append(event)
+                event = json.loads(line)
+                if event["event_type"] == EventType.SIGNAL.value:
+                    expected_profit = float(event["data"]["expected_profit"])
+                    if expected_profit >= min_profit:
+                        opportunities.append(event)
 
+        opportunities.sort(key=lambda e: e["timestamp"])
         return opportunities
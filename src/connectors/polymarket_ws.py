@@ -12,21 +12,85 @@ Resilience features:
 import asyncio
 import json
 import logging
+import random
 import time
 from decimal import Decimal
-from typing import Optional, Dict, Set
+from typing import Awaitable, Callable, ClassVar, Optional, Dict, Iterable, Set
 from json import JSONDecodeError
 from collections import OrderedDict
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 import websockets
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; frames decode with json
+    orjson = None
+
 from src.core.models import OrderBook, Bid, Ask
 from src.core.telemetry import generate_trace_id, log_event, EventType as TeleEventType
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8192)
+def _to_decimal(value) -> Decimal:
+    """
+    Parse a price or size from the wire.
+
+    Books repeat the same price levels and sizes across messages; Decimal is
+    immutable, so each distinct value is parsed once and shared.
+
+    Args:
+        value: Price or size as received (string or number)
+
+    Returns:
+        Decimal value
+    """
+    return Decimal(str(value))
+
+
+def _apply_levels(orders: list, levels: list, model: type, token_id: str, reverse: bool) -> list:
+    """
+    Apply price-level changes to one side of an order book.
+
+    Existing orders are indexed by price once, so each change is a dict
+    set or delete instead of a scan of the whole side. A size of zero
+    removes the level.
+
+    Args:
+        orders: Current orders on this side
+        levels: Raw level changes from the update message
+        model: Bid or Ask
+        token_id: Token identifier
+        reverse: True for bids (highest first), False for asks (lowest first)
+
+    Returns:
+        New sorted list of orders
+    """
+    by_price = {order.price: order for order in orders}
+    for level in levels:
+        price = _to_decimal(level["price"])
+        size = _to_decimal(level["size"])
+        if size > 0:
+            by_price[price] = model(price=price, size=size, token_id=token_id)
+        else:
+            by_price.pop(price, None)
+    return sorted(by_price.values(), key=lambda order: order.price, reverse=reverse)
+
+
+if orjson is not None:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+
 # LRU cache for message deduplication
 class MessageCache:
     """LRU cache for message deduplication."""
@@ -80,6 +144,10 @@ class MessageCache:
         }
 
 
+# Unbound PolymarketWSClient message handler: (client, message) -> awaitable
+_MessageHandler = Callable[["PolymarketWSClient", dict], Awaitable[None]]
+
+
 class PolymarketWSClient:
     """
     WebSocket client for Polymarket CLOB.
@@ -101,6 +169,7 @@ class PolymarketWSClient:
         reconnect_delay: float = 1.0,
         use_exponential_backoff: bool = True,
         heartbeat_timeout: int = 30,
+        message_queue_size: int = 1024,
     ):
         """
         Initialize the WebSocket client.
@@ -111,12 +180,23 @@ class PolymarketWSClient:
             reconnect_delay: Initial delay between reconnections (seconds)
             use_exponential_backoff: Whether to use exponential backoff
             heartbeat_timeout: Seconds without message before considering stale
+            message_queue_size: Decoded messages buffered between recv and processing
         """
         self.url = url
         self.max_reconnect_attempts = max_reconnect_attempts
         self.reconnect_delay = reconnect_delay
         self.use_exponential_backoff = use_exponential_backoff
         self.heartbeat_timeout = heartbeat_timeout
+        self.message_queue_size = message_queue_size
+
+        # Delay before each retry, computed once (exponential backoff capped at 30s)
+        if use_exponential_backoff:
+            self._backoff_delays = tuple(
+                min(reconnect_delay * 2 ** i, 30) for i in range(max_reconnect_attempts)
+            )
+        else:
+            self._backoff_delays = (reconnect_delay,) * max_reconnect_attempts
+
         self.connected: bool = False
         self.orderbooks: Dict[str, OrderBook] = {}
         self._ws: Optional[websockets.WebSocketClientProtocol] = None
@@ -143,19 +223,20 @@ class PolymarketWSClient:
             Exception: If connection fails after max attempts
         """
         attempt = 0
-        delay = self.reconnect_delay
 
         while attempt < self.max_reconnect_attempts:
             try:
                 logger.info(f"正在连接到 {self.url} (尝试 {attempt + 1}/{self.max_reconnect_attempts})")
-                self._ws = await websockets.connect(self.url)
+                # The feed is small JSON frames: per-message deflate costs
+                # more CPU than it saves on the wire
+                self._ws = await websockets.connect(self.url, compression=None)
                 self.connected = True
                 self._connect_count += 1
                 logger.info(f"连接成功 (总连接次数: {self._connect_count})")
 
                 # Resubscribe to previous subscriptions
-                for token_id in self._subscriptions:
-                    await self._send_subscription(token_id)
+                if self._subscriptions:
+                    await self._send_subscription(self._subscriptions)
 
                 return
             except Exception as e:
@@ -165,12 +246,10 @@ class PolymarketWSClient:
                 if attempt >= self.max_reconnect_attempts:
                     raise Exception(f"Failed to connect after {self.max_reconnect_attempts} attempts")
 
-                # Wait before retrying
-                await asyncio.sleep(delay)
-
-                # Exponential backoff
-                if self.use_exponential_backoff:
-                    delay = min(delay * 2, 30)
+                # Wait before retrying, with 10% jitter so many clients
+                # don't reconnect in lockstep
+                delay = self._backoff_delays[attempt - 1]
+                await asyncio.sleep(delay + random.uniform(-0.1 * delay, 0.1 * delay))
 
     async def disconnect(self) -> None:
         """Disconnect from the WebSocket server."""
@@ -190,30 +269,49 @@ class PolymarketWSClient:
 
         logger.info("已断开连接")
 
-    async def subscribe(self, token_id: str) -> None:
+    async def subscribe(self, *token_ids: str) -> None:
         """
-        Subscribe to order book updates for a token.
+        Subscribe to order book updates for one or more tokens.
+
+        All tokens go out in a single subscription frame.
 
         Args:
-            token_id: Token identifier to subscribe to
+            *token_ids: Token identifiers to subscribe to
 
         Raises:
             Exception: If not connected
         """
         if not self.connected:
             raise Exception("Not connected")
+        if not token_ids:
+            return
+
+        await self._send_subscription(token_ids)
+        self._subscriptions.update(token_ids)
+        if len(token_ids) == 1:
+            logger.info(f"已订阅 {token_ids[0]}")
+        else:
+            logger.info(f"已订阅 {len(token_ids)} 个代币")
+
+    async def subscribe_many(self, token_ids: Iterable[str]) -> None:
+        """
+        Subscribe to order book updates for a collection of tokens.
+
+        Args:
+            token_ids: Token identifiers to subscribe to
 
-        await self._send_subscription(token_id)
-        self._subscriptions.add(token_id)
-        logger.info(f"已订阅 {token_id}")
+        Raises:
+            Exception: If not connected
+        """
+        await self.subscribe(*token_ids)
 
-    async def _send_subscription(self, token_id: str) -> None:
-        """Send subscription message to the server."""
+    async def _send_subscription(self, token_ids: Iterable[str]) -> None:
+        """Send one subscription message for the given tokens."""
         message = {
             "action": "subscribe",
-            "tokens": [token_id],
+            "tokens": list(token_ids),
         }
-        await self._ws.send(json.dumps(message))
+        await self._ws.send(_json_dumps(message))
 
     async def listen(self) -> None:
         """
@@ -221,36 +319,66 @@ class PolymarketWSClient:
 
         This method runs in a loop until disconnected.
         It will automatically reconnect on connection loss.
+
+        Frames are read and decoded here and handed to a separate processor
+        task through a bounded queue, so recv() keeps draining the socket
+        while a message is being applied. When the processor falls
+        behind, the queue fills and reading pauses. No message is dropped:
+        order book updates cannot be skipped without corrupting the book.
         """
-        while self.connected:
-            try:
-                if not self._ws:
-                    await asyncio.sleep(0.1)
-                    continue
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.message_queue_size)
+        processor = asyncio.create_task(self._process_messages(queue))
 
-                message_raw = await self._ws.recv()
+        try:
+            while self.connected:
+                try:
+                    if not self._ws:
+                        await asyncio.sleep(0.1)
+                        continue
 
-                # Skip empty messages (heartbeat/ping)
-                if not message_raw or not message_raw.strip():
-                    continue
+                    message_raw = await self._ws.recv()
 
-                try:
-                    message = json.loads(message_raw)
-                except JSONDecodeError:
-                    # Skip non-JSON messages (heartbeat/control frames)
-                    logger.debug(f"跳过非 JSON 消息: {message_raw[:50]}")
-                    continue
+                    # Skip empty messages (heartbeat/ping)
+                    if not message_raw or not message_raw.strip():
+                        continue
 
-                await self._handle_message(message)
+                    try:
+                        message = _json_loads(message_raw)
+                    except JSONDecodeError:
+                        # Skip non-JSON messages (heartbeat/control frames)
+                        logger.debug(f"跳过非 JSON 消息: {message_raw[:50]}")
+                        continue
 
-            except websockets.exceptions.ConnectionClosed:
-                logger.warning("连接已关闭，尝试重新连接...")
-                self.connected = False
-                await self.connect()
+                    await queue.put(message)
+
+                except websockets.exceptions.ConnectionClosed:
+                    logger.warning("连接已关闭，尝试重新连接...")
+                    self.connected = False
+                    await self.connect()
+
+                except Exception as e:
+                    logger.error(f"监听循环错误: {e}")
+                    await asyncio.sleep(0.1)
+        finally:
+            processor.cancel()
+            try:
+                await processor
+            except asyncio.CancelledError:
+                pass
+
+    async def _process_messages(self, queue: asyncio.Queue) -> None:
+        """
+        Apply decoded messages from the listen queue in arrival order.
 
+        Args:
+            queue: Queue filled by listen()
+        """
+        while True:
+            message = await queue.get()
+            try:
+                await self._handle_message(message)
             except Exception as e:
-                logger.error(f"监听循环错误: {e}")
-                await asyncio.sleep(0.1)
+                logger.error(f"消息处理错误: {e}")
 
     async def _handle_message(self, message: dict) -> None:
         """
@@ -312,13 +440,12 @@ class PolymarketWSClient:
             # Update sequence number
             self._sequence_numbers[token_id] = seq_num
 
-        # Handle message types
-        if msg_type == "snapshot":
-            await self._handle_snapshot(message)
-        elif msg_type == "update":
-            await self._handle_update(message)
-        else:
+        # Dispatch on message type
+        handler = self._MESSAGE_HANDLERS.get(msg_type)
+        if handler is None:
             logger.debug(f"Ignoring unknown message type: {msg_type}")
+            return
+        await handler(self, message)
 
     async def _handle_snapshot(self, message: dict) -> None:
         """
@@ -356,8 +483,8 @@ class PolymarketWSClient:
 
         bids = [
             Bid(
-                price=Decimal(str(b["price"])),
-                size=Decimal(str(b["size"])),
+                price=_to_decimal(b["price"]),
+                size=_to_decimal(b["size"]),
                 token_id=token_id,
             )
             for b in bids_raw
@@ -365,24 +492,36 @@ class PolymarketWSClient:
 
         asks = [
             Ask(
-                price=Decimal(str(a["price"])),
-                size=Decimal(str(a["size"])),
+                price=_to_decimal(a["price"]),
+                size=_to_decimal(a["size"]),
                 token_id=token_id,
             )
             for a in asks_raw
         ]
 
-        # Sort orders
-        bids.sort(key=lambda x: x.price, reverse=True)  # Highest first
-        asks.sort(key=lambda x: x.price)  # Lowest first
-
-        self.orderbooks[token_id] = OrderBook(
-            token_id=token_id,
-            bids=bids,
-            asks=asks,
-            last_update=int(asyncio.get_event_loop().time() * 1000),
-            event_received_ms=event_received_ms,
-        )
+        last_update = int(asyncio.get_event_loop().time() * 1000)
+        orderbook = self.orderbooks.get(token_id)
+        if orderbook is None:
+            # OrderBook sorts orders on construction (bids highest first, asks lowest first)
+            orderbook = OrderBook(
+                token_id=token_id,
+                bids=bids,
+                asks=asks,
+                last_update=last_update,
+                event_received_ms=event_received_ms,
+            )
+            self.orderbooks[token_id] = orderbook
+        else:
+            # Resnapshot (e.g. after reconnect): refill the existing book in place
+            bids.sort(key=lambda order: order.price, reverse=True)
+            asks.sort(key=lambda order: order.price)
+            orderbook.bids = bids
+            orderbook.asks = asks
+            orderbook.last_update = last_update
+            orderbook.event_received_ms = event_received_ms
+            orderbook.mark_changed()
+        bids = orderbook.bids
+        asks = orderbook.asks
 
         # Log order book snapshot with details
         best_bid = bids[0].price if bids else None
@@ -433,43 +572,27 @@ class PolymarketWSClient:
             trace_id=trace_id
         )
 
-        # Update bids
+        # Apply each side's changes to a price-keyed map, then re-sort once
         bids_raw = message.get("bids", [])
-        for b in bids_raw:
-            bid = Bid(
-                price=Decimal(str(b["price"])),
-                size=Decimal(str(b["size"])),
-                token_id=token_id,
-            )
-            # Remove existing bid at same price
-            orderbook.bids = [existing for existing in orderbook.bids if existing.price != bid.price]
-            # Add new bid if size > 0
-            if bid.size > 0:
-                orderbook.bids.append(bid)
+        if bids_raw:
+            orderbook.bids = _apply_levels(orderbook.bids, bids_raw, Bid, token_id, reverse=True)
 
-        # Update asks
         asks_raw = message.get("asks", [])
-        for a in asks_raw:
-            ask = Ask(
-                price=Decimal(str(a["price"])),
-                size=Decimal(str(a["size"])),
-                token_id=token_id,
-            )
-            # Remove existing ask at same price
-            orderbook.asks = [existing for existing in orderbook.asks if existing.price != ask.price]
-            # Add new ask if size > 0
-            if ask.size > 0:
-                orderbook.asks.append(ask)
-
-        # Re-sort
-        orderbook.bids.sort(key=lambda x: x.price, reverse=True)
-        orderbook.asks.sort(key=lambda x: x.price)
+        if asks_raw:
+            orderbook.asks = _apply_levels(orderbook.asks, asks_raw, Ask, token_id, reverse=False)
 
         orderbook.last_update = int(asyncio.get_event_loop().time() * 1000)
         orderbook.event_received_ms = event_received_ms
+        orderbook.mark_changed()
 
         logger.info(f"已更新订单本: {token_id} (更新 - {len(bids_raw)} 买单变动, {len(asks_raw)} 卖单变动)")
 
+    # Message type -> handler; one dict lookup per message in _handle_message
+    _MESSAGE_HANDLERS: ClassVar[Dict[str, _MessageHandler]] = {
+        "snapshot": _handle_snapshot,
+        "update": _handle_update,
+    }
+
     def get_order_book(self, token_id: str) -> Optional[OrderBook]:
         """
         Get the current order book for a token.
@@ -1,11 +1,37 @@
-"""Core modules for PolyArb-X."""
+"""Core modules for PolyArb-X.
 
-from src.core.config import Config
-from src.core.models import *
-from src.core.edge import EdgeBreakdown, Decision, calculate_net_edge, validate_edge_breakdown
-from src.core.metrics import MetricsCollector, record_latency
-from src.core.recorder import EventRecorder, EventType, get_events_path, record_event
-from src.core.telemetry import TraceContext, EventType as TeleEventType, generate_trace_id, log_event
+Submodules are imported lazily on first attribute access, so importing a
+single submodule (e.g. src.core.models) does not pull in the rest.
+"""
+import importlib
+
+# Exported name -> (submodule, attribute in that submodule)
+_LAZY_EXPORTS = {
+    # Config
+    "Config": ("src.core.config", "Config"),
+
+    # Edge
+    "EdgeBreakdown": ("src.core.edge", "EdgeBreakdown"),
+    "Decision": ("src.core.edge", "Decision"),
+    "calculate_net_edge": ("src.core.edge", "calculate_net_edge"),
+    "validate_edge_breakdown": ("src.core.edge", "validate_edge_breakdown"),
+
+    # Metrics
+    "MetricsCollector": ("src.core.metrics", "MetricsCollector"),
+    "record_latency": ("src.core.metrics", "record_latency"),
+
+    # Recorder
+    "EventRecorder": ("src.core.recorder", "EventRecorder"),
+    "EventType": ("src.core.recorder", "EventType"),
+    "get_events_path": ("src.core.recorder", "get_events_path"),
+    "record_event": ("src.core.recorder", "record_event"),
+
+    # Telemetry
+    "TraceContext": ("src.core.telemetry", "TraceContext"),
+    "TeleEventType": ("src.core.telemetry", "EventType"),
+    "generate_trace_id": ("src.core.telemetry", "generate_trace_id"),
+    "log_event": ("src.core.telemetry", "log_event"),
+}
 
 __all__ = [
     # Config
@@ -40,3 +66,14 @@ __all__ = [
     "generate_trace_id",
     "log_event",
 ]
+
+
+def __getattr__(name: str):
+    """Resolve exported names on first access (PEP 562)."""
+    module_name, attr = _LAZY_EXPORTS.get(name, ("src.core.models", name))
+    try:
+        value = getattr(importlib.import_module(module_name), attr)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
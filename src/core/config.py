@@ -60,6 +60,9 @@ class Config:
     # Database
     DATABASE_PATH: str = os.getenv("DATABASE_PATH", "data/polyarb.db")
 
+    # Event loop: run on uvloop when it is installed (opt-in)
+    UVLOOP_ENABLED: bool = os.getenv("UVLOOP_ENABLED", "false").lower() == "true"
+
     # Trading mode
     # Priority: 1) Environment variable DRY_RUN, 2) config.yaml DRY_RUN, 3) default false
     _dry_run_env = os.getenv("DRY_RUN")
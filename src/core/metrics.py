@@ -5,7 +5,7 @@ This module provides:
 - Latency metric recording
 - Time window aggregation
 - Percentile calculation
-- Metrics persistence to JSONL
+- Metrics persistence to JSONL (batched by a background writer)
 
 Example:
     collector = MetricsCollector()
@@ -18,29 +18,65 @@ Example:
     )
 """
 import json
+import math
+import time
+from array import array
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple, Union
 from dataclasses import dataclass, field
 import asyncio
 import aiofiles
+from loguru import logger
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; percentiles fall back to pure Python
+    np = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; serialization falls back to json
+    orjson = None
 
 # Metrics log file path
 METRICS_LOG_FILE = Path("logs/metrics.jsonl")
 
+# Percentiles reported in snapshots
+_PERCENTILES = (50, 95, 99)
 
-@dataclass
+# Default number of metrics retained in memory per collector
+DEFAULT_MAX_METRICS = 100_000
+
+# Precomputed JSON line layout for metric log entries; only the values are
+# substituted per metric (floats use repr, which matches json.dumps output)
+_METRIC_LINE_TEMPLATE = (
+    '{"trace_id":%s,'
+    '"ws_to_book_update_ms":%r,'
+    '"book_to_signal_ms":%r,'
+    '"signal_to_risk_ms":%r,'
+    '"risk_to_send_ms":%r,'
+    '"end_to_end_ms":%r,'
+    '"timestamp":"%s"}'
+)
+_encode_json_string = json.encoder.encode_basestring_ascii
+
+
+@dataclass(slots=True)
 class LatencyMetric:
     """
     Latency metric for a single trace.
 
+    The end-to-end latency is not stored; end_to_end_ms derives it from
+    the four stage latencies.
+
     Attributes:
         trace_id: Unique trace identifier
         ws_to_book_update_ms: WebSocket to order book update latency
         book_to_signal_ms: Order book to signal generation latency
         signal_to_risk_ms: Signal to risk check latency
         risk_to_send_ms: Risk check to order send latency
-        end_to_end_ms: Total end-to-end latency
         timestamp: When the metric was recorded
     """
     trace_id: str
@@ -48,7 +84,6 @@ class LatencyMetric:
     book_to_signal_ms: float
     signal_to_risk_ms: float
     risk_to_send_ms: float
-    end_to_end_ms: float
     timestamp: datetime = None
 
     def __post_init__(self):
@@ -56,6 +91,16 @@ class LatencyMetric:
         if self.timestamp is None:
             self.timestamp = datetime.now()
 
+    @property
+    def end_to_end_ms(self) -> float:
+        """Total end-to-end latency (sum of the stage latencies)"""
+        return (
+            self.ws_to_book_update_ms +
+            self.book_to_signal_ms +
+            self.signal_to_risk_ms +
+            self.risk_to_send_ms
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
         return {
@@ -108,31 +153,332 @@ class TimeWindow:
         """
         self.seconds = seconds
 
-    def contains(self, timestamp: datetime) -> bool:
+    def bounds(self) -> Tuple[datetime, datetime]:
+        """
+        Get the current window bounds.
+
+        Returns:
+            Tuple of (window_start, window_end) ending now
+        """
+        now = datetime.now()
+        return now - timedelta(seconds=self.seconds), now
+
+    def epoch_bounds(self) -> Tuple[float, float]:
+        """
+        Get the current window bounds as Unix timestamps.
+
+        Returns:
+            Tuple of (window_start, window_end) in seconds since the epoch
+        """
+        now = time.time()
+        return now - self.seconds, now
+
+    def contains(self, timestamp: Union[datetime, float]) -> bool:
         """
         Check if a timestamp is within the time window.
 
         Args:
-            timestamp: Timestamp to check
+            timestamp: Timestamp to check (datetime or Unix seconds)
 
         Returns:
             True if timestamp is within the window
         """
-        now = datetime.now()
-        window_start = now - timedelta(seconds=self.seconds)
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.timestamp()
+        window_start, now = self.epoch_bounds()
         return window_start <= timestamp <= now
 
 
+class LatencyMetricBuffer:
+    """
+    Bounded, column-oriented ring buffer of latency metrics.
+
+    Each latency field is stored in its own contiguous float64 array
+    instead of one LatencyMetric object per entry, and timestamps are kept
+    as Unix seconds. Indexing and iteration materialize LatencyMetric
+    objects on demand, so the buffer can be used like a sequence;
+    aggregations read whole columns via column(). end_to_end_ms is not
+    stored; its column is summed from the stage columns on demand. Once
+    full, appending evicts the oldest metric.
+
+    Count, sum, min and max of end_to_end_ms over the retained metrics are
+    maintained incrementally (min/max via monotonic deques), so whole-buffer
+    summaries are O(1).
+    """
+
+    FLOAT_FIELDS = (
+        "ws_to_book_update_ms",
+        "book_to_signal_ms",
+        "signal_to_risk_ms",
+        "risk_to_send_ms",
+    )
+
+    def __init__(self, maxlen: int = DEFAULT_MAX_METRICS):
+        """
+        Initialize the buffer.
+
+        Args:
+            maxlen: Maximum number of metrics retained
+        """
+        if maxlen < 1:
+            raise ValueError("maxlen must be at least 1")
+        self.maxlen = maxlen
+        self._head = 0  # Physical index of the oldest metric once full
+        self._trace_ids: List[str] = []
+        self._timestamps = array("d")  # Unix seconds
+        self._columns: Dict[str, array] = {name: array("d") for name in self.FLOAT_FIELDS}
+        self._reset_running_stats()
+
+    def _reset_running_stats(self) -> None:
+        """Reset the incremental end-to-end statistics."""
+        self._appended = 0  # Sequence number of the next appended metric
+        self._e2e_sum = 0.0
+        self._e2e_min: deque = deque()  # (seq, value), values increasing
+        self._e2e_max: deque = deque()  # (seq, value), values decreasing
+
+    def _update_running_stats(self, end_to_end_ms: float, evicted: Optional[float]) -> None:
+        """Fold a newly appended (and possibly an evicted) value into the statistics."""
+        seq = self._appended
+        self._appended += 1
+
+        if evicted is not None:
+            self._e2e_sum -= evicted
+        self._e2e_sum += end_to_end_ms
+
+        min_deque = self._e2e_min
+        while min_deque and min_deque[-1][1] >= end_to_end_ms:
+            min_deque.pop()
+        min_deque.append((seq, end_to_end_ms))
+
+        max_deque = self._e2e_max
+        while max_deque and max_deque[-1][1] <= end_to_end_ms:
+            max_deque.pop()
+        max_deque.append((seq, end_to_end_ms))
+
+        # Drop entries that were evicted from the ring buffer
+        oldest_seq = self._appended - len(self._trace_ids)
+        while min_deque[0][0] < oldest_seq:
+            min_deque.popleft()
+        while max_deque[0][0] < oldest_seq:
+            max_deque.popleft()
+
+    def end_to_end_stats(self) -> Tuple[int, float, float, float]:
+        """
+        Get end-to-end latency statistics over all retained metrics.
+
+        Returns:
+            Tuple of (count, sum, min, max); min and max are 0.0 when empty
+        """
+        if not self._trace_ids:
+            return 0, 0.0, 0.0, 0.0
+        return (
+            len(self._trace_ids),
+            self._e2e_sum,
+            self._e2e_min[0][1],
+            self._e2e_max[0][1],
+        )
+
+    def __len__(self) -> int:
+        return len(self._trace_ids)
+
+    def _physical_index(self, index: int) -> int:
+        """Map a logical index (0 = oldest) to a physical storage index."""
+        n = len(self._trace_ids)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("metric index out of range")
+        return (self._head + index) % n
+
+    def append(self, metric: LatencyMetric) -> None:
+        """
+        Append a metric, evicting the oldest one if the buffer is full.
+
+        Args:
+            metric: Metric to store
+        """
+        self.append_values(
+            metric.trace_id,
+            metric.timestamp.timestamp(),
+            *(getattr(metric, name) for name in self.FLOAT_FIELDS),
+        )
+
+    def append_values(
+        self,
+        trace_id: str,
+        timestamp: float,
+        ws_to_book_update_ms: float,
+        book_to_signal_ms: float,
+        signal_to_risk_ms: float,
+        risk_to_send_ms: float,
+    ) -> None:
+        """
+        Append raw metric values without building a LatencyMetric.
+
+        Args:
+            trace_id: Unique trace identifier
+            timestamp: Recording time in Unix seconds
+            ws_to_book_update_ms: WebSocket to order book update latency
+            book_to_signal_ms: Order book to signal generation latency
+            signal_to_risk_ms: Signal to risk check latency
+            risk_to_send_ms: Risk check to order send latency
+        """
+        values = (
+            ws_to_book_update_ms,
+            book_to_signal_ms,
+            signal_to_risk_ms,
+            risk_to_send_ms,
+        )
+        end_to_end_ms = (
+            ws_to_book_update_ms +
+            book_to_signal_ms +
+            signal_to_risk_ms +
+            risk_to_send_ms
+        )
+        columns = self._columns
+
+        if len(self._trace_ids) < self.maxlen:
+            self._trace_ids.append(trace_id)
+            self._timestamps.append(timestamp)
+            for name, value in zip(self.FLOAT_FIELDS, values):
+                columns[name].append(value)
+            self._update_running_stats(end_to_end_ms, None)
+            return
+
+        slot = self._head
+        evicted = self._end_to_end_at(slot)
+        self._trace_ids[slot] = trace_id
+        self._timestamps[slot] = timestamp
+        for name, value in zip(self.FLOAT_FIELDS, values):
+            columns[name][slot] = value
+        self._head = (slot + 1) % self.maxlen
+        self._update_running_stats(end_to_end_ms, evicted)
+
+    def clear(self) -> None:
+        """Remove all metrics."""
+        self._head = 0
+        self._trace_ids.clear()
+        self._timestamps = array("d")
+        for name in self.FLOAT_FIELDS:
+            self._columns[name] = array("d")
+        self._reset_running_stats()
+
+    def _end_to_end_at(self, slot: int) -> float:
+        """Sum the stage latencies stored at a physical index."""
+        columns = self._columns
+        return (
+            columns["ws_to_book_update_ms"][slot] +
+            columns["book_to_signal_ms"][slot] +
+            columns["signal_to_risk_ms"][slot] +
+            columns["risk_to_send_ms"][slot]
+        )
+
+    def timestamp_at(self, index: int) -> float:
+        """
+        Get the timestamp of a metric without materializing it.
+
+        Args:
+            index: Logical index (0 = oldest, negative from newest)
+
+        Returns:
+            Metric timestamp in Unix seconds
+        """
+        return self._timestamps[self._physical_index(index)]
+
+    def column(self, name: str, start: int = 0, stop: Optional[int] = None) -> array:
+        """
+        Get a contiguous copy of one latency column in recording order.
+
+        Args:
+            name: Field name (one of FLOAT_FIELDS, or "end_to_end_ms")
+            start: Logical start index (inclusive)
+            stop: Logical stop index (exclusive), defaults to the end
+
+        Returns:
+            array('d') of values
+        """
+        if name == "end_to_end_ms":
+            return self._end_to_end_column(start, stop)
+        column = self._columns[name]
+        if self._head:
+            column = column[self._head:] + column[:self._head]
+        return column[start:stop]
+
+    def _end_to_end_column(self, start: int, stop: Optional[int]) -> array:
+        """Sum the stage columns into an end-to-end latency column."""
+        ws, book, signal, risk = (
+            self.column(name, start, stop) for name in self.FLOAT_FIELDS
+        )
+        if np is not None:
+            total = (
+                np.frombuffer(ws, dtype=np.float64) +
+                np.frombuffer(book, dtype=np.float64) +
+                np.frombuffer(signal, dtype=np.float64) +
+                np.frombuffer(risk, dtype=np.float64)
+            )
+            result = array("d")
+            result.frombytes(total.tobytes())
+            return result
+        return array("d", (a + b + c + d for a, b, c, d in zip(ws, book, signal, risk)))
+
+    def encode_line(self, index: int) -> bytes:
+        """
+        Encode one metric as a JSON log line without materializing it.
+
+        Args:
+            index: Logical index (0 = oldest, negative from newest)
+
+        Returns:
+            UTF-8 encoded JSON (without newline)
+        """
+        slot = self._physical_index(index)
+        values = (
+            *(self._columns[name][slot] for name in self.FLOAT_FIELDS),
+            self._end_to_end_at(slot),
+        )
+        if not all(map(math.isfinite, values)):
+            # repr() of inf/nan is not valid JSON; use the generic encoder
+            return _serialize_metric(self[index])
+        return (_METRIC_LINE_TEMPLATE % (
+            _encode_json_string(self._trace_ids[slot]),
+            *values,
+            datetime.fromtimestamp(self._timestamps[slot]).isoformat(),
+        )).encode()
+
+    def __getitem__(self, index: int) -> LatencyMetric:
+        slot = self._physical_index(index)
+        return LatencyMetric(
+            trace_id=self._trace_ids[slot],
+            timestamp=datetime.fromtimestamp(self._timestamps[slot]),
+            **{name: self._columns[name][slot] for name in self.FLOAT_FIELDS},
+        )
+
+    def __iter__(self) -> Iterator[LatencyMetric]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __reversed__(self) -> Iterator[LatencyMetric]:
+        for i in range(len(self) - 1, -1, -1):
+            yield self[i]
+
+
 class MetricsCollector:
     """
     Collector for latency metrics.
 
     Provides methods to record metrics and calculate aggregations.
+    Metrics are kept in a bounded columnar ring buffer in recording order;
+    once full, the oldest metrics are evicted.
     """
 
-    def __init__(self):
-        """Initialize metrics collector."""
-        self.metrics: List[LatencyMetric] = []
+    def __init__(self, max_metrics: int = DEFAULT_MAX_METRICS):
+        """
+        Initialize metrics collector.
+
+        Args:
+            max_metrics: Maximum number of metrics retained in memory
+        """
+        self.metrics = LatencyMetricBuffer(maxlen=max_metrics)
 
     def record_latency(
         self,
@@ -152,25 +498,15 @@ class MetricsCollector:
             signal_to_risk_ms: Signal to risk check latency
             risk_to_send_ms: Risk check to order send latency
         """
-        # Calculate end-to-end latency
-        end_to_end_ms = (
-            ws_to_book_update_ms +
-            book_to_signal_ms +
-            signal_to_risk_ms +
-            risk_to_send_ms
-        )
-
-        metric = LatencyMetric(
-            trace_id=trace_id,
-            ws_to_book_update_ms=ws_to_book_update_ms,
-            book_to_signal_ms=book_to_signal_ms,
-            signal_to_risk_ms=signal_to_risk_ms,
-            risk_to_send_ms=risk_to_send_ms,
-            end_to_end_ms=end_to_end_ms
+        self.metrics.append_values(
+            trace_id,
+            time.time(),
+            ws_to_book_update_ms,
+            book_to_signal_ms,
+            signal_to_risk_ms,
+            risk_to_send_ms,
         )
 
-        self.metrics.append(metric)
-
     def get_metrics_in_window(self, window: TimeWindow) -> List[LatencyMetric]:
         """
         Get metrics within a time window.
@@ -179,12 +515,35 @@ class MetricsCollector:
             window: Time window to filter by
 
         Returns:
-            List of metrics within the window
+            List of metrics within the window, oldest first
+        """
+        start, stop = self._window_range(window)
+        return [self.metrics[i] for i in range(start, stop)]
+
+    def _window_range(self, window: TimeWindow) -> Tuple[int, int]:
+        """
+        Find the logical index range of metrics inside a time window.
+
+        Metrics are recorded in time order, so this walks back from the
+        newest metric and stops at the first one older than the window.
+
+        Args:
+            window: Time window to locate
+
+        Returns:
+            Tuple of (start, stop) logical indices
         """
-        return [
-            m for m in self.metrics
-            if window.contains(m.timestamp)
-        ]
+        window_start, window_end = window.epoch_bounds()
+
+        stop = len(self.metrics)
+        while stop > 0 and self.metrics.timestamp_at(stop - 1) > window_end:
+            stop -= 1
+
+        start = stop
+        while start > 0 and self.metrics.timestamp_at(start - 1) >= window_start:
+            start -= 1
+
+        return start, stop
 
     def calculate_snapshot(self, window: TimeWindow) -> MetricsSnapshot:
         """
@@ -196,9 +555,9 @@ class MetricsCollector:
         Returns:
             MetricsSnapshot with aggregated statistics
         """
-        window_metrics = self.get_metrics_in_window(window)
+        start, stop = self._window_range(window)
 
-        if not window_metrics:
+        if start == stop:
             return MetricsSnapshot(
                 count=0,
                 avg_end_to_end_ms=0.0,
@@ -206,27 +565,44 @@ class MetricsCollector:
                 max_end_to_end_ms=0.0
             )
 
-        latencies = [m.end_to_end_ms for m in window_metrics]
-
-        # Calculate basic statistics
-        count = len(latencies)
-        avg_latency = sum(latencies) / count
-        min_latency = min(latencies)
-        max_latency = max(latencies)
-
-        # Calculate percentiles
-        percentiles = calculate_percentiles(latencies)
+        count = stop - start
+        latencies = self.metrics.column("end_to_end_ms", start, stop)
+        arr = np.frombuffer(latencies, dtype=np.float64) if np is not None else None
+
+        if start == 0 and stop == len(self.metrics):
+            # Window covers every retained metric: use the running totals
+            _, total, min_latency, max_latency = self.metrics.end_to_end_stats()
+            avg_latency = total / count
+        elif arr is not None:
+            # Single vectorized pass over the contiguous float64 column
+            avg_latency = float(arr.mean())
+            min_latency = float(arr.min())
+            max_latency = float(arr.max())
+        else:
+            # Calculate basic statistics
+            avg_latency = sum(latencies) / count
+            min_latency = min(latencies)
+            max_latency = max(latencies)
+
+        # Percentiles still need the values in the window
+        if arr is not None:
+            p50, p95, p99 = (float(p) for p in np.percentile(arr, _PERCENTILES))
+        else:
+            percentiles = calculate_percentiles(latencies)
+            p50, p95, p99 = percentiles["p50"], percentiles["p95"], percentiles["p99"]
+
+        window_start, window_end = window.bounds()
 
         return MetricsSnapshot(
             count=count,
             avg_end_to_end_ms=avg_latency,
             min_end_to_end_ms=min_latency,
             max_end_to_end_ms=max_latency,
-            p50_end_to_end_ms=percentiles.get("p50") if percentiles else None,
-            p95_end_to_end_ms=percentiles.get("p95") if percentiles else None,
-            p99_end_to_end_ms=percentiles.get("p99") if percentiles else None,
-            window_start=datetime.now() - timedelta(seconds=window.seconds),
-            window_end=datetime.now()
+            p50_end_to_end_ms=p50,
+            p95_end_to_end_ms=p95,
+            p99_end_to_end_ms=p99,
+            window_start=window_start,
+            window_end=window_end
         )
 
 
@@ -243,6 +619,11 @@ def calculate_percentiles(values: List[float]) -> Optional[Dict[str, float]]:
     if not values:
         return None
 
+    if np is not None:
+        arr = np.asarray(values, dtype=np.float64)
+        p50, p95, p99 = np.percentile(arr, _PERCENTILES)
+        return {"p50": float(p50), "p95": float(p95), "p99": float(p99)}
+
     sorted_values = sorted(values)
     n = len(sorted_values)
 
@@ -260,30 +641,183 @@ def calculate_percentiles(values: List[float]) -> Optional[Dict[str, float]]:
         weight = index - lower
         return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
 
-    return {
-        "p50": get_percentile(50),
-        "p95": get_percentile(95),
-        "p99": get_percentile(99)
-    }
+    p50, p95, p99 = (get_percentile(p) for p in _PERCENTILES)
+    return {"p50": p50, "p95": p95, "p99": p99}
 
 
 # Global metrics collector instance
 _global_collector = MetricsCollector()
 
 
-async def _write_metrics_log(data: str) -> None:
+def _serialize_metric(metric: LatencyMetric) -> bytes:
+    """
+    Serialize a metric to a JSON line payload (without newline).
+
+    Args:
+        metric: Metric to serialize
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(metric.to_dict())
+    return json.dumps(metric.to_dict()).encode()
+
+
+async def _write_metrics_log(data: bytes) -> None:
     """
     Write metrics data to log file.
 
     Args:
-        data: JSON string to write
+        data: Encoded JSON line to write
     """
     # Ensure log directory exists
     METRICS_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
 
     # Write to file (append mode)
-    async with aiofiles.open(METRICS_LOG_FILE, mode='a') as f:
-        await f.write(data + '\n')
+    async with aiofiles.open(METRICS_LOG_FILE, mode='ab') as f:
+        await f.write(data + b'\n')
+
+
+class MetricsLogWriter:
+    """
+    Background writer for the metrics log.
+
+    Producers enqueue encoded metric lines and return immediately; a
+    single drain task buffers them and appends to METRICS_LOG_FILE once the
+    buffer reaches max_buffer_bytes or flush_interval_s has passed since
+    its first line, so many metrics share one write. The writer binds
+    lazily to the running event loop and restarts if the loop changes.
+    """
+
+    # Queue marker asking the drain task to write its buffer immediately
+    _FLUSH = object()
+
+    def __init__(
+        self,
+        max_queue_size: int = 10_000,
+        max_buffer_bytes: int = 65_536,
+        flush_interval_s: float = 0.05,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            max_queue_size: Maximum queued lines before producers wait
+            max_buffer_bytes: Buffered bytes that trigger a write
+            flush_interval_s: Maximum time a buffered line waits for a write
+        """
+        self.max_queue_size = max_queue_size
+        self.max_buffer_bytes = max_buffer_bytes
+        self.flush_interval_s = flush_interval_s
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_started(self) -> asyncio.Queue:
+        """Start the drain task on the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task is None or self._task.done():
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._task = loop.create_task(self._drain_loop(self._queue))
+            self._loop = loop
+        return self._queue
+
+    async def put(self, payload: bytes) -> None:
+        """
+        Enqueue one encoded metric line (without newline).
+
+        Args:
+            payload: Encoded JSON line
+        """
+        await self._ensure_started().put(payload)
+
+    @staticmethod
+    async def _next_item(queue: asyncio.Queue, timeout: Optional[float]) -> Any:
+        """Get the next queued item, or None if the timeout expires first."""
+        try:
+            return queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+        if timeout is None:
+            return await queue.get()
+        if timeout <= 0:
+            return None
+        try:
+            return await asyncio.wait_for(queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def _drain_loop(self, queue: asyncio.Queue) -> None:
+        """Buffer queued lines and write them until cancelled."""
+        loop = asyncio.get_running_loop()
+        batch: List[bytes] = []
+        batch_bytes = 0
+        deadline = 0.0
+        taken = 0  # Items received but not yet marked done
+
+        while True:
+            timeout = deadline - loop.time() if batch else None
+            item = await self._next_item(queue, timeout)
+
+            if item is not None:
+                taken += 1
+                if item is not self._FLUSH:
+                    if not batch:
+                        deadline = loop.time() + self.flush_interval_s
+                    batch.append(item)
+                    batch_bytes += len(item) + 1
+
+            if batch and (
+                item is None
+                or item is self._FLUSH
+                or batch_bytes >= self.max_buffer_bytes
+                or loop.time() >= deadline
+            ):
+                try:
+                    await _write_metrics_log(b"\n".join(batch))
+                except Exception as e:
+                    logger.warning(f"Failed to write metrics log: {e}")
+                batch = []
+                batch_bytes = 0
+
+            if not batch:
+                for _ in range(taken):
+                    queue.task_done()
+                taken = 0
+
+    async def flush(self) -> None:
+        """Write buffered lines now and wait until every queued line is written."""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.put(self._FLUSH)
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Flush pending lines and stop the drain task."""
+        await self.flush()
+        if self._task is not None and self._loop is asyncio.get_running_loop():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._queue = None
+        self._task = None
+        self._loop = None
+
+
+# Global metrics log writer instance
+_log_writer = MetricsLogWriter()
+
+
+async def flush_metrics_log() -> None:
+    """Wait until all recorded metrics have been written to the log file."""
+    await _log_writer.flush()
+
+
+async def close_metrics_log() -> None:
+    """Flush the metrics log and stop its background writer."""
+    await _log_writer.close()
 
 
 async def record_latency(
@@ -312,8 +846,5 @@ async def record_latency(
         risk_to_send_ms=risk_to_send_ms
     )
 
-    # Get the last metric
-    metric = _global_collector.metrics[-1]
-
-    # Write to log file
-    await _write_metrics_log(json.dumps(metric.to_dict()))
+    # Queue the newest metric for the background log writer
+    await _log_writer.put(_global_collector.metrics.encode_line(-1))
@@ -6,8 +6,9 @@ All models use Pydantic for validation and serialization.
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 from decimal import Decimal
+from operator import attrgetter
 
 
 class RiskTag(str, Enum):
@@ -53,6 +54,10 @@ class Ask(BaseModel):
         return v
 
 
+# Sort key for orders
+_order_price = attrgetter("price")
+
+
 class OrderBook(BaseModel):
     """Order book for a single token."""
 
@@ -65,27 +70,77 @@ class OrderBook(BaseModel):
         description="Timestamp when this orderbook data was received (ms), for latency tracking"
     )
 
+    # Bumped by mark_changed() on every in-place change; last_update is a
+    # millisecond timestamp and can repeat across changes
+    _version: int = PrivateAttr(default=0)
+
+    @property
+    def version(self) -> int:
+        """Change counter for in-place updates."""
+        return self._version
+
+    def mark_changed(self) -> None:
+        """Record an in-place change to bids or asks."""
+        self._version += 1
+
+    @classmethod
+    def from_asks(
+        cls,
+        token_id: str,
+        levels: List[tuple],
+        last_update: int = 0,
+    ) -> "OrderBook":
+        """
+        Build an ask-only order book from (price, size) levels.
+
+        Levels are trusted (already sorted, lowest price first) and skip
+        per-Ask validation. Prices and sizes are converted through str, so
+        floats keep their written value (0.45 -> Decimal("0.45")).
+
+        Args:
+            token_id: Token identifier
+            levels: List of (price, size) tuples
+            last_update: Timestamp of last update (ms)
+
+        Returns:
+            OrderBook with the given asks and no bids
+        """
+        asks = [
+            Ask.model_construct(
+                price=Decimal(str(price)),
+                size=Decimal(str(size)),
+                token_id=token_id,
+            )
+            for price, size in levels
+        ]
+        return cls.model_construct(
+            token_id=token_id,
+            bids=[],
+            asks=asks,
+            last_update=last_update,
+            event_received_ms=None,
+        )
+
     def get_best_bid(self) -> Optional[Bid]:
         """Get highest bid (best price for selling)."""
         if not self.bids:
             return None
-        # Sort bids by price descending (highest first)
-        sorted_bids = sorted(self.bids, key=lambda x: x.price, reverse=True)
-        return sorted_bids[0]
+        # Single pass; ties resolve to the first bid, as a stable sort would
+        return max(self.bids, key=_order_price)
 
     def get_best_ask(self) -> Optional[Ask]:
         """Get lowest ask (best price for buying)."""
         if not self.asks:
             return None
-        # Sort asks by price ascending (lowest first)
-        sorted_asks = sorted(self.asks, key=lambda x: x.price)
-        return sorted_asks[0]
+        # Single pass; ties resolve to the first ask, as a stable sort would
+        return min(self.asks, key=_order_price)
 
     @field_validator("bids", "asks")
     @classmethod
-    def validate_sorted(cls, v: list) -> list:
-        """Ensure orders are properly sorted."""
-        # Note: This will be enforced by the order book manager
+    def validate_sorted(cls, v: list, info) -> list:
+        """Sort orders once at construction (bids highest first, asks lowest first)."""
+        # Stable, and linear when the input is already sorted
+        v.sort(key=_order_price, reverse=info.field_name == "bids")
         return v
 
 
@@ -151,13 +206,20 @@ class MarketPair(BaseModel):
 class Outcome(BaseModel):
     """An outcome in a multi-outcome market."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Outcome name (e.g., 'Trump', 'Biden')")
     token_id: str = Field(..., description="Token ID for this outcome")
     is_yes: bool = Field(..., description="Whether this is a YES token")
 
 
 class MarketMetadata(BaseModel):
-    """Metadata for a market (binary or multi-outcome)."""
+    """Metadata for a market (binary or multi-outcome).
+
+    Instances are frozen because cached metadata is shared between callers.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     market_id: str = Field(..., description="Market identifier")
     title: str = Field(..., description="Market title")
@@ -218,7 +280,13 @@ class TokenOpportunity(BaseModel):
 
 
 class NegRiskSignal(BaseModel):
-    """Trading signal for NegRisk (mutually exclusive) strategy."""
+    """Trading signal for NegRisk (mutually exclusive) strategy.
+
+    Opportunities that are already TokenOpportunity instances are kept
+    as-is rather than re-validated.
+    """
+
+    model_config = ConfigDict(revalidate_instances="never")
 
     market_id: str = Field(..., description="Market identifier")
     market_title: str = Field(..., description="Market title")
@@ -7,6 +7,7 @@ execution pipeline logic.
 """
 from decimal import Decimal
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime
 from enum import Enum
 from typing import Optional
@@ -59,12 +60,15 @@ class Fill:
     tx_hash: Optional[str] = None
     on_chain_filled: bool = False
 
-    @property
+    # Derived values are cached on first access: a fill records a completed
+    # execution and its fields are not changed afterwards
+
+    @cached_property
     def notional_usdc(self) -> Decimal:
         """Calculate notional value in USDC."""
         return self.price * self.quantity
 
-    @property
+    @cached_property
     def net_proceeds(self) -> Decimal:
         """
         Calculate net proceeds after fees.
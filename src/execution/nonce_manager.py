@@ -4,8 +4,10 @@ Nonce manager for Ethereum transaction ordering.
 Prevents nonce conflicts and ensures monotonic nonce usage.
 """
 import asyncio
-from typing import Optional, Dict, Set
-from dataclasses import dataclass
+import heapq
+import time
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Optional, Set
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from loguru import logger
@@ -16,18 +18,84 @@ from src.connectors.web3_client import Web3Client
 logger = logger.bind(context="nonce_manager")
 
 
-@dataclass
+@dataclass(slots=True)
 class NonceStatus:
-    """Status of a nonce."""
+    """Status of a nonce (slotted: one is kept per pending nonce)."""
 
     nonce: int
     in_use: bool = False
     confirmed: bool = False
-    created_at: datetime = None
+    # Integer wall-clock stamp; the datetime is only built when read
+    created_at_ns: int = field(default_factory=time.time_ns)
 
-    def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.now()
+    @property
+    def created_at(self) -> datetime:
+        """When this nonce status was created."""
+        return datetime.fromtimestamp(self.created_at_ns / 1e9)
+
+
+class ConfirmedNonces:
+    """
+    Set of confirmed nonces stored as a contiguous run plus stragglers.
+
+    Nonces confirm in near-monotonic order, so the run [low, high) absorbs
+    almost every nonce and memory stays constant regardless of volume.
+    Out-of-order nonces wait in a small set until the run reaches them.
+    """
+
+    __slots__ = ("_low", "_high", "_gaps")
+
+    def __init__(self):
+        self._low = 0
+        self._high = 0  # Empty run when low == high
+        self._gaps: Set[int] = set()
+
+    def add(self, nonce: int) -> None:
+        """Mark nonce as confirmed."""
+        low, high = self._low, self._high
+        if low <= nonce < high:
+            return
+        gaps = self._gaps
+        if low == high:
+            low, high = nonce, nonce + 1
+        elif nonce == high:
+            high += 1
+        elif nonce == low - 1:
+            low -= 1
+        else:
+            gaps.add(nonce)
+            return
+
+        # Absorb stragglers the run now touches
+        while high in gaps:
+            gaps.remove(high)
+            high += 1
+        while low - 1 in gaps:
+            low -= 1
+            gaps.remove(low)
+        self._low, self._high = low, high
+
+    def __contains__(self, nonce: object) -> bool:
+        return self._low <= nonce < self._high or nonce in self._gaps
+
+    def __len__(self) -> int:
+        return self._high - self._low + len(self._gaps)
+
+    def __iter__(self) -> Iterator[int]:
+        yield from range(self._low, self._high)
+        yield from self._gaps
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ConfirmedNonces):
+            other = set(other)
+        if isinstance(other, AbstractSet):
+            return len(self) == len(other) and all(nonce in self for nonce in other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ConfirmedNonces({sorted(self)!r})"
 
 
 class NonceManager:
@@ -38,7 +106,7 @@ class NonceManager:
     - Tracks pending nonces
     - Recovers on-chain nonce on startup
     - Prevents nonce reuse
-    - Thread-safe nonce allocation
+    - Atomic nonce allocation within the event loop
     """
 
     def __init__(self, web3_client: Web3Client, address: str):
@@ -53,13 +121,32 @@ class NonceManager:
         self.address = address
 
         # Nonce tracking
-        self._next_nonce: Optional[int] = None
+        self._counter: Optional[int] = None  # Next never-allocated nonce
+        self._returned: List[int] = []  # Min-heap of failed nonces to reuse first
         self._pending_nonces: Dict[int, NonceStatus] = {}
-        self._confirmed_nonces: Set[int] = set()
+        self._confirmed_nonces = ConfirmedNonces()
 
-        # Lock for thread safety
+        # get_stats() snapshot; None when state changed since it was built
+        self._stats_cache: Optional[dict] = None
+
+        # Serializes initialize(); the allocation and status updates are
+        # synchronous and never yield to the event loop
         self._lock = asyncio.Lock()
 
+    @property
+    def _next_nonce(self) -> Optional[int]:
+        """Nonce the next allocation will return."""
+        if self._returned:
+            return min(self._returned[0], self._counter)
+        return self._counter
+
+    @_next_nonce.setter
+    def _next_nonce(self, value: Optional[int]) -> None:
+        # Resetting the sequence drops any returned nonces
+        self._counter = value
+        self._returned.clear()
+        self._stats_cache = None
+
     async def initialize(self) -> int:
         """
         Initialize nonce manager by fetching on-chain nonce.
@@ -84,9 +171,9 @@ class NonceManager:
             logger.error(f"Failed to initialize nonce manager: {e}")
             raise
 
-    async def get_nonce(self) -> int:
+    def get_nonce_sync(self) -> int:
         """
-        Get next available nonce.
+        Get next available nonce without going through the event loop.
 
         Returns:
             Nonce value
@@ -94,18 +181,39 @@ class NonceManager:
         Raises:
             RuntimeError: If nonce manager not initialized
         """
-        async with self._lock:
-            if self._next_nonce is None:
-                raise RuntimeError("Nonce manager not initialized. Call initialize() first.")
+        # No lock: nothing below awaits, so the read-and-increment cannot
+        # interleave with another coroutine on the event loop
+        nonce = self._counter
+        if nonce is None:
+            raise RuntimeError("Nonce manager not initialized. Call initialize() first.")
+
+        returned = self._returned
+        if returned and returned[0] < nonce:
+            # Reuse the lowest failed nonce first
+            nonce = heapq.heappop(returned)
+            while returned and returned[0] == nonce:
+                heapq.heappop(returned)  # Failed more than once
+        else:
+            self._counter = nonce + 1
+
+        # Track as pending
+        self._pending_nonces[nonce] = NonceStatus(nonce=nonce, in_use=True)
+        self._stats_cache = None
+
+        logger.debug(f"Allocated nonce: {nonce}")
+        return nonce
 
-            nonce = self._next_nonce
-            self._next_nonce += 1
+    async def get_nonce(self) -> int:
+        """
+        Get next available nonce.
 
-            # Track as pending
-            self._pending_nonces[nonce] = NonceStatus(nonce=nonce, in_use=True)
+        Returns:
+            Nonce value
 
-            logger.debug(f"Allocated nonce: {nonce}")
-            return nonce
+        Raises:
+            RuntimeError: If nonce manager not initialized
+        """
+        return self.get_nonce_sync()
 
     async def allocate_nonce(self) -> int:
         """
@@ -117,7 +225,20 @@ class NonceManager:
         Raises:
             RuntimeError: If nonce manager not initialized
         """
-        return await self.get_nonce()
+        return self.get_nonce_sync()
+
+    def mark_confirmed_sync(self, nonce: int):
+        """
+        Mark nonce as confirmed without going through the event loop.
+
+        Args:
+            nonce: Confirmed nonce value
+        """
+        self._pending_nonces.pop(nonce, None)
+
+        self._confirmed_nonces.add(nonce)
+        self._stats_cache = None
+        logger.debug(f"Nonce confirmed: {nonce}")
 
     async def mark_confirmed(self, nonce: int):
         """
@@ -126,29 +247,61 @@ class NonceManager:
         Args:
             nonce: Confirmed nonce value
         """
-        async with self._lock:
-            if nonce in self._pending_nonces:
-                del self._pending_nonces[nonce]
+        self.mark_confirmed_sync(nonce)
 
-            self._confirmed_nonces.add(nonce)
-            logger.debug(f"Nonce confirmed: {nonce}")
+    def mark_confirmed_batch_sync(self, nonces: Iterable[int]):
+        """
+        Mark several nonces as confirmed (e.g. all of ours in one block).
 
-    async def mark_failed(self, nonce: int):
+        Args:
+            nonces: Confirmed nonce values
         """
-        Mark nonce as failed (can be reused).
+        pop_pending = self._pending_nonces.pop
+        add_confirmed = self._confirmed_nonces.add
+        count = 0
+        for nonce in nonces:
+            pop_pending(nonce, None)
+            add_confirmed(nonce)
+            count += 1
+        self._stats_cache = None
+
+        logger.debug(f"Nonces confirmed: {count}")
+
+    async def mark_confirmed_batch(self, nonces: Iterable[int]):
+        """
+        Mark several nonces as confirmed (e.g. all of ours in one block).
+
+        Args:
+            nonces: Confirmed nonce values
+        """
+        self.mark_confirmed_batch_sync(nonces)
+
+    def mark_failed_sync(self, nonce: int):
+        """
+        Mark nonce as failed (can be reused) without going through the event loop.
 
         Args:
             nonce: Failed nonce value
         """
-        async with self._lock:
-            if nonce in self._pending_nonces:
-                del self._pending_nonces[nonce]
+        self._pending_nonces.pop(nonce, None)
+        self._stats_cache = None
+
+        # Add back to pool (use this nonce first)
+        if self._counter is None:
+            self._counter = nonce
+        elif nonce < self._counter:
+            heapq.heappush(self._returned, nonce)
 
-            # Add back to pool (use this nonce first)
-            if self._next_nonce is None or nonce < self._next_nonce:
-                self._next_nonce = nonce
+        logger.debug(f"Nonce failed and available for reuse: {nonce}")
 
-            logger.debug(f"Nonce failed and available for reuse: {nonce}")
+    async def mark_failed(self, nonce: int):
+        """
+        Mark nonce as failed (can be reused).
+
+        Args:
+            nonce: Failed nonce value
+        """
+        self.mark_failed_sync(nonce)
 
     def is_pending(self, nonce: int) -> bool:
         """
@@ -170,12 +323,18 @@ class NonceManager:
         """
         Get nonce manager statistics.
 
+        The snapshot is rebuilt only after a nonce is allocated, confirmed
+        or failed; callers must not mutate the returned dict.
+
         Returns:
             Dictionary with stats
         """
-        return {
-            "next_nonce": self._next_nonce,
-            "pending_count": len(self._pending_nonces),
-            "confirmed_count": len(self._confirmed_nonces),
-            "pending_nonces": list(self._pending_nonces.keys()),
-        }
+        stats = self._stats_cache
+        if stats is None:
+            stats = self._stats_cache = {
+                "next_nonce": self._next_nonce,
+                "pending_count": len(self._pending_nonces),
+                "confirmed_count": len(self._confirmed_nonces),
+                "pending_nonces": list(self._pending_nonces.keys()),
+            }
+        return stats
@@ -12,11 +12,16 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from datetime import datetime
 from collections import defaultdict
+from sys import intern
 
 from src.execution.fill import Fill
 
+# Shared Decimal constants (avoid re-parsing literals on every fill)
+_ZERO = Decimal("0")
+_BPS_DIVISOR = Decimal("10000")
 
-@dataclass
+
+@dataclass(slots=True)
 class PnLUpdate:
     """PnL update event."""
 
@@ -80,7 +85,10 @@ class PnLTracker:
         # For arbitrage (YES + NO = 1.0)
         self._arbitrage_positions: Dict[str, tuple[Decimal, Decimal]] = {}
 
-    async def process_fills(
+        # get_summary() snapshot; None when fills were processed since
+        self._summary_cache: Optional[dict] = None
+
+    def process_fills_sync(
         self,
         fills: List[Fill],
         expected_edge: Decimal,
@@ -88,7 +96,7 @@ class PnLTracker:
         strategy: str = "atomic",
     ) -> PnLUpdate:
         """
-        Process fills and generate PnL update.
+        Process fills and generate PnL update (synchronous; no IO).
 
         For arbitrage:
         - Buying YES + NO costs us money (negative proceeds)
@@ -104,6 +112,9 @@ class PnLTracker:
         Returns:
             PnLUpdate with calculated PnL
         """
+        # Strategy names repeat on every update
+        strategy = intern(strategy)
+
         if not fills:
             return PnLUpdate(
                 timestamp_ms=int(datetime.now().timestamp() * 1000),
@@ -114,27 +125,30 @@ class PnLTracker:
             )
 
         # Calculate total cost and fees
-        total_cost = Decimal("0")
-        total_fees = Decimal("0")
-        total_slippage = Decimal("0")
+        total_cost = _ZERO
+        total_fees = _ZERO
+        total_slippage = _ZERO
+        total_tokens = _ZERO
 
+        # Single pass over the fills for every per-fill total
+        positions = self._positions
         for fill in fills:
             total_cost += fill.net_proceeds  # This is negative for buys
             total_fees += fill.fees
+            total_tokens += fill.quantity
             if fill.slippage_bps:
-                total_slippage += fill.notional_usdc * Decimal(fill.slippage_bps) / Decimal("10000")
+                total_slippage += fill.notional_usdc * Decimal(fill.slippage_bps) / _BPS_DIVISOR
 
-            # Track position
-            self._positions[fill.token_id] += fill.quantity
+            # Track position (interned: the same few token IDs repeat as keys)
+            positions[intern(fill.token_id)] += fill.quantity
 
         # For arbitrage: YES + NO = 1.0
         # Our profit = 1.0 - (cost + fees + slippage) per unit
         is_arbitrage = len(fills) == 2
-        simulated_pnl = Decimal("0")
+        simulated_pnl = _ZERO
 
         if is_arbitrage:
-            # Total tokens we bought = sum of quantities
-            total_tokens = sum(f.quantity for f in fills)
+            # Total tokens we bought = sum of quantities (total_tokens)
             # Payout at settlement = total_tokens * 1.0
             payout = total_tokens
             # PnL = payout + total_cost (total_cost is negative, so this is payout - cost)
@@ -160,23 +174,55 @@ class PnLTracker:
             yes_token_id=fills[0].token_id if len(fills) > 0 else None,
             no_token_id=fills[1].token_id if len(fills) > 1 else None,
             expected_edge=expected_edge,
-            simulated_pnl=simulated_pnl if fills[0].is_simulated else Decimal("0"),
-            realized_pnl=simulated_pnl if not fills[0].is_simulated else Decimal("0"),
+            simulated_pnl=simulated_pnl if fills[0].is_simulated else _ZERO,
+            realized_pnl=simulated_pnl if not fills[0].is_simulated else _ZERO,
             fees_paid=total_fees,
             slippage_cost=total_slippage,
             is_simulated=fills[0].is_simulated,
         )
 
         self._pnl_updates.append(pnl_update)
+        self._summary_cache = None
 
         return pnl_update
 
+    async def process_fills(
+        self,
+        fills: List[Fill],
+        expected_edge: Decimal,
+        trace_id: str,
+        strategy: str = "atomic",
+    ) -> PnLUpdate:
+        """
+        Process fills and generate PnL update.
+
+        Async wrapper around process_fills_sync for existing callers.
+
+        Args:
+            fills: List of fills from this execution
+            expected_edge: Expected profit from the signal
+            trace_id: Trace ID for this trade
+            strategy: Strategy name
+
+        Returns:
+            PnLUpdate with calculated PnL
+        """
+        return self.process_fills_sync(fills, expected_edge, trace_id, strategy)
+
     def get_summary(self) -> dict:
-        """Get PnL summary."""
-        return {
-            "cumulative_expected_edge": str(self._cumulative_expected_edge),
-            "cumulative_simulated_pnl": str(self._cumulative_simulated_pnl),
-            "cumulative_realized_pnl": str(self._cumulative_realized_pnl),
-            "total_pnl_updates": len(self._pnl_updates),
-            "open_positions": {k: str(v) for k, v in self._positions.items()},
-        }
+        """
+        Get PnL summary.
+
+        The snapshot is rebuilt only after fills are processed; callers must
+        not mutate the returned dict.
+        """
+        summary = self._summary_cache
+        if summary is None:
+            summary = self._summary_cache = {
+                "cumulative_expected_edge": str(self._cumulative_expected_edge),
+                "cumulative_simulated_pnl": str(self._cumulative_simulated_pnl),
+                "cumulative_realized_pnl": str(self._cumulative_realized_pnl),
+                "total_pnl_updates": len(self._pnl_updates),
+                "open_positions": {k: str(v) for k, v in self._positions.items()},
+            }
+        return summary
@@ -121,10 +121,8 @@ class SimulatedExecutor:
         total_cost = Decimal("0")
         execution_price = Decimal("0")
 
-        # Sort asks by price (lowest first)
-        sorted_asks = sorted(orderbook.asks, key=lambda a: a.price)
-
-        for ask in sorted_asks:
+        # Asks are kept sorted by price (lowest first) by the order book
+        for ask in orderbook.asks:
             if remaining_usdc <= 0:
                 break
 
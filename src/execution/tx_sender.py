@@ -208,10 +208,10 @@ class TxSender:
 
             # Update nonce tracking
             if result.success:
-                self.nonce_manager.mark_confirmed(nonce)
+                self.nonce_manager.mark_confirmed_sync(nonce)
             else:
                 # Mark as failed so nonce can be reused
-                self.nonce_manager.mark_failed(nonce)
+                self.nonce_manager.mark_failed_sync(nonce)
 
             # Update statistics
             if result.success:
@@ -18,6 +18,7 @@ from src.core.config import Config
 from src.connectors.polymarket_ws import PolymarketWSClient
 from src.strategies.atomic import AtomicArbitrageStrategy
 from src.core.recorder import EventRecorder
+from src.core.metrics import close_metrics_log
 from src.core.telemetry import generate_trace_id, TraceContext
 from src.core.models import TradingMetrics
 from src.execution.simulated_executor import SimulatedExecutor
@@ -26,6 +27,29 @@ from src.execution.pnl_tracker import PnLTracker
 from src.execution.diagnostics import DryRunSanityCheck
 
 
+def install_uvloop() -> bool:
+    """
+    Switch asyncio to uvloop when enabled and installed.
+
+    Must run before asyncio.run(); the WebSocket listen loop and every
+    await in the pipeline then run on libuv instead of the selector loop.
+
+    Returns:
+        True if uvloop was installed
+    """
+    if not Config.UVLOOP_ENABLED:
+        return False
+
+    try:
+        import uvloop
+    except ImportError:  # uvloop is optional; keep the default loop
+        logger.warning("UVLOOP_ENABLED is set but uvloop is not installed")
+        return False
+
+    uvloop.install()
+    return True
+
+
 async def load_active_markets(markets_file: str = "data/active_markets.json"):
     """
     Load active markets from JSON file.
@@ -225,9 +249,6 @@ async def main():
                 yes_token = market['token_id_yes']
                 no_token = market['token_id_no']
 
-                await ws_client.subscribe(yes_token)
-                await ws_client.subscribe(no_token)
-
                 token_pairs.append({
                     'market_id': market['market_id'],
                     'question': market['question'],
@@ -238,6 +259,11 @@ async def main():
                 if i <= 5 or i % 10 == 0:  # Log first 5 and every 10th
                     logger.info(f"   [{i}/{len(markets)}] {market['question'][:50]}...")
 
+            # One subscription frame for every token
+            await ws_client.subscribe_many(
+                token for pair in token_pairs for token in (pair['yes_token'], pair['no_token'])
+            )
+
             logger.success(f"✅ Subscribed to {len(token_pairs)} markets ({len(token_pairs)*2} tokens)")
         else:
             # Fallback to example tokens
@@ -247,9 +273,7 @@ async def main():
                 "3074539347152748632858978545166555332546941892131779352477699494423276162345",  # NO
             ]
 
-            for token_id in example_tokens:
-                await ws_client.subscribe(token_id)
-                logger.info(f"已订阅 {token_id}")
+            await ws_client.subscribe_many(example_tokens)
 
             token_pairs = [{
                 'market_id': 'example',
@@ -350,7 +374,7 @@ async def main():
                                     await recorder.record_event("fill", no_fill.to_dict())
 
                                     # Process fills through PnL tracker
-                                    pnl_update = await pnl_tracker.process_fills(
+                                    pnl_update = pnl_tracker.process_fills_sync(
                                         fills=[yes_fill, no_fill],
                                         expected_edge=opportunity.expected_profit,
                                         trace_id=trace_id,
@@ -394,7 +418,7 @@ async def main():
                                     await recorder.record_event("fill", no_fill.to_dict())
 
                                     # Process fills through PnL tracker
-                                    pnl_update = await pnl_tracker.process_fills(
+                                    pnl_update = pnl_tracker.process_fills_sync(
                                         fills=[yes_fill, no_fill],
                                         expected_edge=opportunity.expected_profit,
                                         trace_id=trace_id,
@@ -473,11 +497,15 @@ async def main():
         await recorder.flush()
         logger.info("事件记录器已刷新")
 
+        # Drain queued latency metrics to disk
+        await close_metrics_log()
+
         await ws_client.disconnect()
         logger.info("已断开与 Polymarket WebSocket 的连接")
 
 
 if __name__ == "__main__":
+    install_uvloop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
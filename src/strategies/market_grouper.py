@@ -4,13 +4,25 @@ Market Grouper - Groups related outcome tokens by market.
 This module handles fetching market metadata from Polymarket and grouping
 tokens that belong to the same market (e.g., all outcomes in an election).
 """
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+from collections import deque
 from datetime import datetime
+import asyncio
+import time
 import aiohttp
+from loguru import logger
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; responses decode with json
+    orjson = None
 
 from src.core.models import Outcome, MarketMetadata
 
 
+logger = logger.bind(context="market_grouper")
+
+
 class MarketGrouper:
     """
     Groups tokens by market and fetches market metadata.
@@ -22,16 +34,83 @@ class MarketGrouper:
     - Identifying binary vs multi-outcome markets
     """
 
-    def __init__(self, polymarket_api_url: str = "https://api.polymarket.com"):
+    def __init__(
+        self,
+        polymarket_api_url: str = "https://api.polymarket.com",
+        session: Optional[aiohttp.ClientSession] = None,
+        max_concurrent_fetches: int = 20,
+        cache_ttl_seconds: Optional[float] = 300.0,
+    ):
         """
         Initialize the market grouper.
 
         Args:
             polymarket_api_url: Base URL for Polymarket API
+            session: Optional shared HTTP session. If omitted, a pooled
+                keep-alive session is created on first use and owned by
+                this grouper.
+            max_concurrent_fetches: Maximum metadata requests in flight
+                while grouping tokens
+            cache_ttl_seconds: How long cached metadata stays valid, based
+                on MarketMetadata.last_fetched (None disables expiry)
         """
         self.polymarket_api_url = polymarket_api_url
+        self.max_concurrent_fetches = max_concurrent_fetches
+        self.cache_ttl_seconds = cache_ttl_seconds
         self.market_cache: Dict[str, MarketMetadata] = {}
         self.token_to_market_cache: Dict[str, str] = {}
+        self._etags: Dict[str, str] = {}  # market_id -> ETag of cached payload
+        self._session = session
+        self._owns_session = session is None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Cleared once the API answers 404/405 for the batch endpoint
+        self._batch_supported = True
+
+    async def __aenter__(self):
+        """Enter async context."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the owned HTTP session on exit."""
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the HTTP session, creating a pooled one on first use.
+
+        Returns:
+            Shared aiohttp ClientSession
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=30,
+                keepalive_timeout=75,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._owns_session = True
+        return self._session
+
+    async def close(self) -> None:
+        """Close the HTTP session if it was created by this grouper."""
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+        self._session = None
+
+    @staticmethod
+    async def _read_json(response: aiohttp.ClientResponse) -> Any:
+        """
+        Decode a JSON response body, using orjson when available.
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            Decoded JSON payload
+        """
+        if orjson is not None:
+            return await response.json(loads=orjson.loads)
+        return await response.json()
 
     def get_cached_markets(self) -> Dict[str, MarketMetadata]:
         """
@@ -42,40 +121,44 @@ class MarketGrouper:
         """
         return self.market_cache.copy()
 
-    async def fetch_market_metadata(self, token_id: str) -> MarketMetadata:
+    def _get_cached_metadata(
+        self, token_id: str, allow_expired: bool = False
+    ) -> Optional[MarketMetadata]:
         """
-        Fetch market metadata for a given token.
+        Get cached metadata for a token if present and not expired.
 
         Args:
             token_id: Token identifier
+            allow_expired: Return the entry even if it is older than the TTL
 
         Returns:
-            MarketMetadata object
-
-        Raises:
-            Exception: If API request fails
+            Cached MarketMetadata, or None on a miss or expired entry
         """
-        # Check if token is in cache
-        if token_id in self.token_to_market_cache:
-            market_id = self.token_to_market_cache[token_id]
-            if market_id in self.market_cache:
-                return self.market_cache[market_id]
+        market_id = self.token_to_market_cache.get(token_id)
+        if market_id is None:
+            return None
 
-        # Fetch from Polymarket API
-        url = f"{self.polymarket_api_url}/tokens/{token_id}/market"
+        metadata = self.market_cache.get(market_id)
+        if metadata is None or allow_expired:
+            return metadata
 
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        raise Exception(
-                            f"Failed to fetch market metadata: HTTP {response.status}"
-                        )
-
-                    data = await response.json()
-        except Exception as e:
-            raise Exception(f"Failed to fetch market metadata: {e}")
+        if self.cache_ttl_seconds is not None:
+            age_ms = int(time.time() * 1000) - metadata.last_fetched
+            if age_ms > self.cache_ttl_seconds * 1000:
+                return None
+
+        return metadata
+
+    def _parse_market_metadata(self, data: Dict[str, Any]) -> MarketMetadata:
+        """
+        Build MarketMetadata from an API market payload.
+
+        Args:
+            data: Market payload returned by the Polymarket API
 
+        Returns:
+            MarketMetadata object
+        """
         # Parse outcomes
         outcomes_data = data.get("outcomes", [])
         outcomes = [
@@ -95,8 +178,7 @@ class MarketGrouper:
             except (ValueError, AttributeError):
                 pass
 
-        # Create market metadata
-        metadata = MarketMetadata(
+        return MarketMetadata(
             market_id=data["market_id"],
             title=data["title"],
             question=data["question"],
@@ -106,21 +188,198 @@ class MarketGrouper:
             end_date=end_date,
         )
 
-        # Cache the metadata
-        self.market_cache[metadata.market_id] = metadata
+    def _cache_metadata(
+        self, metadata: MarketMetadata, etag: Optional[str] = None
+    ) -> None:
+        """
+        Cache market metadata and map all of its outcome tokens.
 
-        # Cache token -> market mapping for all tokens in this market
+        Args:
+            metadata: Market metadata to cache
+            etag: ETag of the response the metadata came from, if any
+        """
+        self.market_cache[metadata.market_id] = metadata
+        if etag is not None:
+            self._etags[metadata.market_id] = etag
+        else:
+            self._etags.pop(metadata.market_id, None)
         for token_id_in_market in metadata.outcome_token_ids:
             self.token_to_market_cache[token_id_in_market] = metadata.market_id
 
+    async def fetch_market_metadata(self, token_id: str) -> MarketMetadata:
+        """
+        Fetch market metadata for a given token.
+
+        Concurrent calls for the same uncached token share a single
+        in-flight request. If the caller that started it is cancelled, a
+        waiting caller starts a new request instead of being cancelled too.
+
+        Args:
+            token_id: Token identifier
+
+        Returns:
+            MarketMetadata object
+
+        Raises:
+            Exception: If API request fails
+        """
+        while True:
+            # Check if token is in cache (and still fresh)
+            cached = self._get_cached_metadata(token_id)
+            if cached is not None:
+                return cached
+
+            # Join an in-flight request for the same token
+            inflight = self._inflight.get(token_id)
+            if inflight is None:
+                break
+            try:
+                # Shielded: a cancelled waiter must not cancel the shared request
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise  # This waiter itself was cancelled
+                # The leading caller was cancelled: retry, possibly as leader
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[token_id] = future
+        try:
+            metadata = await self._fetch_remote(token_id)
+        except asyncio.CancelledError:
+            if not future.done():
+                future.cancel()
+            raise
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+                # Mark as retrieved so a failure with no other waiters is not logged
+                future.exception()
+            raise
+        else:
+            if not future.done():
+                future.set_result(metadata)
+            return metadata
+        finally:
+            del self._inflight[token_id]
+
+    async def _fetch_remote(self, token_id: str) -> MarketMetadata:
+        """
+        Fetch and cache market metadata for a token from the API.
+
+        If an expired cache entry has an ETag, the request is made
+        conditional; on 304 Not Modified the cached metadata is reused
+        without reading the body.
+
+        Args:
+            token_id: Token identifier
+
+        Returns:
+            MarketMetadata object
+
+        Raises:
+            Exception: If API request fails
+        """
+        url = f"{self.polymarket_api_url}/tokens/{token_id}/market"
+
+        # Revalidate an expired entry instead of downloading it again
+        stale = self._get_cached_metadata(token_id, allow_expired=True)
+        etag = self._etags.get(stale.market_id) if stale is not None else None
+
+        try:
+            session = self._get_session()
+            if etag is not None:
+                request = session.get(url, headers={"If-None-Match": etag})
+            else:
+                request = session.get(url)
+            async with request as response:
+                if response.status == 304 and etag is not None:
+                    data = None
+                elif response.status != 200:
+                    raise Exception(
+                        f"Failed to fetch market metadata: HTTP {response.status}"
+                    )
+                else:
+                    data = await self._read_json(response)
+                    etag = response.headers.get("ETag")
+        except Exception as e:
+            raise Exception(f"Failed to fetch market metadata: {e}")
+
+        if data is None:
+            # Not modified: restart the TTL on the cached metadata
+            metadata = stale.model_copy(
+                update={"last_fetched": int(time.time() * 1000)}
+            )
+        else:
+            metadata = self._parse_market_metadata(data)
+        self._cache_metadata(metadata, etag)
+
+        # Also map the queried token, in case the API resolved an alias
+        self.token_to_market_cache[token_id] = metadata.market_id
+
         return metadata
 
+    async def fetch_market_metadata_batch(
+        self, token_ids: List[str]
+    ) -> List[MarketMetadata]:
+        """
+        Fetch market metadata for several tokens in a single request.
+
+        All returned markets are cached, including the token mapping for
+        every outcome token in each market.
+
+        Args:
+            token_ids: Token identifiers to look up
+
+        Returns:
+            List of MarketMetadata objects (one per distinct market)
+
+        Raises:
+            Exception: If API request fails
+        """
+        if not token_ids:
+            return []
+
+        url = f"{self.polymarket_api_url}/markets/batch"
+        params = {"token_ids": ",".join(token_ids)}
+
+        try:
+            session = self._get_session()
+            async with session.get(url, params=params) as response:
+                if response.status in (404, 405):
+                    # Endpoint not offered: stop paying for the round trip
+                    self._batch_supported = False
+                    logger.warning(
+                        f"Batch metadata endpoint unavailable (HTTP {response.status}); "
+                        "using per-token requests"
+                    )
+                if response.status != 200:
+                    raise Exception(
+                        f"Failed to fetch market metadata batch: HTTP {response.status}"
+                    )
+
+                data = await self._read_json(response)
+        except Exception as e:
+            raise Exception(f"Failed to fetch market metadata batch: {e}")
+
+        markets = []
+        for market_data in data:
+            metadata = self._parse_market_metadata(market_data)
+            self._cache_metadata(metadata)
+            markets.append(metadata)
+
+        return markets
+
     async def group_tokens_by_market(
         self, token_ids: List[str]
     ) -> Dict[str, List[str]]:
         """
         Group tokens by their market_id.
 
+        Uncached tokens are fetched by a pool of max_concurrent_fetches
+        workers. A token is skipped if a sibling outcome's market was
+        already fetched by the time a worker picks it up. Siblings picked
+        up while that fetch is still in flight cost their own request.
+
         Args:
             token_ids: List of token identifiers
 
@@ -130,27 +389,80 @@ class MarketGrouper:
         if not token_ids:
             return {}
 
-        groups: Dict[str, List[str]] = {}
+        # Deduplicate while preserving input order
+        unique_token_ids = list(dict.fromkeys(token_ids))
 
-        for token_id in token_ids:
+        # Resolve cached tokens directly; fetch the rest
+        token_markets: Dict[str, str] = {}
+        to_fetch = self._resolve_cached(unique_token_ids, token_markets)
+
+        # Prefer one batch request, then fall back to per-token fetches
+        # for anything the batch endpoint did not resolve
+        if len(to_fetch) > 1 and self._batch_supported:
             try:
-                metadata = await self.fetch_market_metadata(token_id)
-                market_id = metadata.market_id
+                await self.fetch_market_metadata_batch(to_fetch)
+            except Exception as e:
+                logger.warning(f"{e}; falling back to per-token requests")
+            else:
+                to_fetch = self._resolve_cached(to_fetch, token_markets)
 
-                if market_id not in groups:
-                    groups[market_id] = []
+        if to_fetch:
+            pending = deque(to_fetch)
 
-                # Add token to group if not already present
-                if token_id not in groups[market_id]:
-                    groups[market_id].append(token_id)
+            async def fetch_worker() -> None:
+                while pending:
+                    token_id = pending.popleft()
 
-            except Exception as e:
-                # Skip tokens that fail to fetch
-                # Log warning in production
-                continue
+                    # Already resolved through a sibling outcome's market
+                    # (only once that sibling's fetch has completed)
+                    if token_id in token_markets:
+                        continue
+
+                    try:
+                        metadata = await self.fetch_market_metadata(token_id)
+                    except Exception:
+                        # Skip tokens that fail to fetch
+                        # Log warning in production
+                        continue
+
+                    token_markets[token_id] = metadata.market_id
+                    for sibling_id in metadata.outcome_token_ids:
+                        token_markets.setdefault(sibling_id, metadata.market_id)
+
+            # A fixed pool of workers bounds the number of requests in flight
+            worker_count = min(self.max_concurrent_fetches, len(to_fetch))
+            await asyncio.gather(*(fetch_worker() for _ in range(worker_count)))
+
+        groups: Dict[str, List[str]] = {}
+        for token_id in unique_token_ids:
+            market_id = token_markets.get(token_id)
+            if market_id is not None:
+                groups.setdefault(market_id, []).append(token_id)
 
         return groups
 
+    def _resolve_cached(
+        self, token_ids: List[str], token_markets: Dict[str, str]
+    ) -> List[str]:
+        """
+        Resolve tokens whose market is already cached and fresh.
+
+        Args:
+            token_ids: Token identifiers to resolve
+            token_markets: Mapping updated in place with resolved token -> market_id
+
+        Returns:
+            Token identifiers that are not cached yet
+        """
+        missing: List[str] = []
+        for token_id in token_ids:
+            cached = self._get_cached_metadata(token_id)
+            if cached is not None:
+                token_markets[token_id] = cached.market_id
+            else:
+                missing.append(token_id)
+        return missing
+
     async def is_multi_outcome_market(self, token_id: str) -> bool:
         """
         Check if a token belongs to a multi-outcome market.
@@ -161,7 +473,10 @@ class MarketGrouper:
         Returns:
             True if market has 3+ outcomes, False if binary (2 outcomes)
         """
-        metadata = await self.fetch_market_metadata(token_id)
+        # Fresh cache hits skip the fetch coroutine entirely
+        metadata = self._get_cached_metadata(token_id)
+        if metadata is None:
+            metadata = await self.fetch_market_metadata(token_id)
         return not metadata.is_binary
 
     async def get_market_outcomes(self, token_id: str) -> List[Outcome]:
@@ -174,5 +489,7 @@ class MarketGrouper:
         Returns:
             List of Outcome objects
         """
-        metadata = await self.fetch_market_metadata(token_id)
+        metadata = self._get_cached_metadata(token_id)
+        if metadata is None:
+            metadata = await self.fetch_market_metadata(token_id)
         return metadata.outcomes
@@ -113,12 +113,14 @@ class MarketMakingStrategy:
             token_id=token_id,
             size_usdc=self.config.TRADE_SIZE,
             side=Side.BUY,
+            metrics=inventory_metrics,
         )
 
         can_ask, ask_reason = self.inventory_manager.can_open_position(
             token_id=token_id,
             size_usdc=self.config.TRADE_SIZE,
             side=Side.SELL,
+            metrics=inventory_metrics,
         )
 
         if not can_bid or not can_ask:
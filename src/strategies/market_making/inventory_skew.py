@@ -228,6 +228,7 @@ class InventoryManager:
         token_id: str,
         size_usdc: Decimal,
         side: Side,
+        metrics: Optional[InventoryMetrics] = None,
     ) -> tuple[bool, Optional[str]]:
         """
         Check if position can be opened within risk limits.
@@ -236,16 +237,19 @@ class InventoryManager:
             token_id: Token identifier
             size_usdc: Position size in USDC
             side: Trade side
+            metrics: Current inventory metrics, if already computed by the
+                caller (avoids rescanning all positions)
 
         Returns:
             Tuple of (allowed, rejection_reason)
         """
-        metrics = self.get_metrics()
-
-        # Check individual position limit
+        # Check individual position limit (needs no inventory scan)
         if size_usdc > self.max_position_size:
             return False, f"Position size ${size_usdc} exceeds limit ${self.max_position_size}"
 
+        if metrics is None:
+            metrics = self.get_metrics()
+
         # Check total exposure limit
         new_gross = metrics.gross_exposure + size_usdc
         if new_gross > self.max_total_exposure:
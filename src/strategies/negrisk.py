@@ -6,8 +6,9 @@ outcome can occur (e.g., "Who will win the election?").
 
 Strategy: If Sum(YES prices) < 1.0 - fees - gas, buy all YES positions.
 """
+from collections import OrderedDict
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import ClassVar, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from src.core.models import (
@@ -19,6 +20,43 @@ from src.core.models import (
     VWAPResult,
 )
 
+# Shared Decimal zero (avoids re-parsing Decimal("0") on every call)
+_ZERO = Decimal("0")
+
+
+def _fill_ladder(asks: List[Ask], trade_size: Decimal) -> Tuple[Decimal, Decimal, bool]:
+    """
+    Walk an ask ladder until trade_size USDC is spent.
+
+    Args:
+        asks: Ask orders sorted by price (lowest first)
+        trade_size: Target trade size in USDC
+
+    Returns:
+        Tuple of (USDC spent, tokens bought, whether trade_size was filled)
+    """
+    remaining_usdc = trade_size
+    if remaining_usdc <= 0:
+        return _ZERO, _ZERO, remaining_usdc == 0
+
+    # One comparison per level: whole levels are taken until one covers the
+    # rest. The spent amount is trade_size - remaining_usdc, so it is not
+    # accumulated separately.
+    total_tokens = _ZERO
+    for order in asks:
+        price = order.price
+        level_value = order.size * price
+
+        if level_value >= remaining_usdc:
+            # This order can fill the remaining size
+            return trade_size, total_tokens + remaining_usdc / price, True
+
+        # Take entire order and move to next level
+        total_tokens += order.size
+        remaining_usdc -= level_value
+
+    return trade_size - remaining_usdc, total_tokens, False
+
 
 class NegRiskStrategy:
     """
@@ -35,12 +73,17 @@ class NegRiskStrategy:
     - Guaranteed profit: $1.00 - $0.98 - fees - gas
     """
 
+    # Payout of a one-share-per-outcome basket: exactly one outcome pays $1.00
+    TOTAL_PAYOUT: ClassVar[Decimal] = Decimal("1.0")
+    _ONE: ClassVar[Decimal] = Decimal("1")
+
     def __init__(
         self,
         fee_rate: Decimal = Decimal("0.0035"),  # 0.35% default
         min_profit_threshold: Decimal = Decimal("0.005"),  # 0.5% default
         trade_size: Decimal = Decimal("10.0"),  # $10 USDC per token
         gas_estimate: Decimal = Decimal("0.0"),  # Gas cost in USDC
+        signal_cache_size: int = 4096,
     ):
         """
         Initialize the NegRisk strategy.
@@ -50,11 +93,28 @@ class NegRiskStrategy:
             min_profit_threshold: Minimum profit percentage to trigger trade
             trade_size: USDC amount to trade per token (e.g., $10)
             gas_estimate: Estimated gas cost in USDC
+            signal_cache_size: Maximum number of cached check_opportunity
+                results (LRU)
         """
         self.fee_rate = fee_rate
         self.min_profit_threshold = min_profit_threshold
         self.trade_size = trade_size
         self.gas_estimate = gas_estimate
+        self.signal_cache_size = signal_cache_size
+        # (market_id, strategy parameters, (last_update, version) per outcome)
+        # -> (order books, result)
+        self._signal_cache: OrderedDict = OrderedDict()
+
+    @property
+    def fee_rate(self) -> Decimal:
+        """Trading fee rate."""
+        return self._fee_rate
+
+    @fee_rate.setter
+    def fee_rate(self, value: Decimal) -> None:
+        self._fee_rate = value
+        # Cost including fees is cost * (1 + fee_rate): one multiply per use
+        self._fee_multiplier = self._ONE + value
 
     def _calculate_vwap(self, asks: List[Ask], trade_size: Decimal, token_id: str) -> VWAPResult:
         """
@@ -74,44 +134,20 @@ class NegRiskStrategy:
         if not asks:
             return VWAPResult(
                 token_id=token_id,
-                vwap_price=Decimal("0"),
-                vwap_cost=Decimal("0"),
-                shares=Decimal("0"),
+                vwap_price=_ZERO,
+                vwap_cost=_ZERO,
+                shares=_ZERO,
                 trade_size=trade_size,
                 filled=False,
             )
 
-        remaining_usdc = trade_size
-        total_cost = Decimal("0")
-        total_tokens = Decimal("0")
-
-        for order in asks:
-            if remaining_usdc <= 0:
-                break
-
-            # Calculate USDC value available at this price level
-            level_value = order.size * order.price
-
-            if level_value >= remaining_usdc:
-                # This order can fill the remaining size
-                tokens_needed = remaining_usdc / order.price
-                total_cost += remaining_usdc
-                total_tokens += tokens_needed
-                remaining_usdc = Decimal("0")
-                break
-            else:
-                # Take entire order and move to next level
-                total_cost += level_value
-                total_tokens += order.size
-                remaining_usdc -= level_value
-
-        filled = remaining_usdc == 0
+        total_cost, total_tokens, filled = _fill_ladder(asks, trade_size)
 
         if not filled:
             # Return partial fill result
             return VWAPResult(
                 token_id=token_id,
-                vwap_price=total_cost / total_tokens if total_tokens > 0 else Decimal("0"),
+                vwap_price=total_cost / total_tokens if total_tokens > 0 else _ZERO,
                 vwap_cost=total_cost,
                 shares=total_tokens,
                 trade_size=trade_size,
@@ -145,13 +181,11 @@ class NegRiskStrategy:
         Returns:
             Dictionary mapping token_id to VWAPResult
         """
-        results: Dict[str, VWAPResult] = {}
-
-        for token_id, order_book in order_books.items():
-            vwap_result = self._calculate_vwap(order_book.asks, trade_size, token_id)
-            results[token_id] = vwap_result
-
-        return results
+        calculate_vwap = self._calculate_vwap
+        return {
+            token_id: calculate_vwap(order_book.asks, trade_size, token_id)
+            for token_id, order_book in order_books.items()
+        }
 
     def calculate_profit(
         self,
@@ -169,15 +203,8 @@ class NegRiskStrategy:
             Expected profit in USDC
         """
         # Payout = num_tokens * $1.00 (one winner pays $1 for each token)
-        total_payout = Decimal(str(num_tokens))
-
-        # Calculate fees
-        fees = total_cost * self.fee_rate
-
-        # Profit = payout - cost - fees - gas
-        profit = total_payout - total_cost - fees - self.gas_estimate
-
-        return profit
+        # Profit = payout - cost * (1 + fee_rate) - gas
+        return Decimal(num_tokens) - total_cost * self._fee_multiplier - self.gas_estimate
 
     def check_threshold(self, profit: Decimal, total_investment: Decimal) -> bool:
         """
@@ -190,11 +217,11 @@ class NegRiskStrategy:
         Returns:
             True if profit meets threshold, False otherwise
         """
-        if profit <= 0:
+        if profit <= 0 or total_investment <= 0:
             return False
 
-        profit_percentage = profit / total_investment
-        return profit_percentage >= self.min_profit_threshold
+        # profit / total_investment >= threshold, without the division
+        return profit >= self.min_profit_threshold * total_investment
 
     def check_opportunity(
         self,
@@ -204,6 +231,14 @@ class NegRiskStrategy:
         """
         Check if a NegRisk arbitrage opportunity exists.
 
+        Results are cached per market, strategy parameters and order book
+        versions: a repeated call with the same OrderBook objects, unchanged
+        since the last call (same last_update and version), returns the
+        previous result without re-evaluating. Code that mutates a book in
+        place must call OrderBook.mark_changed(). A cached signal is returned
+        as a shallow copy with a fresh timestamp; its opportunities are
+        shared with earlier results and must be treated as read-only.
+
         Args:
             market_metadata: Market metadata including outcomes
             order_books: Dictionary mapping token_id to OrderBook
@@ -215,29 +250,80 @@ class NegRiskStrategy:
         if market_metadata.is_binary:
             return None
 
-        # Check that we have order books for all tokens
+        # Fewer than two outcomes cannot form a NegRisk basket
         token_ids = market_metadata.outcome_token_ids
+        if len(token_ids) < 2:
+            return None
+
+        # Check that we have order books for all tokens
         if not all(token_id in order_books for token_id in token_ids):
             return None
 
-        # Calculate VWAP for each token
-        # We want to buy equal shares of each token (e.g., 1 share each)
-        # So we calculate cost to buy 1 share of each
-        shares_per_token = Decimal("1.0")
+        books = tuple(order_books[token_id] for token_id in token_ids)
+        key = (
+            market_metadata.market_id,
+            self._fee_rate,
+            self.min_profit_threshold,
+            self.trade_size,
+            self.gas_estimate,
+            tuple((book.last_update, book.version) for book in books),
+        )
+        cached = self._signal_cache.get(key)
+        if cached is not None:
+            cached_books, cached_signal = cached
+            if all(a is b for a, b in zip(cached_books, books)):
+                self._signal_cache.move_to_end(key)
+                if cached_signal is None:
+                    return None
+                return cached_signal.model_copy(update={"timestamp": datetime.now()})
+
+        signal = self._evaluate_opportunity(market_metadata, order_books)
+
+        self._signal_cache[key] = (books, signal)
+        self._signal_cache.move_to_end(key)
+        if len(self._signal_cache) > self.signal_cache_size:
+            self._signal_cache.popitem(last=False)
 
-        total_cost = Decimal("0")
-        opportunities: List[TokenOpportunity] = []
+        return signal
 
-        for outcome in market_metadata.outcomes:
-            order_book = order_books[outcome.token_id]
+    def _evaluate_opportunity(
+        self,
+        market_metadata: MarketMetadata,
+        order_books: Dict[str, OrderBook],
+    ) -> Optional[NegRiskSignal]:
+        """
+        Evaluate a NegRisk opportunity without consulting the cache.
 
-            if not order_book.asks:
-                return None
+        Args:
+            market_metadata: Multi-outcome market metadata
+            order_books: Dictionary mapping token_id to OrderBook (all present)
 
-            best_ask = order_book.get_best_ask()
-            if not best_ask:
+        Returns:
+            NegRiskSignal if profitable opportunity exists, None otherwise
+        """
+        # Top-of-book prefilter: buying one share of each outcome at its best
+        # ask cannot profit if the prices plus fees and gas already reach the
+        # $1.00 payout, so skip building the opportunities in that case
+        best_asks: List[Ask] = []
+        price_sum = _ZERO
+        for outcome in market_metadata.outcomes:
+            best_ask = order_books[outcome.token_id].get_best_ask()
+            if best_ask is None:
                 return None
+            best_asks.append(best_ask)
+            price_sum += best_ask.price
+
+        if price_sum * self._fee_multiplier + self.gas_estimate >= self.TOTAL_PAYOUT:
+            return None
+
+        # We want to buy equal shares of each token (e.g., 1 share each)
+        # So we calculate cost to buy 1 share of each
+        shares_per_token = self._ONE
+
+        total_cost = _ZERO
+        opportunities: List[TokenOpportunity] = []
 
+        for outcome, best_ask in zip(market_metadata.outcomes, best_asks):
             # Cost to buy 1 share at best ask
             cost = best_ask.price * shares_per_token
             total_cost += cost
@@ -254,7 +340,7 @@ class NegRiskStrategy:
 
         # Calculate profit
         # Payout = $1.00 (since we buy 1 share of each token, and exactly one will win)
-        total_payout = Decimal("1.0")
+        total_payout = self.TOTAL_PAYOUT
 
         # Fees
         fees = total_cost * self.fee_rate
@@ -0,0 +1,31 @@
+"""
+Shared pytest fixtures.
+"""
+import logging
+import os
+
+# Test-only: no pydantic plugins are used, so skip plugin discovery in every
+# worker. Must be set before pydantic builds any model. Production keeps the
+# defaults.
+os.environ.setdefault("PYDANTIC_DISABLE_PLUGINS", "__all__")
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def quiet_pydantic_logging():
+    """Only surface pydantic errors in test logs (test-only)."""
+    logging.getLogger("pydantic").setLevel(logging.ERROR)
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Under xdist, run tests marked heavy first so short tests fill in behind them.
+
+    Serial runs keep collection order, so module-scoped fixtures are built
+    once per module.
+    """
+    if not hasattr(config, "workerinput"):  # Not an xdist worker
+        return
+    items.sort(key=lambda item: item.get_closest_marker("heavy") is None)
+
@@ -2,6 +2,7 @@
 Unit tests for Event Replayer module.
 """
 import pytest
+import io
 import json
 import asyncio
 from datetime import date, datetime
@@ -56,6 +57,20 @@ def sample_events():
     ]
 
 
+@pytest.fixture(scope="module")
+def replayer_factory():
+    """Build fast-forward replayers bound to a given event directory."""
+    def _make(base_dir):
+        return EventReplayer(base_dir=base_dir)
+    return _make
+
+
+@pytest.fixture
+def sample_events_bytes(sample_events):
+    """Encode sample events as an in-memory JSONL blob."""
+    return b"".join(json.dumps(event).encode() + b"\n" for event in sample_events)
+
+
 class TestEventReplayerInit:
     """Test suite for EventReplayer initialization."""
 
@@ -97,7 +112,7 @@ class TestLoadEvents:
     """Test suite for load_events method."""
 
     @pytest.mark.asyncio
-    async def test_load_events_from_file(self, temp_event_dir, sample_events):
+    async def test_load_events_from_file(self, replayer_factory, temp_event_dir, sample_events):
         """Test loading events from file."""
         # Create event file
         event_file = temp_event_dir / "2026-02-01.jsonl"
@@ -106,7 +121,7 @@ class TestLoadEvents:
                 f.write(json.dumps(event) + "\n")
 
         # Load events
-        replayer = EventReplayer(base_dir=temp_event_dir)
+        replayer = replayer_factory(temp_event_dir)
         events = await replayer.load_events(event_file)
 
         assert len(events) == 3
@@ -114,7 +129,26 @@ class TestLoadEvents:
         assert events[1]["event_type"] == EventType.SIGNAL.value
 
     @pytest.mark.asyncio
-    async def test_load_events_sorts_by_timestamp(self, temp_event_dir):
+    async def test_load_events_from_bytes(self, sample_events_bytes):
+        """Test loading events from an in-memory JSONL blob."""
+        replayer = EventReplayer()
+        events = await replayer.load_events(sample_events_bytes)
+
+        assert len(events) == 3
+        assert events[0]["event_type"] == EventType.ORDERBOOK_SNAPSHOT.value
+        assert events[1]["event_type"] == EventType.SIGNAL.value
+
+    @pytest.mark.asyncio
+    async def test_load_events_from_file_like(self, sample_events_bytes):
+        """Test loading events from a file-like object."""
+        replayer = EventReplayer()
+        events = await replayer.load_events(io.BytesIO(sample_events_bytes))
+
+        assert len(events) == 3
+        assert events[2]["data"]["token_id"] == "token_2"
+
+    @pytest.mark.asyncio
+    async def test_load_events_sorts_by_timestamp(self):
         """Test that loaded events are sorted by timestamp."""
         # Create events with out-of-order timestamps
         events = [
@@ -135,22 +169,19 @@ class TestLoadEvents:
             },
         ]
 
-        event_file = temp_event_dir / "2026-02-01.jsonl"
-        with open(event_file, "w") as f:
-            for event in events:
-                f.write(json.dumps(event) + "\n")
+        blob = "".join(json.dumps(event) + "\n" for event in events)
 
-        replayer = EventReplayer(base_dir=temp_event_dir)
-        loaded = await replayer.load_events(event_file)
+        replayer = EventReplayer()
+        loaded = await replayer.load_events(io.StringIO(blob))
 
         assert loaded[0]["timestamp"] == "2026-02-01T10:00:00"
         assert loaded[1]["timestamp"] == "2026-02-01T10:01:00"
         assert loaded[2]["timestamp"] == "2026-02-01T10:02:00"
 
     @pytest.mark.asyncio
-    async def test_load_events_nonexistent_file(self, temp_event_dir):
+    async def test_load_events_nonexistent_file(self, replayer_factory, temp_event_dir):
         """Test loading from nonexistent file."""
-        replayer = EventReplayer(base_dir=temp_event_dir)
+        replayer = replayer_factory(temp_event_dir)
         event_file = temp_event_dir / "nonexistent.jsonl"
 
         events = await replayer.load_events(event_file)
@@ -162,14 +193,14 @@ class TestReplayDate:
     """Test suite for replay_date method."""
 
     @pytest.mark.asyncio
-    async def test_replay_date_yields_events(self, temp_event_dir, sample_events):
+    async def test_replay_date_yields_events(self, replayer_factory, temp_event_dir, sample_events):
         """Test replaying events from a date."""
         event_file = temp_event_dir / "2026-02-01.jsonl"
         with open(event_file, "w") as f:
             for event in sample_events:
                 f.write(json.dumps(event) + "\n")
 
-        replayer = EventReplayer(base_dir=temp_event_dir)
+        replayer = replayer_factory(temp_event_dir)
         events = []
 
         async for event in replayer.replay_date(date(2026, 2, 1)):
@@ -178,14 +209,14 @@ class TestReplayDate:
         assert len(events) == 3
 
     @pytest.mark.asyncio
-    async def test_replay_date_with_filter(self, temp_event_dir, sample_events):
+    async def test_replay_date_with_filter(self, replayer_factory, temp_event_dir, sample_events):
         """Test replaying with event filter."""
         event_file = temp_event_dir / "2026-02-01.jsonl"
         with open(event_file, "w") as f:
             for event in sample_events:
                 f.write(json.dumps(event) + "\n")
 
-        replayer = EventReplayer(base_dir=temp_event_dir)
+        replayer = replayer_factory(temp_event_dir)
 
         # Filter for only ORDERBOOK_SNAPSHOT events
         def orderbook_filter(event):
@@ -199,14 +230,16 @@ class TestReplayDate:
         assert all(e["event_type"] == EventType.ORDERBOOK_SNAPSHOT.value for e in events)
 
     @pytest.mark.asyncio
-    async def test_replay_date_with_progress_callback(self, temp_event_dir, sample_events):
+    async def test_replay_date_with_progress_callback(
+        self, replayer_factory, temp_event_dir, sample_events
+    ):
         """Test replaying with progress callback."""
         event_file = temp_event_dir / "2026-02-01.jsonl"
         with open(event_file, "w") as f:
             for event in sample_events:
                 f.write(json.dumps(event) + "\n")
 
-        replayer = EventReplayer(base_dir=temp_event_dir)
+        replayer = replayer_factory(temp_event_dir)
 
         progress_updates = []
 
@@ -220,19 +253,140 @@ class TestReplayDate:
         assert len(progress_updates) == 3
         assert progress_updates[-1] == (3, 3)  # Final update
 
+    @pytest.mark.asyncio
+    async def test_replay_date_final_progress_when_last_event_filtered(
+        self, replayer_factory, temp_event_dir, sample_events
+    ):
+        """Test that the final progress update fires even if the last event is filtered out."""
+        event_file = temp_event_dir / "2026-02-01.jsonl"
+        with open(event_file, "w") as f:
+            for event in sample_events:
+                f.write(json.dumps(event) + "\n")
+
+        replayer = replayer_factory(temp_event_dir)
+
+        progress_updates = []
+
+        async def progress_callback(current, total):
+            progress_updates.append((current, total))
+
+        def signal_filter(event):
+            return event["event_type"] == EventType.SIGNAL.value
+
+        events = [
+            event
+            async for event in replayer.replay_date(
+                date(2026, 2, 1), event_filter=signal_filter, progress_callback=progress_callback
+            )
+        ]
+
+        assert len(events) == 1
+        assert progress_updates[-1] == (3, 3)
+
+    @pytest.mark.asyncio
+    async def test_replay_date_progress_callback_is_coalesced(
+        self, replayer_factory, temp_event_dir
+    ):
+        """Test that progress updates are sampled for large replays."""
+        event_file = temp_event_dir / "2026-02-01.jsonl"
+        with open(event_file, "w") as f:
+            for i in range(1000):
+                event = {
+                    "event_type": "test",
+                    "timestamp": f"2026-02-01T10:{i // 60:02d}:{i % 60:02d}",
+                    "data": {},
+                }
+                f.write(json.dumps(event) + "\n")
+
+        replayer = replayer_factory(temp_event_dir)
+
+        progress_updates = []
+
+        async def progress_callback(current, total):
+            progress_updates.append((current, total))
+
+        count = 0
+        async for _ in replayer.replay_date(date(2026, 2, 1), progress_callback=progress_callback):
+            count += 1
+
+        assert count == 1000
+        assert len(progress_updates) == 100
+        assert progress_updates[0] == (10, 1000)
+        assert progress_updates[-1] == (1000, 1000)
+
+
+class TestReplayDateBatched:
+    """Test suite for replay_date_batched method."""
+
+    @pytest.mark.asyncio
+    async def test_replay_date_batched_yields_batches(
+        self, replayer_factory, temp_event_dir, sample_events
+    ):
+        """Test replaying events in fixed-size batches."""
+        event_file = temp_event_dir / "2026-02-01.jsonl"
+        with open(event_file, "w") as f:
+            for event in sample_events:
+                f.write(json.dumps(event) + "\n")
+
+        replayer = replayer_factory(temp_event_dir)
+        batches = []
+
+        async for batch in replayer.replay_date_batched(date(2026, 2, 1), batch_size=2):
+            batches.append(batch)
+
+        assert [len(b) for b in batches] == [2, 1]
+        assert batches[0][0]["timestamp"] == "2026-02-01T10:00:00"
+        assert batches[1][0]["timestamp"] == "2026-02-01T10:02:00"
+
+    @pytest.mark.asyncio
+    async def test_replay_date_batched_with_filter(
+        self, replayer_factory, temp_event_dir, sample_events
+    ):
+        """Test batched replay applies the event filter."""
+        event_file = temp_event_dir / "2026-02-01.jsonl"
+        with open(event_file, "w") as f:
+            for event in sample_events:
+                f.write(json.dumps(event) + "\n")
+
+        replayer = replayer_factory(temp_event_dir)
+
+        def signal_filter(event):
+            return event["event_type"] == EventType.SIGNAL.value
+
+        batches = []
+        async for batch in replayer.replay_date_batched(
+            date(2026, 2, 1), event_filter=signal_filter
+        ):
+            batches.append(batch)
+
+        assert len(batches) == 1
+        assert len(batches[0]) == 1
+        assert batches[0][0]["event_type"] == EventType.SIGNAL.value
+
+    @pytest.mark.asyncio
+    async def test_replay_date_batched_invalid_batch_size(self, replayer_factory, temp_event_dir):
+        """Test that a non-positive batch size is rejected."""
+        replayer = replayer_factory(temp_event_dir)
+
+        with pytest.raises(ValueError):
+            async for _ in replayer.replay_date_batched(date(2026, 2, 1), batch_size=0):
+                pass
+
 
 class TestReplayToken:
     """Test suite for replay_token method."""
 
     @pytest.mark.asyncio
-    async def test_replay_token_filters_events(self, temp_event_dir, sample_events):
+    async def test_replay_token_filters_events(
+        self, replayer_factory, temp_event_dir, sample_events
+    ):
         """Test replaying events for specific token."""
         event_file = temp_event_dir / "2026-02-01.jsonl"
         with open(event_file, "w") as f:
             for event in sample_events:
                 f.write(json.dumps(event) + "\n")
 
-        replayer = EventReplayer(base_dir=temp_event_dir)
+        replayer = replayer_factory(temp_event_dir)
 
         events = []
         async for event in replayer.replay_token(date(2026, 2, 1), "token_1"):
@@ -247,27 +401,27 @@ class TestCountEvents:
     """Test suite for count_events method."""
 
     @pytest.mark.asyncio
-    async def test_count_all_events(self, temp_event_dir, sample_events):
+    async def test_count_all_events(self, replayer_factory, temp_event_dir, sample_events):
         """Test counting all events."""
         event_file = temp_event_dir / "2026-02-01.jsonl"
         with open(event_file, "w") as f:
             for event in sample_events:
                 f.write(json.dumps(event) + "\n")
 
-        replayer = EventReplayer(base_dir=temp_event_dir)
+        replayer = replayer_factory(temp_event_dir)
         count = await replayer.count_events(date(2026, 2, 1))
 
         assert count == 3
 
     @pytest.mark.asyncio
-    async def test_count_events_by_type(self, temp_event_dir, sample_events):
+    async def test_count_events_by_type(self, replayer_factory, temp_event_dir, sample_events):
         """Test counting events by type."""
         event_file = temp_event_dir / "2026-02-01.jsonl"
         with open(event_file, "w") as f:
             for event in sample_events:
                 f.write(json.dumps(event) + "\n")
 
-        replayer = EventReplayer(base_dir=temp_event_dir)
+        replayer = replayer_factory(temp_event_dir)
 
         count = await replayer.count_events(date(2026, 2, 1), EventType.ORDERBOOK_SNAPSHOT)
 
@@ -278,14 +432,14 @@ class TestGetStatistics:
     """Test suite for get_statistics method."""
 
     @pytest.mark.asyncio
-    async def test_get_statistics(self, temp_event_dir, sample_events):
+    async def test_get_statistics(self, replayer_factory, temp_event_dir, sample_events):
         """Test getting statistics for date range."""
         event_file = temp_event_dir / "2026-02-01.jsonl"
         with open(event_file, "w") as f:
             for event in sample_events:
                 f.write(json.dumps(event) + "\n")
 
-        replayer = EventReplayer(base_dir=temp_event_dir)
+        replayer = replayer_factory(temp_event_dir)
         stats = await replayer.get_statistics(date(2026, 2, 1), date(2026, 2, 1))
 
         assert stats["total_events"] == 3
@@ -295,21 +449,79 @@ class TestGetStatistics:
         assert stats["order_results"] == 0
         assert "token_1" in stats["tokens"]
 
+    @pytest.mark.asyncio
+    async def test_get_statistics_counts_all_types(self, replayer_factory, temp_event_dir):
+        """Test that each known event type increments its own counter."""
+        events = [
+            {
+                "event_type": EventType.ORDER_REQUEST.value,
+                "timestamp": "2026-02-01T10:00:00",
+                "data": {},
+            },
+            {
+                "event_type": EventType.ORDER_RESULT.value,
+                "timestamp": "2026-02-01T10:00:01",
+                "data": {},
+            },
+            {
+                "event_type": EventType.ORDER_RESULT.value,
+                "timestamp": "2026-02-01T10:00:02",
+                "data": {},
+            },
+            {"event_type": "unknown", "timestamp": "2026-02-01T10:00:03", "data": {}},
+        ]
+        event_file = temp_event_dir / "2026-02-01.jsonl"
+        with open(event_file, "w") as f:
+            for event in events:
+                f.write(json.dumps(event) + "\n")
+
+        replayer = replayer_factory(temp_event_dir)
+        stats = await replayer.get_statistics(date(2026, 2, 1), date(2026, 2, 1))
+
+        assert stats["total_events"] == 4
+        assert stats["order_requests"] == 1
+        assert stats["order_results"] == 2
+        assert stats["orderbook_snapshots"] == 0
+        assert stats["tokens"] == []
+
 
 class TestFindOpportunities:
     """Test suite for find_opportunities method."""
 
     @pytest.mark.asyncio
-    async def test_find_opportunities(self, temp_event_dir, sample_events):
+    async def test_find_opportunities(self, replayer_factory, temp_event_dir, sample_events):
         """Test finding trading opportunities."""
         event_file = temp_event_dir / "2026-02-01.jsonl"
         with open(event_file, "w") as f:
             for event in sample_events:
                 f.write(json.dumps(event) + "\n")
 
-        replayer = EventReplayer(base_dir=temp_event_dir)
+        replayer = replayer_factory(temp_event_dir)
         opportunities = await replayer.find_opportunities(date(2026, 2, 1), min_profit=0.01)
 
         # Signal has 0.05 (5%) profit, which is >= 0.01 (1%)
         assert len(opportunities) == 1
         assert opportunities[0]["event_type"] == EventType.SIGNAL.value
+
+    @pytest.mark.asyncio
+    async def test_find_opportunities_below_threshold(
+        self, replayer_factory, temp_event_dir, sample_events
+    ):
+        """Test that signals below min_profit are excluded."""
+        event_file = temp_event_dir / "2026-02-01.jsonl"
+        with open(event_file, "w") as f:
+            for event in sample_events:
+                f.write(json.dumps(event) + "\n")
+
+        replayer = replayer_factory(temp_event_dir)
+        opportunities = await replayer.find_opportunities(date(2026, 2, 1), min_profit=0.10)
+
+        assert opportunities == []
+
+    @pytest.mark.asyncio
+    async def test_find_opportunities_nonexistent_file(self, replayer_factory, temp_event_dir):
+        """Test finding opportunities when no events were recorded."""
+        replayer = replayer_factory(temp_event_dir)
+        opportunities = await replayer.find_opportunities(date(2026, 2, 1))
+
+        assert opportunities == []
@@ -166,6 +166,34 @@ class TestCanOpenPosition:
         assert allowed is False
         assert "exceeds limit" in reason.lower()
 
+    @pytest.mark.asyncio
+    async def test_uses_precomputed_metrics(self):
+        """Test that caller-supplied metrics are used for exposure checks."""
+        manager = InventoryManager(
+            max_position_size=Decimal("500"),
+            max_total_exposure=Decimal("1000"),
+        )
+
+        metrics = InventoryMetrics(
+            total_long_exposure=Decimal("950"),
+            total_short_exposure=Decimal("0"),
+            net_exposure=Decimal("950"),
+            gross_exposure=Decimal("950"),
+            inventory_skew=Decimal("0.95"),
+            position_count=1,
+            utilization_pct=0.95,
+        )
+
+        allowed, reason = manager.can_open_position(
+            token_id="token_1",
+            size_usdc=Decimal("100"),
+            side=Side.BUY,
+            metrics=metrics,
+        )
+
+        assert allowed is False
+        assert "total exposure" in reason.lower()
+
 
 class TestClosePosition:
     """Test position closing."""
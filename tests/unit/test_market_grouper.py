@@ -4,6 +4,7 @@ Unit tests for Market Grouper.
 Tests are written FIRST (TDD methodology).
 The implementation should make these tests pass.
 """
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from datetime import datetime
@@ -13,19 +14,55 @@ from src.core.models import Outcome, MarketMetadata
 from src.strategies.market_grouper import MarketGrouper
 
 
-def create_mock_async_response(data: Dict[str, Any], status: int = 200):
+def create_mock_async_response(
+    data: Dict[str, Any], status: int = 200, headers: Dict[str, str] = None
+):
     """Helper to create a mock async HTTP response."""
     mock_response = AsyncMock()
     mock_response.status = status
+    mock_response.headers = headers or {}
     mock_response.json = AsyncMock(return_value=data)
 
     mock_ctx_mgr = AsyncMock()
     mock_ctx_mgr.__aenter__ = AsyncMock(return_value=mock_response)
-    mock_ctx_mgr.__aexit__ = AsyncMock()
+    mock_ctx_mgr.__aexit__ = AsyncMock(return_value=False)
 
     return mock_ctx_mgr
 
 
+def create_mock_session(response=None, side_effect=None):
+    """Helper to create a mock aiohttp session with a stubbed get()."""
+    mock_session = MagicMock()
+    mock_session.closed = False
+    mock_session.get = Mock(return_value=response, side_effect=side_effect)
+    mock_session.close = AsyncMock()
+    return mock_session
+
+
+class FakeFetch:
+    """
+    Lightweight async stand-in for MarketGrouper.fetch_market_metadata.
+
+    Cheaper per call than AsyncMock; records the token ids it was called
+    with so tests can still count fetches.
+    """
+
+    def __init__(self, side_effect=None, return_value=None):
+        self.side_effect = side_effect
+        self.return_value = return_value
+        self.calls = []
+
+    async def __call__(self, token_id):
+        self.calls.append(token_id)
+        if self.side_effect is not None:
+            return await self.side_effect(token_id)
+        return self.return_value
+
+    @property
+    def call_count(self) -> int:
+        return len(self.calls)
+
+
 class TestMarketGrouperInit:
     """Test suite for MarketGrouper initialization."""
 
@@ -49,13 +86,8 @@ class TestMarketGrouperInit:
 class TestFetchMarketMetadata:
     """Test suite for fetching market metadata."""
 
-    @pytest.fixture
-    def grouper(self):
-        """Create a market grouper for testing."""
-        return MarketGrouper()
-
     @pytest.mark.asyncio
-    async def test_fetch_market_metadata_success(self, grouper):
+    async def test_fetch_market_metadata_success(self):
         """Test successfully fetching market metadata."""
         token_id = "token-trump-12345"
 
@@ -80,8 +112,8 @@ class TestFetchMarketMetadata:
             }
         )
 
-        with patch("aiohttp.ClientSession.get", return_value=mock_response):
-            metadata = await grouper.fetch_market_metadata(token_id)
+        grouper = MarketGrouper(session=create_mock_session(mock_response))
+        metadata = await grouper.fetch_market_metadata(token_id)
 
         assert metadata.market_id == "election-winner-2024"
         assert metadata.title == "2024 Presidential Election Winner"
@@ -90,7 +122,7 @@ class TestFetchMarketMetadata:
         assert metadata.end_date is not None
 
     @pytest.mark.asyncio
-    async def test_fetch_market_metadata_binary_market(self, grouper):
+    async def test_fetch_market_metadata_binary_market(self):
         """Test fetching metadata for binary market."""
         token_id = "yes-12345"
 
@@ -107,15 +139,15 @@ class TestFetchMarketMetadata:
             }
         )
 
-        with patch("aiohttp.ClientSession.get", return_value=mock_response):
-            metadata = await grouper.fetch_market_metadata(token_id)
+        grouper = MarketGrouper(session=create_mock_session(mock_response))
+        metadata = await grouper.fetch_market_metadata(token_id)
 
         assert metadata.market_id == "will-trump-win"
         assert metadata.is_binary is True
         assert len(metadata.outcomes) == 2
 
     @pytest.mark.asyncio
-    async def test_fetch_market_metadata_caches_result(self, grouper):
+    async def test_fetch_market_metadata_caches_result(self):
         """Test that fetched metadata is cached."""
         token_id = "token-trump-12345"
 
@@ -132,39 +164,377 @@ class TestFetchMarketMetadata:
             }
         )
 
-        with patch("aiohttp.ClientSession.get", return_value=mock_response):
-            metadata1 = await grouper.fetch_market_metadata(token_id)
-            cache_after_first = grouper.get_cached_markets()
+        session = create_mock_session(mock_response)
+        grouper = MarketGrouper(session=session)
+
+        metadata1 = await grouper.fetch_market_metadata(token_id)
+        cache_after_first = grouper.get_cached_markets()
 
-            # Should be cached now
-            assert "election-winner-2024" in cache_after_first
+        # Should be cached now
+        assert "election-winner-2024" in cache_after_first
 
-            # Fetch again - should use cache
-            metadata2 = await grouper.fetch_market_metadata(token_id)
+        # Fetch again - should use cache
+        metadata2 = await grouper.fetch_market_metadata(token_id)
 
+        assert session.get.call_count == 1
         assert metadata1.market_id == metadata2.market_id
         assert len(grouper.get_cached_markets()) == 1
 
     @pytest.mark.asyncio
-    async def test_fetch_market_metadata_api_error(self, grouper):
+    async def test_fetch_metadata_coalesces_concurrent_callers(self):
+        """Test that concurrent fetches for one token share one request."""
+        data = {
+            "market_id": "will-trump-win",
+            "title": "Will Trump Win?",
+            "question": "Will Trump win the 2024 election?",
+            "outcomes": [
+                {"name": "Yes", "token_id": "yes-12345", "is_yes": True},
+                {"name": "No", "token_id": "no-12345", "is_yes": False},
+            ],
+            "outcome_token_ids": ["yes-12345", "no-12345"],
+        }
+
+        async def slow_json(**kwargs):
+            await asyncio.sleep(0.01)
+            return data
+
+        mock_response = create_mock_async_response(data)
+        mock_response.__aenter__.return_value.json = slow_json
+        session = create_mock_session(mock_response)
+        grouper = MarketGrouper(session=session)
+
+        results = await asyncio.gather(
+            *[grouper.fetch_market_metadata("x") for _ in range(20)]
+        )
+
+        assert session.get.call_count == 1
+        assert all(r is results[0] for r in results)
+        assert grouper._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_fetch_metadata_cancelled_waiter_does_not_cancel_leader(self):
+        """Test that cancelling one waiter leaves the shared request running."""
+        data = {
+            "market_id": "will-trump-win",
+            "title": "Will Trump Win?",
+            "question": "Will Trump win the 2024 election?",
+            "outcomes": [
+                {"name": "Yes", "token_id": "yes-12345", "is_yes": True},
+                {"name": "No", "token_id": "no-12345", "is_yes": False},
+            ],
+            "outcome_token_ids": ["yes-12345", "no-12345"],
+        }
+
+        async def slow_json(**kwargs):
+            await asyncio.sleep(0.02)
+            return data
+
+        mock_response = create_mock_async_response(data)
+        mock_response.__aenter__.return_value.json = slow_json
+        session = create_mock_session(mock_response)
+        grouper = MarketGrouper(session=session)
+
+        leader = asyncio.create_task(grouper.fetch_market_metadata("x"))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(grouper.fetch_market_metadata("x"))
+        other = asyncio.create_task(grouper.fetch_market_metadata("x"))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        metadata = await leader
+        assert metadata.market_id == "will-trump-win"
+        assert await other is metadata
+        assert session.get.call_count == 1
+        assert grouper._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_fetch_metadata_cancelled_leader_does_not_cancel_waiters(self):
+        """Test that a waiter refetches when the leading caller is cancelled."""
+        data = {
+            "market_id": "will-trump-win",
+            "title": "Will Trump Win?",
+            "question": "Will Trump win the 2024 election?",
+            "outcomes": [
+                {"name": "Yes", "token_id": "yes-12345", "is_yes": True},
+                {"name": "No", "token_id": "no-12345", "is_yes": False},
+            ],
+            "outcome_token_ids": ["yes-12345", "no-12345"],
+        }
+
+        async def slow_json(**kwargs):
+            await asyncio.sleep(0.02)
+            return data
+
+        mock_response = create_mock_async_response(data)
+        mock_response.__aenter__.return_value.json = slow_json
+        session = create_mock_session(mock_response)
+        grouper = MarketGrouper(session=session)
+
+        leader = asyncio.create_task(grouper.fetch_market_metadata("x"))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(grouper.fetch_market_metadata("x"))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        metadata = await waiter
+        assert metadata.market_id == "will-trump-win"
+        assert session.get.call_count == 2
+        assert grouper._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_fetch_metadata_coalesced_callers_share_errors(self):
+        """Test that a failed shared request raises for every waiter."""
+        async def slow_json(**kwargs):
+            await asyncio.sleep(0.01)
+            raise ValueError("bad payload")
+
+        mock_response = create_mock_async_response({})
+        mock_response.__aenter__.return_value.json = slow_json
+        session = create_mock_session(mock_response)
+        grouper = MarketGrouper(session=session)
+
+        results = await asyncio.gather(
+            *[grouper.fetch_market_metadata("x") for _ in range(5)],
+            return_exceptions=True,
+        )
+
+        assert session.get.call_count == 1
+        assert all(isinstance(r, Exception) for r in results)
+        assert "bad payload" in str(results[0])
+        assert grouper._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_fetch_market_metadata_refetches_expired_cache(self):
+        """Test that cached metadata older than the TTL is fetched again."""
+        mock_response = create_mock_async_response(
+            {
+                "market_id": "will-trump-win",
+                "title": "Will Trump Win?",
+                "question": "Will Trump win the 2024 election?",
+                "outcomes": [
+                    {"name": "Yes", "token_id": "yes-12345", "is_yes": True},
+                    {"name": "No", "token_id": "no-12345", "is_yes": False},
+                ],
+                "outcome_token_ids": ["yes-12345", "no-12345"],
+            }
+        )
+        session = create_mock_session(mock_response)
+        grouper = MarketGrouper(session=session, cache_ttl_seconds=60)
+
+        stale = MarketMetadata(
+            market_id="will-trump-win",
+            title="Stale Title",
+            question="Stale?",
+            outcomes=[
+                Outcome(name="Yes", token_id="yes-12345", is_yes=True),
+                Outcome(name="No", token_id="no-12345", is_yes=False),
+            ],
+            outcome_token_ids=["yes-12345", "no-12345"],
+            is_binary=True,
+            last_fetched=int((datetime.now().timestamp() - 120) * 1000),
+        )
+        grouper.market_cache["will-trump-win"] = stale
+        grouper.token_to_market_cache["yes-12345"] = "will-trump-win"
+
+        metadata = await grouper.fetch_market_metadata("yes-12345")
+
+        assert session.get.call_count == 1
+        assert metadata.title == "Will Trump Win?"
+        assert grouper.market_cache["will-trump-win"].title == "Will Trump Win?"
+
+    @pytest.mark.asyncio
+    async def test_fetch_metadata_handles_304(self):
+        """Test that an expired entry is revalidated with its ETag."""
+        data = {
+            "market_id": "will-trump-win",
+            "title": "Will Trump Win?",
+            "question": "Will Trump win the 2024 election?",
+            "outcomes": [
+                {"name": "Yes", "token_id": "yes-12345", "is_yes": True},
+                {"name": "No", "token_id": "no-12345", "is_yes": False},
+            ],
+            "outcome_token_ids": ["yes-12345", "no-12345"],
+        }
+        first = create_mock_async_response(data, headers={"ETag": '"v1"'})
+        not_modified = create_mock_async_response({}, status=304)
+        session = create_mock_session(side_effect=[first, not_modified])
+        grouper = MarketGrouper(session=session, cache_ttl_seconds=60)
+
+        original = await grouper.fetch_market_metadata("yes-12345")
+        session.get.assert_called_once_with(
+            "https://api.polymarket.com/tokens/yes-12345/market"
+        )
+
+        # Expire the cached entry
+        grouper.market_cache["will-trump-win"] = original.model_copy(
+            update={"last_fetched": int((datetime.now().timestamp() - 120) * 1000)}
+        )
+
+        metadata = await grouper.fetch_market_metadata("yes-12345")
+
+        _, kwargs = session.get.call_args
+        assert kwargs["headers"] == {"If-None-Match": '"v1"'}
+        not_modified.__aenter__.return_value.json.assert_not_awaited()
+        assert metadata.title == original.title
+        assert metadata.outcome_token_ids == original.outcome_token_ids
+        assert metadata.last_fetched >= original.last_fetched
+        assert grouper._get_cached_metadata("yes-12345") is metadata
+
+    @pytest.mark.asyncio
+    async def test_fetch_market_metadata_decodes_with_orjson(self):
+        """Test that response bodies are decoded with orjson when available."""
+        mock_response = create_mock_async_response(
+            {
+                "market_id": "binary-market",
+                "title": "Binary",
+                "question": "Yes or No?",
+                "outcomes": [
+                    {"name": "Yes", "token_id": "yes-123", "is_yes": True},
+                    {"name": "No", "token_id": "no-123", "is_yes": False},
+                ],
+                "outcome_token_ids": ["yes-123", "no-123"],
+            }
+        )
+        grouper = MarketGrouper(session=create_mock_session(mock_response))
+        response = mock_response.__aenter__.return_value
+        fake_orjson = MagicMock()
+
+        with patch("src.strategies.market_grouper.orjson", fake_orjson):
+            await grouper.fetch_market_metadata("yes-123")
+        response.json.assert_awaited_once_with(loads=fake_orjson.loads)
+
+        grouper.market_cache.clear()
+        grouper.token_to_market_cache.clear()
+        response.json.reset_mock()
+        with patch("src.strategies.market_grouper.orjson", None):
+            await grouper.fetch_market_metadata("yes-123")
+        response.json.assert_awaited_once_with()
+
+    @pytest.mark.asyncio
+    async def test_fetch_market_metadata_api_error(self):
         """Test handling of API errors."""
         token_id = "invalid-token"
 
         mock_response = Mock()
         mock_response.status = 404
 
-        with patch("aiohttp.ClientSession.get", return_value=mock_response):
-            with pytest.raises(Exception, match="Failed to fetch market metadata"):
-                await grouper.fetch_market_metadata(token_id)
+        grouper = MarketGrouper(session=create_mock_session(mock_response))
+        with pytest.raises(Exception, match="Failed to fetch market metadata"):
+            await grouper.fetch_market_metadata(token_id)
 
     @pytest.mark.asyncio
-    async def test_fetch_market_metadata_network_error(self, grouper):
+    async def test_fetch_market_metadata_network_error(self):
         """Test handling of network errors."""
         token_id = "token-trump"
 
-        with patch("aiohttp.ClientSession.get", side_effect=Exception("Network error")):
-            with pytest.raises(Exception, match="Network error"):
-                await grouper.fetch_market_metadata(token_id)
+        grouper = MarketGrouper(
+            session=create_mock_session(side_effect=Exception("Network error"))
+        )
+        with pytest.raises(Exception, match="Network error"):
+            await grouper.fetch_market_metadata(token_id)
+
+    @pytest.mark.asyncio
+    async def test_fetch_market_metadata_reuses_session(self):
+        """Test that consecutive uncached fetches share one HTTP session."""
+        responses = [
+            create_mock_async_response(
+                {
+                    "market_id": f"market-{i}",
+                    "title": f"Market {i}",
+                    "question": f"Question {i}?",
+                    "outcomes": [
+                        {"name": "Yes", "token_id": f"yes-{i}", "is_yes": True},
+                        {"name": "No", "token_id": f"no-{i}", "is_yes": False},
+                    ],
+                    "outcome_token_ids": [f"yes-{i}", f"no-{i}"],
+                }
+            )
+            for i in range(2)
+        ]
+        session = create_mock_session(side_effect=responses)
+        grouper = MarketGrouper(session=session)
+
+        await grouper.fetch_market_metadata("yes-0")
+        await grouper.fetch_market_metadata("yes-1")
+
+        assert session.get.call_count == 2
+        assert len(grouper.get_cached_markets()) == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_market_metadata_batch(self):
+        """Test fetching several markets with one batch request."""
+        mock_response = create_mock_async_response(
+            [
+                {
+                    "market_id": "market-1",
+                    "title": "Market 1",
+                    "question": "Question 1?",
+                    "outcomes": [
+                        {"name": "A", "token_id": "token-a", "is_yes": True},
+                        {"name": "B", "token_id": "token-b", "is_yes": True},
+                        {"name": "C", "token_id": "token-c", "is_yes": True},
+                    ],
+                    "outcome_token_ids": ["token-a", "token-b", "token-c"],
+                },
+                {
+                    "market_id": "market-2",
+                    "title": "Market 2",
+                    "question": "Question 2?",
+                    "outcomes": [
+                        {"name": "Yes", "token_id": "yes-1", "is_yes": True},
+                        {"name": "No", "token_id": "no-1", "is_yes": False},
+                    ],
+                    "outcome_token_ids": ["yes-1", "no-1"],
+                },
+            ]
+        )
+        session = create_mock_session(mock_response)
+        grouper = MarketGrouper(session=session)
+
+        markets = await grouper.fetch_market_metadata_batch(["token-a", "yes-1"])
+
+        assert [m.market_id for m in markets] == ["market-1", "market-2"]
+        assert markets[0].is_binary is False
+        assert markets[1].is_binary is True
+        assert session.get.call_count == 1
+        _, kwargs = session.get.call_args
+        assert kwargs["params"] == {"token_ids": "token-a,yes-1"}
+        assert grouper.token_to_market_cache["token-c"] == "market-1"
+        assert grouper.token_to_market_cache["no-1"] == "market-2"
+
+    @pytest.mark.asyncio
+    async def test_fetch_market_metadata_batch_api_error(self):
+        """Test handling of batch API errors."""
+        mock_response = create_mock_async_response([], status=500)
+        grouper = MarketGrouper(session=create_mock_session(mock_response))
+
+        with pytest.raises(Exception, match="Failed to fetch market metadata batch"):
+            await grouper.fetch_market_metadata_batch(["token-a", "token-b"])
+
+    @pytest.mark.asyncio
+    async def test_close_does_not_close_injected_session(self):
+        """Test that close() leaves caller-owned sessions open."""
+        session = create_mock_session()
+        grouper = MarketGrouper(session=session)
+
+        await grouper.close()
+
+        session.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_close_closes_owned_session(self):
+        """Test that close() releases a lazily created session."""
+        async with MarketGrouper() as grouper:
+            session = grouper._get_session()
+            assert grouper._get_session() is session
+
+        assert session.closed is True
 
 
 class TestGroupTokensByMarket:
@@ -172,8 +542,9 @@ class TestGroupTokensByMarket:
 
     @pytest.fixture
     def grouper(self):
-        """Create a market grouper for testing."""
-        return MarketGrouper()
+        """Create a market grouper whose batch endpoint is unavailable."""
+        session = create_mock_session(side_effect=Exception("batch endpoint unavailable"))
+        return MarketGrouper(session=session)
 
     @pytest.mark.asyncio
     async def test_group_tokens_by_market_single_market(self, grouper):
@@ -196,7 +567,7 @@ class TestGroupTokensByMarket:
                 is_binary=False,
             )
 
-        grouper.fetch_market_metadata = AsyncMock(side_effect=mock_fetch_metadata)
+        grouper.fetch_market_metadata = FakeFetch(side_effect=mock_fetch_metadata)
 
         groups = await grouper.group_tokens_by_market(token_ids)
 
@@ -204,6 +575,46 @@ class TestGroupTokensByMarket:
         assert "election-winner-2024" in groups
         assert len(groups["election-winner-2024"]) == 4
 
+    @pytest.mark.asyncio
+    async def test_group_tokens_skips_sibling_fetches(self, grouper):
+        """Test that tokens resolved via a completed sibling fetch are not fetched."""
+        token_ids = ["token-trump", "token-biden", "token-harris", "token-other"]
+
+        async def mock_fetch_metadata(token_id):
+            await asyncio.sleep(0)  # Suspend like a real request
+            return MarketMetadata(
+                market_id="election-winner-2024",
+                title="2024 Presidential Election Winner",
+                question="Who will win?",
+                outcomes=[
+                    Outcome(name="Trump", token_id="token-trump", is_yes=True),
+                    Outcome(name="Biden", token_id="token-biden", is_yes=True),
+                    Outcome(name="Harris", token_id="token-harris", is_yes=True),
+                    Outcome(name="Other", token_id="token-other", is_yes=True),
+                ],
+                outcome_token_ids=["token-trump", "token-biden", "token-harris", "token-other"],
+                is_binary=False,
+            )
+
+        # One worker: each fetch completes before the next token is picked up
+        grouper.max_concurrent_fetches = 1
+        grouper.fetch_market_metadata = FakeFetch(side_effect=mock_fetch_metadata)
+
+        groups = await grouper.group_tokens_by_market(token_ids)
+
+        assert groups == {"election-winner-2024": token_ids}
+        assert grouper.fetch_market_metadata.call_count == 1
+
+        # Concurrent workers pick up siblings before the first fetch returns,
+        # so those siblings are fetched too; grouping is unchanged
+        grouper.max_concurrent_fetches = 2
+        grouper.fetch_market_metadata = FakeFetch(side_effect=mock_fetch_metadata)
+
+        groups = await grouper.group_tokens_by_market(token_ids)
+
+        assert groups == {"election-winner-2024": token_ids}
+        assert grouper.fetch_market_metadata.call_count == 2
+
     @pytest.mark.asyncio
     async def test_group_tokens_by_market_multiple_markets(self, grouper):
         """Test grouping tokens from multiple markets."""
@@ -240,7 +651,7 @@ class TestGroupTokensByMarket:
                     is_binary=True,
                 )
 
-        grouper.fetch_market_metadata = AsyncMock(side_effect=mock_fetch_metadata)
+        grouper.fetch_market_metadata = FakeFetch(side_effect=mock_fetch_metadata)
 
         groups = await grouper.group_tokens_by_market(token_ids)
 
@@ -315,7 +726,7 @@ class TestIsMultiOutcomeMarket:
         )
 
         # Mock fetch to return this metadata
-        grouper.fetch_market_metadata = AsyncMock(return_value=market_metadata)
+        grouper.fetch_market_metadata = FakeFetch(return_value=market_metadata)
 
         is_multi = await grouper.is_multi_outcome_market("token-a")
         assert is_multi is True
@@ -335,7 +746,7 @@ class TestIsMultiOutcomeMarket:
             is_binary=True,
         )
 
-        grouper.fetch_market_metadata = AsyncMock(return_value=market_metadata)
+        grouper.fetch_market_metadata = FakeFetch(return_value=market_metadata)
 
         is_multi = await grouper.is_multi_outcome_market("yes-123")
         assert is_multi is False
@@ -358,6 +769,7 @@ class TestIsMultiOutcomeMarket:
 
         grouper.market_cache["cached-market"] = market_metadata
         grouper.token_to_market_cache["token-a"] = "cached-market"
+        grouper.fetch_market_metadata = FakeFetch()
 
         # Track HTTP calls (should not be called when using cache)
         with patch("aiohttp.ClientSession.get") as mock_get:
@@ -367,6 +779,7 @@ class TestIsMultiOutcomeMarket:
             mock_get.assert_not_called()
 
         assert is_multi is False
+        assert grouper.fetch_market_metadata.call_count == 0
 
 
 class TestGetMarketOutcomes:
@@ -393,7 +806,7 @@ class TestGetMarketOutcomes:
             is_binary=False,
         )
 
-        grouper.fetch_market_metadata = AsyncMock(return_value=market_metadata)
+        grouper.fetch_market_metadata = FakeFetch(return_value=market_metadata)
 
         outcomes = await grouper.get_market_outcomes("token-trump")
 
@@ -419,6 +832,7 @@ class TestGetMarketOutcomes:
 
         grouper.market_cache["cached-market"] = market_metadata
         grouper.token_to_market_cache["token-a"] = "cached-market"
+        grouper.fetch_market_metadata = FakeFetch()
 
         # Track HTTP calls (should not be called when using cache)
         with patch("aiohttp.ClientSession.get") as mock_get:
@@ -428,6 +842,7 @@ class TestGetMarketOutcomes:
             mock_get.assert_not_called()
 
         assert len(outcomes) == 2
+        assert grouper.fetch_market_metadata.call_count == 0
 
 
 class TestGetCachedMarkets:
@@ -465,8 +880,9 @@ class TestEdgeCases:
 
     @pytest.fixture
     def grouper(self):
-        """Create a market grouper for testing."""
-        return MarketGrouper()
+        """Create a market grouper whose batch endpoint is unavailable."""
+        session = create_mock_session(side_effect=Exception("batch endpoint unavailable"))
+        return MarketGrouper(session=session)
 
     @pytest.mark.asyncio
     async def test_market_with_many_outcomes(self, grouper):
@@ -485,7 +901,7 @@ class TestEdgeCases:
             is_binary=False,
         )
 
-        grouper.fetch_market_metadata = AsyncMock(return_value=market_metadata)
+        grouper.fetch_market_metadata = FakeFetch(return_value=market_metadata)
 
         is_multi = await grouper.is_multi_outcome_market("token-0")
         assert is_multi is True
@@ -508,10 +924,102 @@ class TestEdgeCases:
                 is_binary=False,
             )
 
-        grouper.fetch_market_metadata = AsyncMock(side_effect=mock_fetch_metadata)
+        grouper.fetch_market_metadata = FakeFetch(side_effect=mock_fetch_metadata)
 
         groups = await grouper.group_tokens_by_market(token_ids)
 
         # Should handle duplicates gracefully
         assert len(groups) == 1
         assert "election-winner" in groups
+        assert groups["election-winner"] == ["token-trump", "token-biden"]
+        # Duplicates and sibling outcomes are fetched only once
+        assert grouper.fetch_market_metadata.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_group_tokens_prefers_batch_endpoint(self):
+        """Test that grouping resolves uncached tokens with one batch request."""
+        mock_response = create_mock_async_response(
+            [
+                {
+                    "market_id": "market-1",
+                    "title": "Market 1",
+                    "question": "Question 1?",
+                    "outcomes": [
+                        {"name": "Trump", "token_id": "token-trump", "is_yes": True},
+                        {"name": "Biden", "token_id": "token-biden", "is_yes": True},
+                        {"name": "Harris", "token_id": "token-harris", "is_yes": True},
+                    ],
+                    "outcome_token_ids": ["token-trump", "token-biden", "token-harris"],
+                },
+                {
+                    "market_id": "market-2",
+                    "title": "Market 2",
+                    "question": "Question 2?",
+                    "outcomes": [
+                        {"name": "Yes", "token_id": "yes-123", "is_yes": True},
+                        {"name": "No", "token_id": "no-123", "is_yes": False},
+                    ],
+                    "outcome_token_ids": ["yes-123", "no-123"],
+                },
+            ]
+        )
+        session = create_mock_session(mock_response)
+        grouper = MarketGrouper(session=session)
+        grouper.fetch_market_metadata = FakeFetch()
+
+        groups = await grouper.group_tokens_by_market(["token-trump", "yes-123", "no-123"])
+
+        assert groups == {"market-1": ["token-trump"], "market-2": ["yes-123", "no-123"]}
+        assert session.get.call_count == 1
+        assert grouper.fetch_market_metadata.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_group_tokens_stops_batching_after_404(self):
+        """Test that a missing batch endpoint is not retried on later calls."""
+        session = create_mock_session(create_mock_async_response([], status=404))
+        grouper = MarketGrouper(session=session)
+
+        async def mock_fetch_metadata(token_id):
+            return MarketMetadata(
+                market_id=f"market-{token_id}",
+                title="Binary",
+                question="Yes or No?",
+                outcomes=[
+                    Outcome(name="Yes", token_id=token_id, is_yes=True),
+                    Outcome(name="No", token_id=f"no-{token_id}", is_yes=False),
+                ],
+                outcome_token_ids=[token_id, f"no-{token_id}"],
+                is_binary=True,
+            )
+
+        grouper.fetch_market_metadata = FakeFetch(side_effect=mock_fetch_metadata)
+
+        await grouper.group_tokens_by_market(["a", "b"])
+        await grouper.group_tokens_by_market(["c", "d"])
+
+        assert session.get.call_count == 1
+        assert grouper.fetch_market_metadata.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_group_tokens_skips_failed_fetches(self, grouper):
+        """Test that tokens whose fetch fails are left out of the groups."""
+        async def mock_fetch_metadata(token_id):
+            if token_id == "bad-token":
+                raise Exception("Failed to fetch market metadata: HTTP 404")
+            return MarketMetadata(
+                market_id="binary-market",
+                title="Binary",
+                question="Yes or No?",
+                outcomes=[
+                    Outcome(name="Yes", token_id="yes-123", is_yes=True),
+                    Outcome(name="No", token_id="no-123", is_yes=False),
+                ],
+                outcome_token_ids=["yes-123", "no-123"],
+                is_binary=True,
+            )
+
+        grouper.fetch_market_metadata = FakeFetch(side_effect=mock_fetch_metadata)
+
+        groups = await grouper.group_tokens_by_market(["yes-123", "bad-token", "no-123"])
+
+        assert groups == {"binary-market": ["yes-123", "no-123"]}
@@ -21,6 +21,11 @@ from src.core.metrics import (
     record_latency,
     calculate_percentiles,
     TimeWindow,
+    _serialize_metric,
+    _write_metrics_log,
+    flush_metrics_log,
+    close_metrics_log,
+    MetricsLogWriter,
 )
 
 
@@ -35,7 +40,6 @@ class TestLatencyMetric:
             book_to_signal_ms=5.2,
             signal_to_risk_ms=3.1,
             risk_to_send_ms=15.8,
-            end_to_end_ms=34.6,
             timestamp=datetime.now()
         )
 
@@ -54,7 +58,6 @@ class TestLatencyMetric:
             book_to_signal_ms=5.2,
             signal_to_risk_ms=3.1,
             risk_to_send_ms=15.8,
-            end_to_end_ms=34.6,
             timestamp=datetime(2026, 1, 31, 12, 0, 0)
         )
 
@@ -131,7 +134,6 @@ class TestMetricsCollector:
             book_to_signal_ms=5.0,
             signal_to_risk_ms=3.0,
             risk_to_send_ms=15.0,
-            end_to_end_ms=33.0,
             timestamp=now - timedelta(seconds=120)  # 2 分钟前
         ))
         collector.metrics.append(LatencyMetric(
@@ -140,7 +142,6 @@ class TestMetricsCollector:
             book_to_signal_ms=5.0,
             signal_to_risk_ms=3.0,
             risk_to_send_ms=15.0,
-            end_to_end_ms=33.0,
             timestamp=now - timedelta(seconds=30)  # 30 秒前
         ))
 
@@ -151,6 +152,52 @@ class TestMetricsCollector:
         assert len(recent_metrics) == 1
         assert recent_metrics[0].trace_id == "recent"
 
+    def test_metrics_buffer_is_bounded(self):
+        """超过容量时应该淘汰最旧的指标"""
+        collector = MetricsCollector(max_metrics=5)
+
+        for i in range(8):
+            collector.record_latency(trace_id=f"trace-{i}", ws_to_book_update_ms=10.0)
+
+        assert len(collector.metrics) == 5
+        assert collector.metrics[0].trace_id == "trace-3"
+        assert collector.metrics[-1].trace_id == "trace-7"
+
+    def test_metrics_buffer_stores_columns(self):
+        """指标应该按列存储，并能按需还原为 LatencyMetric"""
+        collector = MetricsCollector(max_metrics=3)
+
+        for i in range(5):
+            collector.record_latency(trace_id=f"trace-{i}", ws_to_book_update_ms=float(i))
+
+        column = collector.metrics.column("ws_to_book_update_ms")
+        assert list(column) == [2.0, 3.0, 4.0]
+        assert list(collector.metrics.column("end_to_end_ms")) == [2.0, 3.0, 4.0]
+        assert [m.trace_id for m in collector.metrics] == ["trace-2", "trace-3", "trace-4"]
+        assert [m.trace_id for m in reversed(collector.metrics)] == [
+            "trace-4", "trace-3", "trace-2"
+        ]
+        assert collector.metrics[-1].end_to_end_ms == 4.0
+
+        with pytest.raises(IndexError):
+            collector.metrics[3]
+
+    def test_running_stats_track_evictions(self):
+        """增量统计应该与淘汰后保留的指标一致"""
+        collector = MetricsCollector(max_metrics=4)
+        values = [5.0, 1.0, 9.0, 3.0, 7.0, 2.0, 8.0]
+
+        for i, value in enumerate(values):
+            collector.record_latency(trace_id=f"trace-{i}", ws_to_book_update_ms=value)
+            retained = values[max(0, i - 3):i + 1]
+            count, total, low, high = collector.metrics.end_to_end_stats()
+            assert count == len(retained)
+            assert total == pytest.approx(sum(retained))
+            assert (low, high) == (min(retained), max(retained))
+
+        collector.metrics.clear()
+        assert collector.metrics.end_to_end_stats() == (0, 0.0, 0.0, 0.0)
+
     def test_calculate_snapshot(self):
         """应该能够计算时间窗口快照"""
         collector = MetricsCollector()
@@ -175,6 +222,32 @@ class TestMetricsCollector:
         assert snapshot.min_end_to_end_ms == pytest.approx(33.0)
         assert snapshot.max_end_to_end_ms > 33.0
 
+    def test_calculate_snapshot_without_numpy(self):
+        """没有 numpy 时快照结果应该与 numpy 线性插值一致"""
+        collector = MetricsCollector()
+
+        # 端到端延迟为 15..64 ms
+        for i in range(50):
+            collector.record_latency(
+                trace_id=f"trace-{i}",
+                ws_to_book_update_ms=10 + i,
+                book_to_signal_ms=5.0
+            )
+
+        window = TimeWindow(seconds=60)
+
+        with patch("src.core.metrics.np", None):
+            snapshot = collector.calculate_snapshot(window)
+
+        # 预期值与 np.percentile(range(15, 65), ...) 相同
+        assert snapshot.count == 50
+        assert snapshot.avg_end_to_end_ms == pytest.approx(39.5)
+        assert snapshot.min_end_to_end_ms == pytest.approx(15.0)
+        assert snapshot.max_end_to_end_ms == pytest.approx(64.0)
+        assert snapshot.p50_end_to_end_ms == pytest.approx(39.5)
+        assert snapshot.p95_end_to_end_ms == pytest.approx(61.55)
+        assert snapshot.p99_end_to_end_ms == pytest.approx(63.51)
+
 
 class TestCalculatePercentiles:
     """测试百分位数计算"""
@@ -220,6 +293,18 @@ class TestCalculatePercentiles:
         assert result["p95"] == pytest.approx(949.05, abs=1)
         assert result["p99"] == pytest.approx(989.01, abs=1)
 
+    def test_calculate_percentiles_without_numpy(self):
+        """没有 numpy 时应该回退到纯 Python 实现，结果与 numpy 一致"""
+        values = [float(v) for v in range(1000)]
+
+        with patch("src.core.metrics.np", None):
+            result = calculate_percentiles(values)
+
+        # 预期值与 np.percentile(range(1000), [50, 95, 99]) 相同
+        assert result["p50"] == pytest.approx(499.5)
+        assert result["p95"] == pytest.approx(949.05)
+        assert result["p99"] == pytest.approx(989.01)
+
 
 class TestRecordLatency:
     """测试全局 record_latency 函数"""
@@ -241,6 +326,7 @@ class TestRecordLatency:
                 signal_to_risk_ms=3.0,
                 risk_to_send_ms=15.0
             )
+            await flush_metrics_log()
 
         # 验证写入
         assert len(written_data) == 1
@@ -249,6 +335,115 @@ class TestRecordLatency:
         assert metric_dict["end_to_end_ms"] == 33.0
 
 
+    @pytest.mark.asyncio
+    async def test_record_latency_batches_queued_writes(self):
+        """后台写入器应该合并排队的指标，并在 flush 后全部落盘"""
+        written_data = []
+
+        async def mock_write(data):
+            written_data.append(data)
+
+        with patch("src.core.metrics._write_metrics_log", side_effect=mock_write):
+            for i in range(5):
+                await record_latency(
+                    trace_id=f"trace-{i}",
+                    ws_to_book_update_ms=1.0,
+                    book_to_signal_ms=1.0,
+                    signal_to_risk_ms=1.0,
+                    risk_to_send_ms=1.0
+                )
+            await close_metrics_log()
+
+        lines = b"\n".join(written_data).split(b"\n")
+        assert [json.loads(line)["trace_id"] for line in lines] == [
+            f"trace-{i}" for i in range(5)
+        ]
+        assert len(written_data) < 5
+
+    @pytest.mark.asyncio
+    async def test_log_writer_flushes_on_interval_and_size(self):
+        """缓冲的日志行应该在超时或超过字节上限时写入"""
+        written_data = []
+
+        async def mock_write(data):
+            written_data.append(data)
+
+        writer = MetricsLogWriter(max_buffer_bytes=8, flush_interval_s=0.01)
+        with patch("src.core.metrics._write_metrics_log", side_effect=mock_write):
+            await writer.put(b"a")
+            await asyncio.sleep(0)
+            assert written_data == []
+
+            # Interval elapsed: buffered line is written without flush()
+            await asyncio.sleep(0.05)
+            assert written_data == [b"a"]
+
+            # Size limit reached: written without waiting for the interval
+            await writer.put(b"bbbb")
+            await writer.put(b"cccc")
+            await asyncio.sleep(0)
+            assert written_data == [b"a", b"bbbb\ncccc"]
+
+            await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_write_metrics_log_appends_lines(self, tmp_path):
+        """应该以 JSONL 格式追加写入日志文件"""
+        log_file = tmp_path / "logs" / "metrics.jsonl"
+        metric = LatencyMetric(
+            trace_id="test-trace",
+            ws_to_book_update_ms=10.0,
+            book_to_signal_ms=5.0,
+            signal_to_risk_ms=3.0,
+            risk_to_send_ms=15.0,
+            timestamp=datetime(2026, 1, 31, 12, 0, 0)
+        )
+
+        with patch("src.core.metrics.METRICS_LOG_FILE", log_file):
+            await _write_metrics_log(_serialize_metric(metric))
+            await _write_metrics_log(_serialize_metric(metric))
+
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0]) == metric.to_dict()
+
+    def test_encode_line_matches_generic_serializer(self):
+        """模板化编码应该与通用序列化结果一致"""
+        collector = MetricsCollector()
+        collector.record_latency(
+            trace_id='trace-"quoted"-\u00e9',
+            ws_to_book_update_ms=10.5,
+            book_to_signal_ms=5.2,
+            signal_to_risk_ms=3.1,
+            risk_to_send_ms=15.8
+        )
+        collector.record_latency(
+            trace_id="trace-inf",
+            ws_to_book_update_ms=float("inf"),
+        )
+
+        for i, metric in enumerate(collector.metrics):
+            encoded = collector.metrics.encode_line(i)
+            assert json.loads(encoded) == json.loads(_serialize_metric(metric))
+
+    def test_serialize_metric_without_orjson(self):
+        """没有 orjson 时应该回退到标准库 json，输出一致"""
+        metric = LatencyMetric(
+            trace_id="test-trace",
+            ws_to_book_update_ms=10.5,
+            book_to_signal_ms=5.2,
+            signal_to_risk_ms=3.1,
+            risk_to_send_ms=15.8,
+            timestamp=datetime(2026, 1, 31, 12, 0, 0)
+        )
+
+        with patch("src.core.metrics.orjson", None):
+            fallback = _serialize_metric(metric)
+
+        assert json.loads(fallback) == json.loads(_serialize_metric(metric))
+        assert json.loads(fallback)["timestamp"] == "2026-01-31T12:00:00"
+
+
 class TestTimeWindow:
     """测试 TimeWindow 类"""
 
@@ -272,6 +467,14 @@ class TestTimeWindow:
         # 90 秒前不应该在窗口内
         assert not window.contains(now - timedelta(seconds=90))
 
+    def test_time_window_contains_unix_timestamp(self):
+        """应该支持 Unix 时间戳（秒）"""
+        window = TimeWindow(seconds=60)
+        now = datetime.now().timestamp()
+
+        assert window.contains(now - 30)
+        assert not window.contains(now - 90)
+
 
 class TestIntegration:
     """集成测试"""
@@ -322,6 +525,7 @@ class TestIntegration:
         # 并发记录 10 个指标
         tasks = [record_opportunity(i) for i in range(10)]
         await asyncio.gather(*tasks)
+        await close_metrics_log()
 
         # 验证所有记录都成功
         assert len(trace_ids) == 10
@@ -6,46 +6,95 @@ These should fail initially because models might not have proper validation.
 """
 import pytest
 from decimal import Decimal
+from types import MappingProxyType
 from pydantic import ValidationError
 
 from src.core.models import Bid, Ask, OrderBook, Signal, ArbitrageOpportunity, MarketPair
 
+# Shared Decimal values, parsed once per module
+D_NEG_100 = Decimal("-100")
+D_NEG_50 = Decimal("-50")
+D_NEG_4_50 = Decimal("-4.50")
+D_NEG_0_55 = Decimal("-0.55")
+D_NEG_0_50 = Decimal("-0.50")
+D_NEG_0_45 = Decimal("-0.45")
+D_0 = Decimal("0")
+D_0_0 = Decimal("0.0")
+D_0_0001 = Decimal("0.0001")
+D_0_001 = Decimal("0.001")
+D_0_01 = Decimal("0.01")
+D_0_02 = Decimal("0.02")
+D_0_05 = Decimal("0.05")
+D_0_08 = Decimal("0.08")
+D_0_10 = Decimal("0.10")
+D_0_35 = Decimal("0.35")
+D_0_40 = Decimal("0.40")
+D_0_45 = Decimal("0.45")
+D_0_50 = Decimal("0.50")
+D_0_54 = Decimal("0.54")
+D_0_55 = Decimal("0.55")
+D_0_60 = Decimal("0.60")
+D_0_65 = Decimal("0.65")
+D_4_50 = Decimal("4.50")
+D_5_40 = Decimal("5.40")
+D_9_90 = Decimal("9.90")
+D_10 = Decimal("10")
+D_50 = Decimal("50")
+D_100 = Decimal("100")
+D_200 = Decimal("200")
+
+# Valid ArbitrageOpportunity payload; tests override single fields
+_ARB_DEFAULTS = MappingProxyType({
+    "strategy": "atomic",
+    "token_id": "pair123",
+    "signal_type": "ARBITRAGE",
+    "expected_profit": D_0_10,
+    "trade_size": D_10,
+    "yes_price": D_0_45,
+    "no_price": D_0_54,
+    "confidence": 0.90,
+    "reason": "YES + NO < 1.0",
+    "yes_token_id": "yes_123",
+    "no_token_id": "no_123",
+    "yes_cost": D_4_50,
+    "no_cost": D_5_40,
+    "total_cost": D_9_90,
+    "fees": D_0_05,
+    "gas_estimate": D_0_02,
+    "net_profit": D_0_08,
+})
+
 
 class TestBid:
     """Test suite for Bid model."""
 
     def test_create_valid_bid(self):
         """Test creating a valid bid."""
-        bid = Bid(price=Decimal("0.55"), size=Decimal("100"), token_id="yes_token_123")
-        assert bid.price == Decimal("0.55")
-        assert bid.size == Decimal("100")
+        bid = Bid(price=D_0_55, size=D_100, token_id="yes_token_123")
+        assert bid.price == D_0_55
+        assert bid.size == D_100
         assert bid.token_id == "yes_token_123"
 
-    def test_bid_rejects_negative_price(self):
-        """Test that bid rejects negative price."""
-        with pytest.raises(ValidationError):
-            Bid(price=Decimal("-0.55"), size=Decimal("100"), token_id="yes_token_123")
-
-    def test_bid_rejects_zero_price(self):
-        """Test that bid rejects zero price."""
-        with pytest.raises(ValidationError):
-            Bid(price=Decimal("0.0"), size=Decimal("100"), token_id="yes_token_123")
-
-    def test_bid_rejects_negative_size(self):
-        """Test that bid rejects negative size."""
+    @pytest.mark.parametrize(
+        "price,size",
+        [
+            (D_NEG_0_55, D_100),
+            (D_0_0, D_100),
+            (D_0_55, D_NEG_100),
+            (D_0_55, D_0),
+        ],
+        ids=["negative_price", "zero_price", "negative_size", "zero_size"],
+    )
+    def test_bid_rejects_invalid(self, price, size):
+        """Test that bid rejects non-positive price or size."""
         with pytest.raises(ValidationError):
-            Bid(price=Decimal("0.55"), size=Decimal("-100"), token_id="yes_token_123")
-
-    def test_bid_rejects_zero_size(self):
-        """Test that bid rejects zero size."""
-        with pytest.raises(ValidationError):
-            Bid(price=Decimal("0.55"), size=Decimal("0"), token_id="yes_token_123")
+            Bid(price=price, size=size, token_id="yes_token_123")
 
     def test_bid_accepts_very_small_values(self):
         """Test that bid accepts very small positive values."""
-        bid = Bid(price=Decimal("0.0001"), size=Decimal("0.001"), token_id="yes_token_123")
-        assert bid.price == Decimal("0.0001")
-        assert bid.size == Decimal("0.001")
+        bid = Bid(price=D_0_0001, size=D_0_001, token_id="yes_token_123")
+        assert bid.price == D_0_0001
+        assert bid.size == D_0_001
 
 
 class TestAsk:
@@ -53,25 +102,30 @@ class TestAsk:
 
     def test_create_valid_ask(self):
         """Test creating a valid ask."""
-        ask = Ask(price=Decimal("0.45"), size=Decimal("50"), token_id="no_token_456")
-        assert ask.price == Decimal("0.45")
-        assert ask.size == Decimal("50")
+        ask = Ask(price=D_0_45, size=D_50, token_id="no_token_456")
+        assert ask.price == D_0_45
+        assert ask.size == D_50
         assert ask.token_id == "no_token_456"
 
-    def test_ask_rejects_negative_price(self):
-        """Test that ask rejects negative price."""
+    @pytest.mark.parametrize(
+        "price,size",
+        [
+            (D_NEG_0_45, D_50),
+            (D_0_0, D_50),
+            (D_0_45, D_NEG_50),
+        ],
+        ids=["negative_price", "zero_price", "negative_size"],
+    )
+    def test_ask_rejects_invalid(self, price, size):
+        """Test that ask rejects non-positive price or size."""
         with pytest.raises(ValidationError):
-            Ask(price=Decimal("-0.45"), size=Decimal("50"), token_id="no_token_456")
+            Ask(price=price, size=size, token_id="no_token_456")
 
-    def test_ask_rejects_zero_price(self):
-        """Test that ask rejects zero price."""
-        with pytest.raises(ValidationError):
-            Ask(price=Decimal("0.0"), size=Decimal("50"), token_id="no_token_456")
 
-    def test_ask_rejects_negative_size(self):
-        """Test that ask rejects negative size."""
-        with pytest.raises(ValidationError):
-            Ask(price=Decimal("0.45"), size=Decimal("-50"), token_id="no_token_456")
+@pytest.fixture(scope="module")
+def empty_orderbook():
+    """Create a shared order book with no orders (tests only read it)."""
+    return OrderBook(token_id="token1", last_update=1234567890)
 
 
 class TestOrderBook:
@@ -87,50 +141,76 @@ class TestOrderBook:
 
     def test_create_orderbook_with_bids_and_asks(self):
         """Test creating an order book with orders."""
-        bids = [Bid(price=Decimal("0.60"), size=Decimal("100"), token_id="token1")]
-        asks = [Ask(price=Decimal("0.40"), size=Decimal("100"), token_id="token1")]
+        bids = [Bid(price=D_0_60, size=D_100, token_id="token1")]
+        asks = [Ask(price=D_0_40, size=D_100, token_id="token1")]
         orderbook = OrderBook(token_id="token1", bids=bids, asks=asks, last_update=1234567890)
 
         assert len(orderbook.bids) == 1
         assert len(orderbook.asks) == 1
-        assert orderbook.bids[0].price == Decimal("0.60")
-        assert orderbook.asks[0].price == Decimal("0.40")
+        assert orderbook.bids[0].price == D_0_60
+        assert orderbook.asks[0].price == D_0_40
+
+    def test_orders_sorted_on_construction(self):
+        """Test that bids are stored highest first and asks lowest first."""
+        bids = [
+            Bid(price=D_0_40, size=D_100, token_id="token1"),
+            Bid(price=D_0_60, size=D_100, token_id="token1"),
+        ]
+        asks = [
+            Ask(price=D_0_60, size=D_100, token_id="token1"),
+            Ask(price=D_0_40, size=D_100, token_id="token1"),
+        ]
+        orderbook = OrderBook(token_id="token1", bids=bids, asks=asks, last_update=1234567890)
+
+        assert [b.price for b in orderbook.bids] == [D_0_60, D_0_40]
+        assert [a.price for a in orderbook.asks] == [D_0_40, D_0_60]
+
+    def test_from_asks_builds_decimal_levels(self):
+        """Test that from_asks converts float levels to exact Decimals."""
+        orderbook = OrderBook.from_asks("token1", [(0.40, 100), (0.45, 50)], last_update=7)
+
+        assert orderbook.token_id == "token1"
+        assert orderbook.bids == []
+        assert orderbook.last_update == 7
+        assert [(a.price, a.size) for a in orderbook.asks] == [
+            (D_0_40, D_100),
+            (Decimal("0.45"), Decimal("50")),
+        ]
+        assert orderbook.get_best_ask().price == D_0_40
 
     def test_get_best_bid_returns_highest(self):
         """Test that get_best_bid returns highest bid."""
         bids = [
-            Bid(price=Decimal("0.60"), size=Decimal("100"), token_id="token1"),
-            Bid(price=Decimal("0.65"), size=Decimal("50"), token_id="token1"),
-            Bid(price=Decimal("0.55"), size=Decimal("200"), token_id="token1"),
+            Bid.model_construct(price=D_0_60, size=D_100, token_id="token1"),
+            Bid.model_construct(price=D_0_65, size=D_50, token_id="token1"),
+            Bid.model_construct(price=D_0_55, size=D_200, token_id="token1"),
         ]
         orderbook = OrderBook(token_id="token1", bids=bids, last_update=1234567890)
 
         best_bid = orderbook.get_best_bid()
         assert best_bid is not None
-        assert best_bid.price == Decimal("0.65")
+        assert best_bid.price == D_0_65
 
-    def test_get_best_bid_returns_none_when_empty(self):
+    def test_get_best_bid_returns_none_when_empty(self, empty_orderbook):
         """Test that get_best_bid returns None when no bids."""
-        orderbook = OrderBook(token_id="token1", last_update=1234567890)
-        assert orderbook.get_best_bid() is None
+        assert empty_orderbook.get_best_bid() is None
 
     def test_get_best_ask_returns_lowest(self):
         """Test that get_best_ask returns lowest ask."""
         asks = [
-            Ask(price=Decimal("0.40"), size=Decimal("100"), token_id="token1"),
-            Ask(price=Decimal("0.35"), size=Decimal("50"), token_id="token1"),
-            Ask(price=Decimal("0.45"), size=Decimal("200"), token_id="token1"),
+            Ask.model_construct(price=D_0_40, size=D_100, token_id="token1"),
+            Ask.model_construct(price=D_0_35, size=D_50, token_id="token1"),
+            Ask.model_construct(price=D_0_45, size=D_200, token_id="token1"),
         ]
         orderbook = OrderBook(token_id="token1", asks=asks, last_update=1234567890)
 
         best_ask = orderbook.get_best_ask()
         assert best_ask is not None
-        assert best_ask.price == Decimal("0.35")
+        assert best_ask.price == D_0_35
 
-    def test_get_best_ask_returns_none_when_empty(self):
+    def test_get_best_ask_returns_none_when_empty(self, empty_orderbook):
         """Test that get_best_ask returns None when no asks."""
-        orderbook = OrderBook(token_id="token1", last_update=1234567890)
-        assert orderbook.get_best_ask() is None
+        assert empty_orderbook.get_best_ask() is None
 
 
 class TestSignal:
@@ -142,16 +222,16 @@ class TestSignal:
             strategy="atomic",
             token_id="token123",
             signal_type="BUY_YES",
-            expected_profit=Decimal("0.50"),
-            trade_size=Decimal("10"),
-            yes_price=Decimal("0.45"),
-            no_price=Decimal("0.55"),
+            expected_profit=D_0_50,
+            trade_size=D_10,
+            yes_price=D_0_45,
+            no_price=D_0_55,
             confidence=0.85,
             reason="Price misalignment detected",
         )
         assert signal.strategy == "atomic"
         assert signal.token_id == "token123"
-        assert signal.expected_profit == Decimal("0.50")
+        assert signal.expected_profit == D_0_50
         assert signal.confidence == 0.85
 
     def test_signal_rejects_negative_profit(self):
@@ -161,33 +241,23 @@ class TestSignal:
                 strategy="atomic",
                 token_id="token123",
                 signal_type="BUY_YES",
-                expected_profit=Decimal("-0.50"),
-                trade_size=Decimal("10"),
+                expected_profit=D_NEG_0_50,
+                trade_size=D_10,
                 confidence=0.85,
                 reason="Test",
             )
 
-    def test_signal_rejects_confidence_out_of_range(self):
+    @pytest.mark.parametrize("confidence", [1.5, -0.1])
+    def test_signal_rejects_confidence_out_of_range(self, confidence):
         """Test that signal rejects confidence outside [0, 1]."""
         with pytest.raises(ValidationError):
             Signal(
                 strategy="atomic",
                 token_id="token123",
                 signal_type="BUY_YES",
-                expected_profit=Decimal("0.50"),
-                trade_size=Decimal("10"),
-                confidence=1.5,  # Invalid
-                reason="Test",
-            )
-
-        with pytest.raises(ValidationError):
-            Signal(
-                strategy="atomic",
-                token_id="token123",
-                signal_type="BUY_YES",
-                expected_profit=Decimal("0.50"),
-                trade_size=Decimal("10"),
-                confidence=-0.1,  # Invalid
+                expected_profit=D_0_50,
+                trade_size=D_10,
+                confidence=confidence,
                 reason="Test",
             )
 
@@ -197,8 +267,8 @@ class TestSignal:
             strategy="atomic",
             token_id="token123",
             signal_type="BUY_YES",
-            expected_profit=Decimal("0.50"),
-            trade_size=Decimal("10"),
+            expected_profit=D_0_50,
+            trade_size=D_10,
             confidence=0.0,
             reason="Test",
         )
@@ -208,8 +278,8 @@ class TestSignal:
             strategy="atomic",
             token_id="token123",
             signal_type="BUY_YES",
-            expected_profit=Decimal("0.50"),
-            trade_size=Decimal("10"),
+            expected_profit=D_0_50,
+            trade_size=D_10,
             confidence=1.0,
             reason="Test",
         )
@@ -219,50 +289,17 @@ class TestSignal:
 class TestArbitrageOpportunity:
     """Test suite for ArbitrageOpportunity model."""
 
+    @pytest.mark.heavy
     def test_create_valid_arbitrage(self):
         """Test creating a valid arbitrage opportunity."""
-        arb = ArbitrageOpportunity(
-            strategy="atomic",
-            token_id="pair123",
-            signal_type="ARBITRAGE",
-            expected_profit=Decimal("0.10"),
-            trade_size=Decimal("10"),
-            yes_price=Decimal("0.45"),
-            no_price=Decimal("0.54"),
-            confidence=0.90,
-            reason="YES + NO < 1.0",
-            yes_token_id="yes_123",
-            no_token_id="no_123",
-            yes_cost=Decimal("4.50"),
-            no_cost=Decimal("5.40"),
-            total_cost=Decimal("9.90"),
-            fees=Decimal("0.05"),
-            gas_estimate=Decimal("0.02"),
-            net_profit=Decimal("0.08"),
-        )
-        assert arb.net_profit == Decimal("0.08")
-        assert arb.total_cost == Decimal("9.90")
+        arb = ArbitrageOpportunity(**_ARB_DEFAULTS)
+        assert arb.net_profit == D_0_08
+        assert arb.total_cost == D_9_90
 
     def test_arbitrage_rejects_negative_costs(self):
         """Test that arbitrage rejects negative costs."""
         with pytest.raises(ValidationError):
-            ArbitrageOpportunity(
-                strategy="atomic",
-                token_id="pair123",
-                signal_type="ARBITRAGE",
-                expected_profit=Decimal("0.10"),
-                trade_size=Decimal("10"),
-                confidence=0.90,
-                reason="Test",
-                yes_token_id="yes_123",
-                no_token_id="no_123",
-                yes_cost=Decimal("-4.50"),  # Invalid
-                no_cost=Decimal("5.40"),
-                total_cost=Decimal("9.90"),
-                fees=Decimal("0.05"),
-                gas_estimate=Decimal("0.02"),
-                net_profit=Decimal("0.08"),
-            )
+            ArbitrageOpportunity(**{**_ARB_DEFAULTS, "yes_cost": D_NEG_4_50})
 
 
 class TestMarketPair:
@@ -289,9 +326,9 @@ class TestMarketPair:
             yes_token_id="yes_123",
             no_token_id="no_123",
             question="Will it rain tomorrow?",
-            tick_size=Decimal("0.01"),
+            tick_size=D_0_01,
         )
-        assert pair.tick_size == Decimal("0.01")
+        assert pair.tick_size == D_0_01
 
     def test_is_mutually_exclusive_default_false(self):
         """Test that is_mutually_exclusive returns False by default."""
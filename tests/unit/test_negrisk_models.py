@@ -3,9 +3,12 @@ Unit tests for NegRisk-related data models.
 
 Tests are written FIRST (TDD methodology).
 """
+import re
 import pytest
 from decimal import Decimal
+from types import MappingProxyType
 from datetime import datetime
+from pydantic import ValidationError
 
 from src.core.models import (
     Outcome,
@@ -15,6 +18,61 @@ from src.core.models import (
     NegRiskSignal,
 )
 
+# Shared Decimal values, parsed once per module
+D_NEG_22_22 = Decimal("-22.22")
+D_NEG_10_00 = Decimal("-10.00")
+D_NEG_2_00 = Decimal("-2.00")
+D_NEG_0_50 = Decimal("-0.50")
+D_NEG_0_45 = Decimal("-0.45")
+D_NEG_0_10 = Decimal("-0.10")
+D_NEG_0_0476 = Decimal("-0.0476")
+D_0 = Decimal("0")
+D_0_0417 = Decimal("0.0417")
+D_0_08 = Decimal("0.08")
+D_0_10 = Decimal("0.10")
+D_0_15 = Decimal("0.15")
+D_0_30 = Decimal("0.30")
+D_0_45 = Decimal("0.45")
+D_0_50 = Decimal("0.50")
+D_1_60 = Decimal("1.60")
+D_10_00 = Decimal("10.00")
+D_22_22 = Decimal("22.22")
+D_33_33 = Decimal("33.33")
+D_38_40 = Decimal("38.40")
+D_40_00 = Decimal("40.00")
+D_42_00 = Decimal("42.00")
+D_66_67 = Decimal("66.67")
+D_125_00 = Decimal("125.00")
+
+# Expected validation error messages
+_TOKEN_COUNT_MISMATCH = re.compile("Number of token IDs must match")
+_MUST_NON_NEG = re.compile("must be non-negative")
+_MUST_POS = re.compile("must be positive")
+_AT_LEAST_TWO = re.compile("at least 2")
+_COST_NEG = re.compile("Costs cannot be negative")
+
+# Valid NegRiskSignal payload (minus opportunities); tests override single fields
+_NEGRISK_DEFAULTS = MappingProxyType({
+    "market_id": "election-winner-2024",
+    "market_title": "2024 Presidential Election Winner",
+    "total_cost": D_38_40,
+    "total_payout": D_40_00,
+    "estimated_profit": D_1_60,
+    "profit_percentage": D_0_0417,
+    "gas_cost": D_0_10,
+    "fees": D_0_50,
+})
+
+
+def _make_outcome(**kw) -> Outcome:
+    """Build a known-good Outcome without running validation."""
+    return Outcome.model_construct(**kw)
+
+
+def _make_opp(**kw) -> TokenOpportunity:
+    """Build a known-good TokenOpportunity without running validation."""
+    return TokenOpportunity.model_construct(**kw)
+
 
 class TestOutcome:
     """Test suite for Outcome model."""
@@ -39,21 +97,63 @@ class TestOutcome:
         )
         assert outcome.is_yes is False
 
+    def test_outcome_is_immutable_and_hashable(self):
+        """Test that outcomes are frozen and can be used as set members."""
+        outcome = Outcome(name="Trump", token_id="token-trump", is_yes=True)
+
+        with pytest.raises(ValidationError):
+            outcome.name = "Biden"
+
+        assert outcome in {Outcome(name="Trump", token_id="token-trump", is_yes=True)}
+
+
+@pytest.fixture(scope="module")
+def binary_outcomes():
+    """Create shared Yes/No outcomes."""
+    return [
+        _make_outcome(name="Yes", token_id="yes-123", is_yes=True),
+        _make_outcome(name="No", token_id="no-123", is_yes=False),
+    ]
+
+
+@pytest.fixture(scope="module")
+def multi_outcomes():
+    """Create shared outcomes for a four-way market."""
+    return [
+        _make_outcome(name="Trump", token_id="token-trump", is_yes=True),
+        _make_outcome(name="Biden", token_id="token-biden", is_yes=True),
+        _make_outcome(name="Harris", token_id="token-harris", is_yes=True),
+        _make_outcome(name="Other", token_id="token-other", is_yes=True),
+    ]
+
+
+class FixedDatetime(datetime):
+    """datetime whose now() always returns FROZEN_NOW."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW
+
+
+FROZEN_NOW = FixedDatetime(2026, 1, 31, 12, 0, 0)
+FROZEN_NOW_MS = int(FROZEN_NOW.timestamp() * 1000)
+
 
 class TestMarketMetadata:
     """Test suite for MarketMetadata model."""
 
-    def test_create_binary_market_metadata(self):
+    @pytest.fixture(autouse=True)
+    def frozen_clock(self, monkeypatch):
+        """Freeze the clock used for default timestamps."""
+        monkeypatch.setattr("src.core.models.datetime", FixedDatetime)
+
+    def test_create_binary_market_metadata(self, binary_outcomes):
         """Test creating metadata for binary market."""
-        outcomes = [
-            Outcome(name="Yes", token_id="yes-123", is_yes=True),
-            Outcome(name="No", token_id="no-123", is_yes=False),
-        ]
         metadata = MarketMetadata(
             market_id="market-123",
             title="Will Trump win?",
             question="Will Trump win the 2024 election?",
-            outcomes=outcomes,
+            outcomes=binary_outcomes,
             outcome_token_ids=["yes-123", "no-123"],
             is_binary=True,
         )
@@ -61,19 +161,14 @@ class TestMarketMetadata:
         assert metadata.is_binary is True
         assert len(metadata.outcomes) == 2
 
-    def test_create_multi_outcome_market_metadata(self):
+    @pytest.mark.heavy
+    def test_create_multi_outcome_market_metadata(self, multi_outcomes):
         """Test creating metadata for multi-outcome market."""
-        outcomes = [
-            Outcome(name="Trump", token_id="token-trump", is_yes=True),
-            Outcome(name="Biden", token_id="token-biden", is_yes=True),
-            Outcome(name="Harris", token_id="token-harris", is_yes=True),
-            Outcome(name="Other", token_id="token-other", is_yes=True),
-        ]
         metadata = MarketMetadata(
             market_id="election-winner-2024",
             title="2024 Presidential Election Winner",
             question="Who will win the 2024 US Presidential Election?",
-            outcomes=outcomes,
+            outcomes=multi_outcomes,
             outcome_token_ids=["token-trump", "token-biden", "token-harris", "token-other"],
             is_binary=False,
         )
@@ -81,56 +176,43 @@ class TestMarketMetadata:
         assert metadata.is_binary is False
         assert len(metadata.outcomes) == 4
 
-    def test_validate_token_ids_match_outcomes(self):
+    def test_validate_token_ids_match_outcomes(self, binary_outcomes):
         """Test validation that token IDs match outcomes."""
-        outcomes = [
-            Outcome(name="Trump", token_id="token-trump", is_yes=True),
-            Outcome(name="Biden", token_id="token-biden", is_yes=True),
-        ]
-        with pytest.raises(ValueError, match="Number of token IDs must match"):
+        with pytest.raises(ValueError, match=_TOKEN_COUNT_MISMATCH):
             MarketMetadata(
                 market_id="market-123",
                 title="Test Market",
                 question="Test question?",
-                outcomes=outcomes,
-                outcome_token_ids=["token-trump"],  # Only 1 token for 2 outcomes
+                outcomes=binary_outcomes,
+                outcome_token_ids=["yes-123"],  # Only 1 token for 2 outcomes
                 is_binary=False,
             )
 
-    def test_market_metadata_with_end_date(self):
+    def test_market_metadata_with_end_date(self, binary_outcomes):
         """Test market metadata with end date."""
-        outcomes = [
-            Outcome(name="Yes", token_id="yes-123", is_yes=True),
-            Outcome(name="No", token_id="no-123", is_yes=False),
-        ]
         end_date = datetime(2024, 11, 5, 23, 59, 59)
         metadata = MarketMetadata(
             market_id="market-123",
             title="Test Market",
             question="Test question?",
-            outcomes=outcomes,
+            outcomes=binary_outcomes,
             outcome_token_ids=["yes-123", "no-123"],
             is_binary=True,
             end_date=end_date,
         )
         assert metadata.end_date == end_date
 
-    def test_market_metadata_default_timestamp(self):
+    def test_market_metadata_default_timestamp(self, binary_outcomes):
         """Test that last_fetched timestamp is set by default."""
-        outcomes = [
-            Outcome(name="Yes", token_id="yes-123", is_yes=True),
-            Outcome(name="No", token_id="no-123", is_yes=False),
-        ]
         metadata = MarketMetadata(
             market_id="market-123",
             title="Test Market",
             question="Test question?",
-            outcomes=outcomes,
+            outcomes=binary_outcomes,
             outcome_token_ids=["yes-123", "no-123"],
             is_binary=True,
         )
-        assert metadata.last_fetched > 0
-        assert metadata.last_fetched <= int(datetime.now().timestamp() * 1000)
+        assert metadata.last_fetched == FROZEN_NOW_MS
 
 
 class TestVWAPResult:
@@ -140,64 +222,50 @@ class TestVWAPResult:
         """Test creating a valid VWAP result."""
         result = VWAPResult(
             token_id="token-trump",
-            vwap_price=Decimal("0.45"),
-            vwap_cost=Decimal("10.00"),
-            shares=Decimal("22.22"),
-            trade_size=Decimal("10.00"),
+            vwap_price=D_0_45,
+            vwap_cost=D_10_00,
+            shares=D_22_22,
+            trade_size=D_10_00,
             filled=True,
         )
         assert result.token_id == "token-trump"
-        assert result.vwap_price == Decimal("0.45")
+        assert result.vwap_price == D_0_45
         assert result.filled is True
 
-    def test_validate_vwap_price_non_negative(self):
-        """Test that VWAP price cannot be negative."""
-        with pytest.raises(ValueError, match="must be non-negative"):
-            VWAPResult(
-                token_id="token-trump",
-                vwap_price=Decimal("-0.45"),
-                vwap_cost=Decimal("10.00"),
-                shares=Decimal("22.22"),
-                trade_size=Decimal("10.00"),
-                filled=True,
-            )
-
-    def test_validate_vwap_cost_non_negative(self):
-        """Test that VWAP cost cannot be negative."""
-        with pytest.raises(ValueError, match="must be non-negative"):
-            VWAPResult(
-                token_id="token-trump",
-                vwap_price=Decimal("0.45"),
-                vwap_cost=Decimal("-10.00"),
-                shares=Decimal("22.22"),
-                trade_size=Decimal("10.00"),
-                filled=True,
-            )
-
-    def test_validate_shares_non_negative(self):
-        """Test that shares cannot be negative."""
-        with pytest.raises(ValueError, match="must be non-negative"):
-            VWAPResult(
-                token_id="token-trump",
-                vwap_price=Decimal("0.45"),
-                vwap_cost=Decimal("10.00"),
-                shares=Decimal("-22.22"),
-                trade_size=Decimal("10.00"),
-                filled=True,
-            )
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("vwap_price", D_NEG_0_45),
+            ("vwap_cost", D_NEG_10_00),
+            ("shares", D_NEG_22_22),
+        ],
+    )
+    def test_validate_non_negative(self, field, value):
+        """Test that VWAP price, cost and shares cannot be negative."""
+        fields = {
+            "token_id": "token-trump",
+            "vwap_price": D_0_45,
+            "vwap_cost": D_10_00,
+            "shares": D_22_22,
+            "trade_size": D_10_00,
+            "filled": True,
+        }
+        fields[field] = value
+        with pytest.raises(ValueError, match=_MUST_NON_NEG):
+            VWAPResult(**fields)
 
     def test_vwap_result_zero_allowed(self):
         """Test that zero values are allowed."""
         result = VWAPResult(
             token_id="token-trump",
-            vwap_price=Decimal("0"),
-            vwap_cost=Decimal("0"),
-            shares=Decimal("0"),
-            trade_size=Decimal("0"),
+            vwap_price=D_0,
+            vwap_cost=D_0,
+            shares=D_0,
+            trade_size=D_0,
             filled=False,
         )
-        assert result.vwap_price == Decimal("0")
-        assert result.shares == Decimal("0")
+        assert result.vwap_price == D_0
+        assert result.shares == D_0
 
 
 class TestTokenOpportunity:
@@ -208,170 +276,102 @@ class TestTokenOpportunity:
         opportunity = TokenOpportunity(
             token_id="token-trump",
             outcome_name="Trump",
-            yes_price=Decimal("0.45"),
-            vwap_cost=Decimal("10.00"),
-            shares=Decimal("22.22"),
+            yes_price=D_0_45,
+            vwap_cost=D_10_00,
+            shares=D_22_22,
         )
         assert opportunity.token_id == "token-trump"
         assert opportunity.outcome_name == "Trump"
-        assert opportunity.yes_price == Decimal("0.45")
-
-    def test_validate_yes_price_positive(self):
-        """Test that YES price must be positive."""
-        with pytest.raises(ValueError, match="must be positive"):
-            TokenOpportunity(
-                token_id="token-trump",
-                outcome_name="Trump",
-                yes_price=Decimal("0"),
-                vwap_cost=Decimal("10.00"),
-                shares=Decimal("22.22"),
-            )
-
-    def test_validate_vwap_cost_positive(self):
-        """Test that VWAP cost must be positive."""
-        with pytest.raises(ValueError, match="must be positive"):
-            TokenOpportunity(
-                token_id="token-trump",
-                outcome_name="Trump",
-                yes_price=Decimal("0.45"),
-                vwap_cost=Decimal("0"),
-                shares=Decimal("22.22"),
-            )
-
-    def test_validate_shares_positive(self):
-        """Test that shares must be positive."""
-        with pytest.raises(ValueError, match="must be positive"):
-            TokenOpportunity(
-                token_id="token-trump",
-                outcome_name="Trump",
-                yes_price=Decimal("0.45"),
-                vwap_cost=Decimal("10.00"),
-                shares=Decimal("0"),
-            )
+        assert opportunity.yes_price == D_0_45
+
+    @pytest.mark.parametrize("field", ["yes_price", "vwap_cost", "shares"])
+    def test_validate_positive(self, field):
+        """Test that YES price, VWAP cost and shares must be positive."""
+        fields = {
+            "token_id": "token-trump",
+            "outcome_name": "Trump",
+            "yes_price": D_0_45,
+            "vwap_cost": D_10_00,
+            "shares": D_22_22,
+        }
+        fields[field] = D_0
+        with pytest.raises(ValueError, match=_MUST_POS):
+            TokenOpportunity(**fields)
+
+
+@pytest.fixture(scope="module")
+def sample_opportunities():
+    """Create sample token opportunities (shared; tests only read them)."""
+    return [
+        _make_opp(
+            token_id="token-trump",
+            outcome_name="Trump",
+            yes_price=D_0_45,
+            vwap_cost=D_10_00,
+            shares=D_22_22,
+        ),
+        _make_opp(
+            token_id="token-biden",
+            outcome_name="Biden",
+            yes_price=D_0_30,
+            vwap_cost=D_10_00,
+            shares=D_33_33,
+        ),
+        _make_opp(
+            token_id="token-harris",
+            outcome_name="Harris",
+            yes_price=D_0_15,
+            vwap_cost=D_10_00,
+            shares=D_66_67,
+        ),
+        _make_opp(
+            token_id="token-other",
+            outcome_name="Other",
+            yes_price=D_0_08,
+            vwap_cost=D_10_00,
+            shares=D_125_00,
+        ),
+    ]
 
 
 class TestNegRiskSignal:
     """Test suite for NegRiskSignal model."""
 
-    @pytest.fixture
-    def sample_opportunities(self):
-        """Create sample token opportunities."""
-        return [
-            TokenOpportunity(
-                token_id="token-trump",
-                outcome_name="Trump",
-                yes_price=Decimal("0.45"),
-                vwap_cost=Decimal("10.00"),
-                shares=Decimal("22.22"),
-            ),
-            TokenOpportunity(
-                token_id="token-biden",
-                outcome_name="Biden",
-                yes_price=Decimal("0.30"),
-                vwap_cost=Decimal("10.00"),
-                shares=Decimal("33.33"),
-            ),
-            TokenOpportunity(
-                token_id="token-harris",
-                outcome_name="Harris",
-                yes_price=Decimal("0.15"),
-                vwap_cost=Decimal("10.00"),
-                shares=Decimal("66.67"),
-            ),
-            TokenOpportunity(
-                token_id="token-other",
-                outcome_name="Other",
-                yes_price=Decimal("0.08"),
-                vwap_cost=Decimal("10.00"),
-                shares=Decimal("125.00"),
-            ),
-        ]
-
+    @pytest.mark.heavy
     def test_create_negrisk_signal_valid(self, sample_opportunities):
         """Test creating a valid NegRisk signal."""
-        signal = NegRiskSignal(
-            market_id="election-winner-2024",
-            market_title="2024 Presidential Election Winner",
-            opportunities=sample_opportunities,
-            total_cost=Decimal("38.40"),
-            total_payout=Decimal("40.00"),
-            estimated_profit=Decimal("1.60"),
-            profit_percentage=Decimal("0.0417"),
-            gas_cost=Decimal("0.10"),
-            fees=Decimal("0.50"),
-        )
+        signal = NegRiskSignal(**_NEGRISK_DEFAULTS, opportunities=sample_opportunities)
         assert signal.market_id == "election-winner-2024"
-        assert len(signal.opportunities) == 4
-        assert signal.estimated_profit == Decimal("1.60")
+        # Same instances in the same order (pydantic always rebuilds the list itself)
+        assert [id(o) for o in signal.opportunities] == [id(o) for o in sample_opportunities]
+        assert signal.estimated_profit == D_1_60
 
     def test_validate_at_least_two_opportunities(self):
         """Test that NegRisk requires at least 2 opportunities."""
         # Pydantic's built-in min_length validation runs first
-        with pytest.raises(Exception):  # Pydantic ValidationError
-            NegRiskSignal(
-                market_id="market-123",
-                market_title="Test Market",
-                opportunities=[
-                    TokenOpportunity(
-                        token_id="token-trump",
-                        outcome_name="Trump",
-                        yes_price=Decimal("0.45"),
-                        vwap_cost=Decimal("10.00"),
-                        shares=Decimal("22.22"),
-                    )
-                ],
-                total_cost=Decimal("10.00"),
-                total_payout=Decimal("10.00"),
-                estimated_profit=Decimal("0"),
-                profit_percentage=Decimal("0"),
-                gas_cost=Decimal("0"),
-                fees=Decimal("0"),
-            )
-
-    def test_validate_total_cost_non_negative(self, sample_opportunities):
-        """Test that total cost cannot be negative."""
-        with pytest.raises(ValueError, match="Costs cannot be negative"):
-            NegRiskSignal(
-                market_id="market-123",
-                market_title="Test Market",
-                opportunities=sample_opportunities,
-                total_cost=Decimal("-10.00"),
-                total_payout=Decimal("10.00"),
-                estimated_profit=Decimal("0"),
-                profit_percentage=Decimal("0"),
-                gas_cost=Decimal("0"),
-                fees=Decimal("0"),
-            )
-
-    def test_validate_gas_cost_non_negative(self, sample_opportunities):
-        """Test that gas cost cannot be negative."""
-        with pytest.raises(ValueError, match="Costs cannot be negative"):
-            NegRiskSignal(
-                market_id="market-123",
-                market_title="Test Market",
-                opportunities=sample_opportunities,
-                total_cost=Decimal("10.00"),
-                total_payout=Decimal("10.00"),
-                estimated_profit=Decimal("0"),
-                profit_percentage=Decimal("0"),
-                gas_cost=Decimal("-0.10"),
-                fees=Decimal("0"),
-            )
-
-    def test_validate_fees_non_negative(self, sample_opportunities):
-        """Test that fees cannot be negative."""
-        with pytest.raises(ValueError, match="Costs cannot be negative"):
-            NegRiskSignal(
-                market_id="market-123",
-                market_title="Test Market",
-                opportunities=sample_opportunities,
-                total_cost=Decimal("10.00"),
-                total_payout=Decimal("10.00"),
-                estimated_profit=Decimal("0"),
-                profit_percentage=Decimal("0"),
-                gas_cost=Decimal("0"),
-                fees=Decimal("-0.50"),
-            )
+        opportunity = TokenOpportunity(
+            token_id="token-trump",
+            outcome_name="Trump",
+            yes_price=D_0_45,
+            vwap_cost=D_10_00,
+            shares=D_22_22,
+        )
+        with pytest.raises(ValidationError, match=_AT_LEAST_TWO):
+            NegRiskSignal(**_NEGRISK_DEFAULTS, opportunities=[opportunity])
+
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("total_cost", D_NEG_10_00),
+            ("gas_cost", D_NEG_0_10),
+            ("fees", D_NEG_0_50),
+        ],
+    )
+    def test_validate_costs_non_negative(self, sample_opportunities, field, value):
+        """Test that total cost, gas cost and fees cannot be negative."""
+        fields = {**_NEGRISK_DEFAULTS, "opportunities": sample_opportunities, field: value}
+        with pytest.raises(ValueError, match=_COST_NEG):
+            NegRiskSignal(**fields)
 
     def test_negative_profit_allowed(self, sample_opportunities):
         """Test that negative profit is allowed (no opportunity)."""
@@ -379,28 +379,18 @@ class TestNegRiskSignal:
             market_id="market-123",
             market_title="Test Market",
             opportunities=sample_opportunities,
-            total_cost=Decimal("42.00"),
-            total_payout=Decimal("40.00"),
-            estimated_profit=Decimal("-2.00"),
-            profit_percentage=Decimal("-0.0476"),
-            gas_cost=Decimal("0.10"),
-            fees=Decimal("0.50"),
+            total_cost=D_42_00,
+            total_payout=D_40_00,
+            estimated_profit=D_NEG_2_00,
+            profit_percentage=D_NEG_0_0476,
+            gas_cost=D_0_10,
+            fees=D_0_50,
         )
-        assert signal.estimated_profit == Decimal("-2.00")
+        assert signal.estimated_profit == D_NEG_2_00
 
     def test_default_timestamp(self, sample_opportunities):
         """Test that timestamp is set by default."""
-        signal = NegRiskSignal(
-            market_id="market-123",
-            market_title="Test Market",
-            opportunities=sample_opportunities,
-            total_cost=Decimal("38.40"),
-            total_payout=Decimal("40.00"),
-            estimated_profit=Decimal("1.60"),
-            profit_percentage=Decimal("0.0417"),
-            gas_cost=Decimal("0.10"),
-            fees=Decimal("0.50"),
-        )
+        signal = NegRiskSignal(**_NEGRISK_DEFAULTS, opportunities=sample_opportunities)
         assert signal.timestamp is not None
         assert isinstance(signal.timestamp, datetime)
 
@@ -410,13 +400,13 @@ class TestNegRiskSignal:
             market_id="market-123",
             market_title="Test Market",
             opportunities=sample_opportunities,
-            total_cost=Decimal("0"),
-            total_payout=Decimal("0"),
-            estimated_profit=Decimal("0"),
-            profit_percentage=Decimal("0"),
-            gas_cost=Decimal("0"),
-            fees=Decimal("0"),
+            total_cost=D_0,
+            total_payout=D_0,
+            estimated_profit=D_0,
+            profit_percentage=D_0,
+            gas_cost=D_0,
+            fees=D_0,
         )
-        assert signal.total_cost == Decimal("0")
-        assert signal.gas_cost == Decimal("0")
-        assert signal.fees == Decimal("0")
+        assert signal.total_cost == D_0
+        assert signal.gas_cost == D_0
+        assert signal.fees == D_0
@@ -7,7 +7,8 @@ The implementation should make these tests pass.
 import pytest
 from decimal import Decimal
 from datetime import datetime
-from unittest.mock import Mock
+from types import MappingProxyType
+from unittest.mock import Mock, patch
 
 from src.core.models import (
     OrderBook,
@@ -48,9 +49,9 @@ class TestNegRiskStrategyInit:
 class TestCalculateTotalCost:
     """Test suite for VWAP calculation across multiple tokens."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def strategy(self):
-        """Create a strategy instance for testing."""
+        """Create a strategy instance shared by the module (do not mutate)."""
         return NegRiskStrategy(
             fee_rate=Decimal("0.0035"),
             min_profit_threshold=Decimal("0.005"),
@@ -191,7 +192,7 @@ class TestCalculateProfit:
         # Gas = 0.1
         # Profit = 4.0 - 3.80 - 0.0133 - 0.1 = 0.0867
         expected_profit = Decimal("4.0") - total_cost - (total_cost * strategy.fee_rate) - strategy.gas_estimate
-        assert abs(profit - expected_profit) < Decimal("0.0001")
+        assert profit == pytest.approx(expected_profit, abs=Decimal("0.0001"))
 
     def test_calculate_profit_unprofitable_opportunity(self, strategy):
         """Test profit calculation for unprofitable opportunity."""
@@ -217,7 +218,16 @@ class TestCalculateProfit:
         profit = strategy.calculate_profit(total_cost, num_tokens)
         # Profit = 4.0 - 3.80 = 0.20
         expected_profit = Decimal("4.0") - total_cost
-        assert abs(profit - expected_profit) < Decimal("0.0001")
+        assert profit == pytest.approx(expected_profit, abs=Decimal("0.0001"))
+
+    def test_calculate_profit_follows_fee_rate_changes(self, strategy):
+        """Test that updating fee_rate is reflected in profit."""
+        strategy.fee_rate = Decimal("0.01")
+
+        profit = strategy.calculate_profit(Decimal("3.80"), 4)
+
+        expected_profit = Decimal("4.0") - Decimal("3.80") * Decimal("1.01") - strategy.gas_estimate
+        assert profit == expected_profit
 
 
 class TestCheckThreshold:
@@ -271,12 +281,50 @@ class TestCheckThreshold:
         assert strategy.check_threshold(profit, total_investment) is False
 
 
+def _frozen_books(levels):
+    """Build read-only order books from (price, size) levels per token."""
+    return MappingProxyType({
+        token_id: OrderBook.from_asks(token_id, book, last_update=1234567890)
+        for token_id, book in levels.items()
+    })
+
+
+# Shared across tests: check_opportunity only reads the order books
+_PROFITABLE_4_TOKEN_BOOKS = _frozen_books({
+    "token-trump": [(0.40, 1000)],
+    "token-biden": [(0.25, 1000)],
+    "token-harris": [(0.15, 1000)],
+    "token-other": [(0.10, 1000)],
+})
+# Sum = 1.30 > 1.0, no arbitrage possible
+_OVERPRICED_4_TOKEN_BOOKS = _frozen_books({
+    "token-trump": [(0.60, 100)],
+    "token-biden": [(0.40, 100)],
+    "token-harris": [(0.20, 100)],
+    "token-other": [(0.10, 100)],
+})
+_EMPTY_4_TOKEN_BOOKS = _frozen_books({
+    "token-trump": [],
+    "token-biden": [],
+    "token-harris": [],
+    "token-other": [],
+})
+
+
+@pytest.fixture(scope="module")
+def mkbook():
+    """Factory for ask-only order books from (price, size) levels."""
+    def make(token_id, levels):
+        return OrderBook.from_asks(token_id, levels, last_update=1234567890)
+    return make
+
+
 class TestCheckOpportunity:
     """Test suite for checking NegRisk opportunities."""
 
     @pytest.fixture
     def strategy(self):
-        """Create a strategy instance for testing."""
+        """Create a fresh strategy per test (check_opportunity fills its signal cache)."""
         return NegRiskStrategy(
             fee_rate=Decimal("0.0035"),
             min_profit_threshold=Decimal("0.005"),
@@ -284,9 +332,9 @@ class TestCheckOpportunity:
             gas_estimate=Decimal("0.01"),  # Lower gas for tests
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def market_metadata(self):
-        """Create sample market metadata."""
+        """Create sample market metadata shared by the module (do not mutate)."""
         return MarketMetadata(
             market_id="election-winner-2024",
             title="2024 Presidential Election Winner",
@@ -301,44 +349,26 @@ class TestCheckOpportunity:
             is_binary=False,
         )
 
-    def test_profitable_opportunity_detected(self, strategy, market_metadata):
-        """Test that profitable opportunity is detected."""
-        order_books = {
-            "token-trump": OrderBook(
-                token_id="token-trump",
-                asks=[
-                    Ask(price=Decimal("0.40"), size=Decimal("1000"), token_id="token-trump"),
-                ],
-                bids=[],
-                last_update=1234567890,
-            ),
-            "token-biden": OrderBook(
-                token_id="token-biden",
-                asks=[
-                    Ask(price=Decimal("0.25"), size=Decimal("1000"), token_id="token-biden"),
-                ],
-                bids=[],
-                last_update=1234567890,
-            ),
-            "token-harris": OrderBook(
-                token_id="token-harris",
-                asks=[
-                    Ask(price=Decimal("0.15"), size=Decimal("1000"), token_id="token-harris"),
-                ],
-                bids=[],
-                last_update=1234567890,
-            ),
-            "token-other": OrderBook(
-                token_id="token-other",
-                asks=[
-                    Ask(price=Decimal("0.10"), size=Decimal("1000"), token_id="token-other"),
-                ],
-                bids=[],
-                last_update=1234567890,
-            ),
-        }
-
-        signal = strategy.check_opportunity(market_metadata, order_books)
+    @pytest.mark.parametrize(
+        "order_books, expect_signal",
+        [
+            pytest.param(_PROFITABLE_4_TOKEN_BOOKS, True, id="profitable"),
+            pytest.param(_OVERPRICED_4_TOKEN_BOOKS, False, id="sum-exceeds-one"),
+            pytest.param(_EMPTY_4_TOKEN_BOOKS, False, id="empty-orderbooks"),
+        ],
+    )
+    def test_check_opportunity(self, strategy, market_metadata, order_books, expect_signal):
+        """Test that only a profitable opportunity produces a signal."""
+        with patch(
+            "src.strategies.negrisk.TokenOpportunity", wraps=TokenOpportunity
+        ) as token_opportunity:
+            signal = strategy.check_opportunity(market_metadata, order_books)
+
+        if not expect_signal:
+            assert signal is None
+            # Rejected by the top-of-book prefilter before building opportunities
+            token_opportunity.assert_not_called()
+            return
 
         assert signal is not None
         assert isinstance(signal, NegRiskSignal)
@@ -347,122 +377,79 @@ class TestCheckOpportunity:
         assert signal.estimated_profit > 0
         assert signal.total_payout == Decimal("1.0")  # 1 share * $1 payout
 
-    def test_no_opportunity_when_sum_exceeds_one(self, strategy, market_metadata):
-        """Test no opportunity when sum of prices >= 1.0."""
+    def test_check_opportunity_caches_by_book_version(self, strategy, market_metadata):
+        """Test that unchanged order books reuse the previous result."""
         order_books = {
-            "token-trump": OrderBook(
-                token_id="token-trump",
-                asks=[
-                    Ask(price=Decimal("0.60"), size=Decimal("100"), token_id="token-trump"),
-                ],
+            token_id: OrderBook(
+                token_id=token_id,
+                asks=[Ask(price=Decimal("0.20"), size=Decimal("1000"), token_id=token_id)],
                 bids=[],
                 last_update=1234567890,
-            ),
-            "token-biden": OrderBook(
-                token_id="token-biden",
-                asks=[
-                    Ask(price=Decimal("0.40"), size=Decimal("100"), token_id="token-biden"),
-                ],
-                bids=[],
-                last_update=1234567890,
-            ),
-            "token-harris": OrderBook(
-                token_id="token-harris",
-                asks=[
-                    Ask(price=Decimal("0.20"), size=Decimal("100"), token_id="token-harris"),
-                ],
-                bids=[],
-                last_update=1234567890,
-            ),
-            "token-other": OrderBook(
-                token_id="token-other",
-                asks=[
-                    Ask(price=Decimal("0.10"), size=Decimal("100"), token_id="token-other"),
-                ],
-                bids=[],
-                last_update=1234567890,
-            ),
+            )
+            for token_id in market_metadata.outcome_token_ids
         }
 
-        # Sum = 1.30 > 1.0, no arbitrage possible
-        signal = strategy.check_opportunity(market_metadata, order_books)
-        assert signal is None
+        first = strategy.check_opportunity(market_metadata, order_books)
+        with patch.object(strategy, "_evaluate_opportunity") as evaluate:
+            second = strategy.check_opportunity(market_metadata, order_books)
+        assert first is not None
+        # Served from cache as a copy stamped with the time of this call
+        assert second is not first
+        assert second.model_dump(exclude={"timestamp"}) == first.model_dump(exclude={"timestamp"})
+        assert second.timestamp >= first.timestamp
+        evaluate.assert_not_called()
+
+        # A new book version is evaluated again
+        order_books["token-trump"].asks = [
+            Ask(price=Decimal("0.70"), size=Decimal("1000"), token_id="token-trump")
+        ]
+        order_books["token-trump"].last_update = 1234567891
+        assert strategy.check_opportunity(market_metadata, order_books) is None
 
-    def test_no_opportunity_with_insufficient_liquidity(self, strategy, market_metadata):
-        """Test no opportunity when some tokens have insufficient liquidity."""
+    def test_check_opportunity_reevaluates_same_millisecond_change(self, strategy, market_metadata):
+        """Test that an in-place change within one millisecond is not served from cache."""
         order_books = {
-            "token-trump": OrderBook(
-                token_id="token-trump",
-                asks=[
-                    Ask(price=Decimal("0.01"), size=Decimal("5"), token_id="token-trump"),
-                ],
-                bids=[],
-                last_update=1234567890,
-            ),
-            "token-biden": OrderBook(
-                token_id="token-biden",
-                asks=[
-                    Ask(price=Decimal("0.30"), size=Decimal("100"), token_id="token-biden"),
-                ],
-                bids=[],
-                last_update=1234567890,
-            ),
-            "token-harris": OrderBook(
-                token_id="token-harris",
-                asks=[
-                    Ask(price=Decimal("0.15"), size=Decimal("100"), token_id="token-harris"),
-                ],
-                bids=[],
-                last_update=1234567890,
-            ),
-            "token-other": OrderBook(
-                token_id="token-other",
-                asks=[
-                    Ask(price=Decimal("0.08"), size=Decimal("100"), token_id="token-other"),
-                ],
-                bids=[],
-                last_update=1234567890,
-            ),
+            token_id: OrderBook.from_asks(token_id, [(0.20, 1000)], last_update=1234567890)
+            for token_id in market_metadata.outcome_token_ids
         }
+        assert strategy.check_opportunity(market_metadata, order_books) is not None
 
-        # Trump has very low liquidity, should skip or return None
-        signal = strategy.check_opportunity(market_metadata, order_books)
-        # Depending on implementation, might return None or signal with partial liquidity
-        assert signal is None or not all(opp.vwap_cost == strategy.trade_size for opp in signal.opportunities)
+        # Same last_update, but the book changed and says so
+        book = order_books["token-trump"]
+        book.asks = [Ask(price=Decimal("0.70"), size=Decimal("1000"), token_id="token-trump")]
+        book.mark_changed()
+        assert strategy.check_opportunity(market_metadata, order_books) is None
 
-    def test_no_opportunity_with_empty_orderbooks(self, strategy, market_metadata):
-        """Test no opportunity when order books are empty."""
+    def test_check_opportunity_reevaluates_after_parameter_change(self, strategy, market_metadata):
+        """Test that changing fee_rate or the threshold bypasses cached results."""
         order_books = {
-            "token-trump": OrderBook(
-                token_id="token-trump",
-                asks=[],
-                bids=[],
-                last_update=1234567890,
-            ),
-            "token-biden": OrderBook(
-                token_id="token-biden",
-                asks=[],
-                bids=[],
-                last_update=1234567890,
-            ),
-            "token-harris": OrderBook(
-                token_id="token-harris",
-                asks=[],
-                bids=[],
-                last_update=1234567890,
-            ),
-            "token-other": OrderBook(
-                token_id="token-other",
-                asks=[],
-                bids=[],
-                last_update=1234567890,
-            ),
+            token_id: OrderBook.from_asks(token_id, [(0.24, 1000)], last_update=1234567890)
+            for token_id in market_metadata.outcome_token_ids
         }
+        assert strategy.check_opportunity(market_metadata, order_books) is not None
 
+        strategy.fee_rate = Decimal("0.05")
+        assert strategy.check_opportunity(market_metadata, order_books) is None
+
+        strategy.fee_rate = Decimal("0.0035")
+        strategy.min_profit_threshold = Decimal("0.5")
+        assert strategy.check_opportunity(market_metadata, order_books) is None
+
+    def test_no_opportunity_with_insufficient_liquidity(self, strategy, market_metadata, mkbook):
+        """Test no opportunity when some tokens have insufficient liquidity."""
+        order_books = {
+            "token-trump": mkbook("token-trump", [(0.01, 5)]),
+            "token-biden": mkbook("token-biden", [(0.30, 100)]),
+            "token-harris": mkbook("token-harris", [(0.15, 100)]),
+            "token-other": mkbook("token-other", [(0.08, 100)]),
+        }
+
+        # Trump has very low liquidity, should skip or return None
         signal = strategy.check_opportunity(market_metadata, order_books)
-        assert signal is None
+        # Depending on implementation, might return None or signal with partial liquidity
+        assert signal is None or not all(opp.vwap_cost == strategy.trade_size for opp in signal.opportunities)
 
-    def test_no_opportunity_for_binary_market(self, strategy):
+    def test_no_opportunity_for_binary_market(self, strategy, mkbook):
         """Test that binary markets are skipped."""
         binary_metadata = MarketMetadata(
             market_id="will-trump-win",
@@ -477,64 +464,37 @@ class TestCheckOpportunity:
         )
 
         order_books = {
-            "yes-123": OrderBook(
-                token_id="yes-123",
-                asks=[
-                    Ask(price=Decimal("0.48"), size=Decimal("100"), token_id="yes-123"),
-                ],
-                bids=[],
-                last_update=1234567890,
-            ),
-            "no-123": OrderBook(
-                token_id="no-123",
-                asks=[
-                    Ask(price=Decimal("0.48"), size=Decimal("100"), token_id="no-123"),
-                ],
-                bids=[],
-                last_update=1234567890,
-            ),
+            "yes-123": mkbook("yes-123", [(0.48, 100)]),
+            "no-123": mkbook("no-123", [(0.48, 100)]),
         }
 
         signal = strategy.check_opportunity(binary_metadata, order_books)
         # Binary markets should use atomic strategy instead
         assert signal is None
 
+        # Rejected before the order books are looked at
+        untouched_books = Mock(spec=dict)
+        assert strategy.check_opportunity(binary_metadata, untouched_books) is None
+        assert untouched_books.mock_calls == []
+
+    def test_no_opportunity_for_single_outcome_market(self, strategy):
+        """Test that markets with fewer than two outcomes are skipped."""
+        single_metadata = MarketMetadata(
+            market_id="malformed",
+            title="Malformed Market",
+            question="Only one outcome?",
+            outcomes=[Outcome(name="Only", token_id="only-123", is_yes=True)],
+            outcome_token_ids=["only-123"],
+            is_binary=False,
+        )
+
+        untouched_books = Mock(spec=dict)
+        assert strategy.check_opportunity(single_metadata, untouched_books) is None
+        assert untouched_books.mock_calls == []
+
     def test_signal_includes_all_required_fields(self, strategy, market_metadata):
         """Test that signal includes all required fields."""
-        order_books = {
-            "token-trump": OrderBook(
-                token_id="token-trump",
-                asks=[
-                    Ask(price=Decimal("0.40"), size=Decimal("1000"), token_id="token-trump"),
-                ],
-                bids=[],
-                last_update=1234567890,
-            ),
-            "token-biden": OrderBook(
-                token_id="token-biden",
-                asks=[
-                    Ask(price=Decimal("0.25"), size=Decimal("1000"), token_id="token-biden"),
-                ],
-                bids=[],
-                last_update=1234567890,
-            ),
-            "token-harris": OrderBook(
-                token_id="token-harris",
-                asks=[
-                    Ask(price=Decimal("0.15"), size=Decimal("1000"), token_id="token-harris"),
-                ],
-                bids=[],
-                last_update=1234567890,
-            ),
-            "token-other": OrderBook(
-                token_id="token-other",
-                asks=[
-                    Ask(price=Decimal("0.10"), size=Decimal("1000"), token_id="token-other"),
-                ],
-                bids=[],
-                last_update=1234567890,
-            ),
-        }
+        order_books = _PROFITABLE_4_TOKEN_BOOKS
 
         signal = strategy.check_opportunity(market_metadata, order_books)
 
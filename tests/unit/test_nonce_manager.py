@@ -8,7 +8,7 @@ import asyncio
 from unittest.mock import Mock, AsyncMock
 from datetime import datetime
 
-from src.execution.nonce_manager import NonceManager, NonceStatus
+from src.execution.nonce_manager import ConfirmedNonces, NonceManager, NonceStatus
 from src.connectors.web3_client import Web3Client
 
 
@@ -38,6 +38,28 @@ class TestNonceStatus:
         assert status.confirmed is True
 
 
+class TestConfirmedNonces:
+    """Test suite for ConfirmedNonces."""
+
+    def test_membership_and_count(self):
+        """Test that out-of-order nonces are absorbed into the run."""
+        confirmed = ConfirmedNonces()
+        for nonce in (10, 11, 13, 9, 12, 20):
+            confirmed.add(nonce)
+        confirmed.add(11)  # Idempotent
+
+        assert len(confirmed) == 6
+        assert all(nonce in confirmed for nonce in (9, 10, 11, 12, 13, 20))
+        assert 14 not in confirmed
+        assert 8 not in confirmed
+        assert confirmed == {9, 10, 11, 12, 13, 20}
+        assert confirmed._gaps == {20}
+
+    def test_empty_equals_empty_set(self):
+        """Test that an empty instance compares equal to set()."""
+        assert ConfirmedNonces() == set()
+
+
 class TestNonceManagerInit:
     """Test suite for NonceManager initialization."""
 
@@ -157,6 +179,20 @@ class TestNonceManagerAllocateNonce:
         assert initialized_manager._next_nonce == 21
         assert nonce in initialized_manager._pending_nonces
 
+    def test_sync_variants_match_async(self, initialized_manager):
+        """Test that the synchronous variants allocate and release nonces."""
+        nonce = initialized_manager.get_nonce_sync()
+        assert nonce == 20
+        assert initialized_manager.is_pending(nonce)
+
+        initialized_manager.mark_failed_sync(nonce)
+        assert not initialized_manager.is_pending(nonce)
+        assert initialized_manager._next_nonce == 20
+
+        nonce = initialized_manager.get_nonce_sync()
+        initialized_manager.mark_confirmed_sync(nonce)
+        assert nonce in initialized_manager._confirmed_nonces
+
 
 class TestNonceManagerMarkConfirmed:
     """Test suite for mark_confirmed method."""
@@ -194,6 +230,14 @@ class TestNonceManagerMarkConfirmed:
         assert 30 not in manager_with_pending._pending_nonces
         assert 30 in manager_with_pending._confirmed_nonces
 
+    @pytest.mark.asyncio
+    async def test_mark_confirmed_batch(self, manager_with_pending):
+        """Test that mark_confirmed_batch confirms every nonce at once."""
+        await manager_with_pending.mark_confirmed_batch([30, 31])
+
+        assert manager_with_pending.get_pending_count() == 0
+        assert manager_with_pending._confirmed_nonces == {30, 31}
+
 
 class TestNonceManagerMarkFailed:
     """Test suite for mark_failed method."""
@@ -241,6 +285,18 @@ class TestNonceManagerMarkFailed:
         # Should reuse the lower nonce
         assert manager_with_pending._next_nonce == 35
 
+    @pytest.mark.asyncio
+    async def test_mark_failed_does_not_reissue_pending(self, manager_with_pending):
+        """Test that reusing a failed nonce skips nonces still pending."""
+        manager_with_pending._next_nonce = 37  # 35 and 36 are in flight
+
+        await manager_with_pending.mark_failed(35)
+        await manager_with_pending.mark_failed(35)  # Reported twice
+
+        assert await manager_with_pending.get_nonce() == 35
+        assert await manager_with_pending.get_nonce() == 37
+        assert manager_with_pending._next_nonce == 38
+
 
 class TestNonceManagerIsPending:
     """Test suite for is_pending method."""
@@ -316,6 +372,27 @@ class TestNonceManagerGetStats:
         assert stats["confirmed_count"] == 3
         assert set(stats["pending_nonces"]) == {48, 49}
 
+    @pytest.mark.asyncio
+    async def test_get_stats_refreshes_after_changes(self):
+        """Test that get_stats is reused until nonce state changes."""
+        web3_client = Mock(spec=Web3Client)
+        manager = NonceManager(
+            web3_client=web3_client,
+            address="0x1234567890123456789012345678901234567890"
+        )
+        manager._next_nonce = 50
+
+        stats = manager.get_stats()
+        assert manager.get_stats() is stats
+
+        nonce = await manager.get_nonce()
+        assert manager.get_stats()["pending_nonces"] == [nonce]
+
+        await manager.mark_confirmed(nonce)
+        stats = manager.get_stats()
+        assert stats["pending_count"] == 0
+        assert stats["confirmed_count"] == 1
+
 
 class TestNonceManagerConcurrency:
     """Test suite for concurrent nonce allocation."""
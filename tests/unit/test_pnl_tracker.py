@@ -142,6 +142,18 @@ class TestPnLTracker:
         assert tracker._cumulative_expected_edge == expected_edge
         assert tracker._cumulative_simulated_pnl > Decimal("0")
 
+    def test_process_fills_sync(self, tracker, arbitrage_fills):
+        """Test that the synchronous variant updates PnL like process_fills."""
+        pnl_update = tracker.process_fills_sync(
+            fills=arbitrage_fills,
+            expected_edge=Decimal("5.0"),
+            trace_id="trace_sync",
+        )
+
+        assert pnl_update.trace_id == "trace_sync"
+        assert pnl_update.strategy == "atomic"
+        assert tracker._cumulative_simulated_pnl == pnl_update.simulated_pnl
+
     @pytest.mark.asyncio
     async def test_process_fills_empty(self, tracker):
         """Test processing empty fills list."""
@@ -253,6 +265,17 @@ class TestPnLTracker:
         assert summary["cumulative_simulated_pnl"] == "0"
         assert summary["cumulative_realized_pnl"] == "0"
 
+    def test_get_summary_refreshes_after_fills(self, tracker, arbitrage_fills):
+        """Test that get_summary is reused until fills are processed."""
+        summary = tracker.get_summary()
+        assert tracker.get_summary() is summary
+
+        tracker.process_fills_sync(arbitrage_fills, Decimal("5.0"), "trace_summary")
+
+        summary = tracker.get_summary()
+        assert summary["total_pnl_updates"] == 1
+        assert summary["cumulative_expected_edge"] == "5.0"
+
     @pytest.mark.asyncio
     async def test_position_tracking(self, tracker, arbitrage_fills):
         """Test that positions are tracked correctly."""
@@ -56,10 +56,13 @@ class TestConnect:
             mock_ws.close = AsyncMock()
             return mock_ws
 
-        with patch("src.connectors.polymarket_ws.websockets.connect", side_effect=mock_connect_coro):
+        with patch(
+            "src.connectors.polymarket_ws.websockets.connect", side_effect=mock_connect_coro
+        ) as mock_connect:
             await client.connect()
 
             assert client.connected is True
+            assert mock_connect.call_args.kwargs["compression"] is None
 
     @pytest.mark.asyncio
     async def test_connect_with_reconnect_on_failure(self):
@@ -135,6 +138,24 @@ class TestSubscribe:
 
         assert client._ws.send.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_subscribe_batches_tokens_into_one_frame(self):
+        """Test that several tokens are subscribed with a single send."""
+        client = PolymarketWSClient()
+
+        client._ws = AsyncMock()
+        client._ws.send = AsyncMock()
+        client.connected = True
+
+        await client.subscribe("token_1", "token_2")
+        await client.subscribe_many(["token_3"])
+
+        assert client._ws.send.call_count == 2
+        import json
+        message = json.loads(client._ws.send.call_args_list[0][0][0])
+        assert message["tokens"] == ["token_1", "token_2"]
+        assert client._subscriptions == {"token_1", "token_2", "token_3"}
+
     @pytest.mark.asyncio
     async def test_subscribe_when_not_connected(self):
         """Test subscribing when not connected raises error."""
@@ -176,6 +197,35 @@ class TestMessageHandling:
         assert orderbook.bids[0].price == Decimal("0.50")
         assert orderbook.asks[0].price == Decimal("0.51")
 
+    @pytest.mark.asyncio
+    async def test_repeated_snapshot_replaces_book_in_place(self):
+        """Test that a second snapshot refills the existing order book."""
+        client = PolymarketWSClient()
+
+        await client._handle_message({
+            "type": "snapshot",
+            "token_id": "token_123",
+            "bids": [{"price": "0.50", "size": "100", "token_id": "token_123"}],
+            "asks": [{"price": "0.51", "size": "100", "token_id": "token_123"}],
+        })
+        orderbook = client.orderbooks["token_123"]
+
+        await client._handle_message({
+            "type": "snapshot",
+            "token_id": "token_123",
+            "sequence_number": 2,
+            "bids": [
+                {"price": "0.46", "size": "10", "token_id": "token_123"},
+                {"price": "0.48", "size": "20", "token_id": "token_123"},
+            ],
+            "asks": [],
+        })
+
+        assert client.orderbooks["token_123"] is orderbook
+        assert orderbook.version == 1
+        assert [b.price for b in orderbook.bids] == [Decimal("0.48"), Decimal("0.46")]
+        assert orderbook.asks == []
+
     @pytest.mark.asyncio
     async def test_handle_order_book_update(self):
         """Test handling order book update message."""
@@ -205,6 +255,35 @@ class TestMessageHandling:
         # Highest bid should be 0.51
         assert orderbook.get_best_bid().price == Decimal("0.51")
 
+    @pytest.mark.asyncio
+    async def test_handle_order_book_update_removes_zero_size(self):
+        """Test that a zero-size update removes the price level."""
+        client = PolymarketWSClient()
+
+        snapshot_msg = {
+            "type": "snapshot",
+            "token_id": "token_123",
+            "bids": [
+                {"price": "0.50", "size": "100", "token_id": "token_123"},
+                {"price": "0.49", "size": "200", "token_id": "token_123"},
+            ],
+            "asks": [{"price": "0.51", "size": "100", "token_id": "token_123"}],
+        }
+        await client._handle_message(snapshot_msg)
+
+        update_msg = {
+            "type": "update",
+            "token_id": "token_123",
+            "bids": [{"price": "0.50", "size": "0", "token_id": "token_123"}],
+            "asks": [{"price": "0.52", "size": "30", "token_id": "token_123"}],
+        }
+        await client._handle_message(update_msg)
+
+        orderbook = client.orderbooks["token_123"]
+        assert [b.price for b in orderbook.bids] == [Decimal("0.49")]
+        assert orderbook.version == 1
+        assert [a.price for a in orderbook.asks] == [Decimal("0.51"), Decimal("0.52")]
+
     @pytest.mark.asyncio
     async def test_handle_unknown_message_type(self):
         """Test handling unknown message type is ignored."""
@@ -300,6 +379,17 @@ class TestReconnectLogic:
             # The delay should increase between attempts
             assert mock_connect.call_count == client.max_reconnect_attempts
 
+    @pytest.mark.asyncio
+    async def test_backoff_delays_double_and_cap(self):
+        """Test that the reconnect delay table doubles up to the 30s cap."""
+        client = PolymarketWSClient(max_reconnect_attempts=7, reconnect_delay=1.0)
+        assert client._backoff_delays == (1.0, 2.0, 4.0, 8.0, 16.0, 30, 30)
+
+        fixed = PolymarketWSClient(
+            max_reconnect_attempts=3, reconnect_delay=0.5, use_exponential_backoff=False
+        )
+        assert fixed._backoff_delays == (0.5, 0.5, 0.5)
+
     @pytest.mark.asyncio
     async def test_listen_reconnects_on_disconnect(self):
         """Test that listen loop reconnects on disconnect."""
@@ -328,6 +418,48 @@ class TestReconnectLogic:
             except asyncio.CancelledError:
                 pass
 
+    @pytest.mark.asyncio
+    async def test_listen_processes_frames_in_order(self):
+        """Test that frames read by listen are applied in arrival order."""
+        import json
+        client = PolymarketWSClient(message_queue_size=1)
+        client.connected = True
+
+        frames = [
+            json.dumps({
+                "type": "snapshot",
+                "token_id": "token_123",
+                "bids": [{"price": "0.50", "size": "100", "token_id": "token_123"}],
+                "asks": [],
+            }),
+            "",
+            json.dumps({
+                "type": "update",
+                "token_id": "token_123",
+                "sequence_number": 1,
+                "bids": [{"price": "0.52", "size": "10", "token_id": "token_123"}],
+            }),
+        ]
+
+        async def recv():
+            if frames:
+                return frames.pop(0)
+            await asyncio.Event().wait()  # Idle connection
+
+        client._ws = AsyncMock()
+        client._ws.recv = recv
+
+        task = asyncio.create_task(client.listen())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+        orderbook = client.orderbooks["token_123"]
+        assert [b.price for b in orderbook.bids] == [Decimal("0.52"), Decimal("0.50")]
+
 
 class TestMessageCache:
     """Test suite for MessageCache."""
@@ -589,8 +721,11 @@ class TestResubscription:
         with patch("src.connectors.polymarket_ws.websockets.connect", side_effect=mock_connect):
             await client.connect()
 
-            # Should have resubscribed to previous subscriptions
-            assert client._ws.send.call_count >= 2
+            # Should have resubscribed to previous subscriptions in one frame
+            client._ws.send.assert_called_once()
+            import json
+            message = json.loads(client._ws.send.call_args[0][0])
+            assert sorted(message["tokens"]) == ["token_1", "token_2"]
 
 
 class TestContextManager: